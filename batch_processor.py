@@ -672,6 +672,9 @@ class ProcessingPriority:
 
 # 사용 예시
 if __name__ == "__main__":
+    from utils import setup_console_logging
+    setup_console_logging()
+    
     # 테스트용 파일 목록
     test_files = {
         'file1': {'path': 'sample1.pdf', 'status': 'waiting'},
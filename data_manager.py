@@ -15,6 +15,8 @@ import json
 from collections import defaultdict, Counter
 import statistics
 
+from utils import dumps_json, real_fonts
+
 class DataManager:
     """PDF 처리 데이터 관리 클래스"""
     
@@ -141,7 +143,7 @@ class DataManager:
             # 기본 정보 추출
             basic_info = analysis_result.get('basic_info', {})
             colors = analysis_result.get('colors', {})
-            fonts = analysis_result.get('fonts', {})
+            fonts = real_fonts(analysis_result.get('fonts', {}))
             images = analysis_result.get('images', {})
             ink = analysis_result.get('ink_coverage', {}).get('summary', {})
             preflight = analysis_result.get('preflight_result', {})
@@ -197,7 +199,7 @@ class DataManager:
                 preflight.get('overall_status'),
                 auto_fix_applied,
                 auto_fix_types,
-                json.dumps(analysis_result, ensure_ascii=False)
+                dumps_json(analysis_result)
             ))
             
             history_id = cursor.lastrowid
@@ -214,8 +216,8 @@ class DataManager:
                     issue.get('type'),
                     issue.get('severity'),
                     issue.get('message'),
-                    json.dumps(issue.get('affected_pages', [])),
-                    json.dumps({
+                    dumps_json(issue.get('affected_pages', [])),
+                    dumps_json({
                         k: v for k, v in issue.items() 
                         if k not in ['type', 'severity', 'message', 'affected_pages']
                     })
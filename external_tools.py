@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import shutil
 import platform
+import glob
+import threading
 
 
 class ExternalPDFChecker:
@@ -199,6 +201,9 @@ class ExternalPDFChecker:
         """
         Ghostscript tiffsep 디바이스를 사용한 오버프린트 검사
         
+        한 번만 검사할 때 쓰는 간편 함수로, 내부적으로 GhostscriptSession을 사용합니다.
+        여러 진단을 함께 볼 때는 GhostscriptSession을 직접 만들어 공유하세요.
+        
         Args:
             pdf_path: PDF 파일 경로
             page_num: 검사할 페이지 번호 (기본값: 1)
@@ -212,112 +217,29 @@ class ExternalPDFChecker:
                 'error': str (있는 경우)
             }
         """
-        result = {
-            'success': False,
-            'has_overprint': False,
-            'overprint_areas': [],
-            'separations': {},
-            'error': None
-        }
-        
-        if not self.gs_path:
-            result['error'] = "Ghostscript가 설치되어 있지 않습니다."
-            return result
-        
-        try:
-            # 출력 파일 경로
-            output_base = os.path.join(self.temp_dir, f"page_{page_num}")
-            
-            # Ghostscript 명령어 구성
-            cmd = [
-                self.gs_path,
-                "-dNOPAUSE",
-                "-dBATCH",
-                "-dSAFER",
-                "-sDEVICE=tiffsep",
-                "-r72",  # 낮은 해상도로 빠른 검사
-                f"-dFirstPage={page_num}",
-                f"-dLastPage={page_num}",
-                f"-sOutputFile={output_base}%d.tif",
-                "-dOverprint=/simulate",  # 오버프린트 시뮬레이션
-                str(pdf_path)
-            ]
-            
-            # Ghostscript 실행
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.temp_dir
-            )
-            
-            if process.returncode != 0:
-                # Ghostscript 경고는 무시하고 파일 생성 여부로 판단
-                pass
-            
-            # 생성된 분리 파일들 확인
-            import glob
-            sep_files = glob.glob(os.path.join(self.temp_dir, f"page_{page_num}*.tif"))
-            
-            if not sep_files:
-                result['error'] = "색상 분리 파일이 생성되지 않았습니다"
-                return result
-            
-            # 분리된 색상 채널 분석
-            separations = {}
-            for sep_file in sep_files:
-                filename = os.path.basename(sep_file)
-                
-                # 색상 채널 이름 추출
-                if '.Cyan.' in filename:
-                    channel = 'Cyan'
-                elif '.Magenta.' in filename:
-                    channel = 'Magenta'
-                elif '.Yellow.' in filename:
-                    channel = 'Yellow'
-                elif '.Black.' in filename:
-                    channel = 'Black'
-                elif '(s)' in filename:
-                    # 별색 채널
-                    match = re.search(r'\.(.+?)\(s\)\.', filename)
-                    if match:
-                        channel = f"Spot-{match.group(1)}"
-                    else:
-                        continue
-                else:
-                    continue
-                
-                separations[channel] = sep_file
-            
-            result['separations'] = separations
-            
-            # 오버프린트 검사 로직
-            # 실제로는 각 분리 이미지를 분석하여 오버프린트 영역을 찾아야 함
-            # 여기서는 간단히 분리 파일의 존재와 크기로 판단
-            
-            if len(separations) > 4:  # CMYK 이상의 채널이 있으면 별색 사용
-                result['has_overprint'] = True
-                result['overprint_areas'].append({
-                    'type': 'spot_color_overprint',
-                    'channels': list(separations.keys())
-                })
-            
-            # 각 채널의 파일 크기를 비교하여 오버프린트 가능성 판단
-            # (실제 구현에서는 이미지 분석 라이브러리를 사용해야 함)
-            
-            result['success'] = True
-            
-        except Exception as e:
-            result['error'] = f"Ghostscript 검사 중 오류: {str(e)}"
-        finally:
-            # 임시 파일 정리
-            for file in glob.glob(os.path.join(self.temp_dir, "*.tif")):
-                try:
-                    os.remove(file)
-                except:
-                    pass
+        return GhostscriptSession(pdf_path, page_num=page_num, checker=self).overprint()
+    
+    def _separation_channel(self, filename: str) -> Optional[str]:
+        """
+        tiffsep 출력 파일 이름에서 색상 채널 이름 추출
         
-        return result
+        Returns:
+            str: 'Cyan' 등 원색 이름 또는 'Spot-<이름>' (채널 파일이 아니면 None)
+        """
+        if '.Cyan.' in filename:
+            return 'Cyan'
+        if '.Magenta.' in filename:
+            return 'Magenta'
+        if '.Yellow.' in filename:
+            return 'Yellow'
+        if '.Black.' in filename:
+            return 'Black'
+        if '(s)' in filename:
+            # 별색 채널
+            match = re.search(r'\.(.+?)\(s\)\.', filename)
+            if match:
+                return f"Spot-{match.group(1)}"
+        return None
     
     def get_installation_guide(self) -> str:
         """외부 도구 설치 가이드"""
@@ -368,6 +290,176 @@ gs -v
         return guide
 
 
+class GhostscriptSession:
+    """
+    PDF 하나에 대한 Ghostscript 진단 세션
+    
+    Ghostscript는 실행할 때마다 시작과 색상 관리 초기화 비용이 커서,
+    tiffsep 분리 렌더링을 한 번만 실행하고 그 결과로 오버프린트 검사와
+    색상 사용 정보(color_strategy_hints)를 함께 만듭니다.
+    결과는 세션에 저장되므로 여러 검사가 같은 세션을 공유하면 Ghostscript는 한 번만 실행됩니다.
+    
+    여러 페이지를 지정하면 -sPageList로 해당 페이지만 한 번에 렌더링하므로
+    실행 시간이 문서 전체가 아닌 표본 페이지 수에 비례합니다.
+    """
+    
+    def __init__(self, pdf_path, page_num: int = 1, checker: Optional[ExternalPDFChecker] = None,
+                 pages: Optional[List[int]] = None):
+        """
+        Args:
+            pdf_path: PDF 파일 경로
+            page_num: 검사할 페이지 번호 (기본값: 1, pages가 없을 때 사용)
+            checker: Ghostscript 경로/임시 폴더를 가진 검사기 (없으면 새로 만듦)
+            pages: 검사할 페이지 번호 목록 (1부터 시작)
+        """
+        self.pdf_path = str(pdf_path)
+        self.pages = sorted(set(pages)) if pages else [page_num]
+        self.checker = checker or ExternalPDFChecker()
+        self._result = None
+        self._lock = threading.Lock()  # 여러 스레드가 동시에 요청해도 한 번만 실행
+    
+    def run(self) -> Dict:
+        """
+        Ghostscript를 (처음 한 번만) 실행하고 전체 진단 결과 반환
+        
+        Returns:
+            dict: {
+                'success': bool,
+                'error': str 또는 None,
+                'separations': dict,          # 채널 이름 → 분리 파일 (전체 표본 페이지)
+                'overprint': dict,            # has_overprint, overprint_areas (전체 표본 페이지)
+                'pages': dict,                # 페이지 번호 → separations/has_overprint/overprint_areas
+                'color_strategy_hints': dict  # 원색/별색 채널 사용 정보
+            }
+        """
+        with self._lock:
+            if self._result is None:
+                self._result = self._run_ghostscript()
+            return self._result
+    
+    def overprint(self) -> Dict:
+        """check_overprint_with_ghostscript()와 같은 형식의 오버프린트 결과"""
+        result = self.run()
+        return {
+            'success': result['success'],
+            'has_overprint': result['overprint']['has_overprint'],
+            'overprint_areas': result['overprint']['overprint_areas'],
+            'separations': result['separations'],
+            'error': result['error']
+        }
+    
+    def _run_ghostscript(self) -> Dict:
+        """tiffsep 한 번 실행 후 모든 진단 결과 구성"""
+        result = {
+            'success': False,
+            'error': None,
+            'separations': {},
+            'overprint': {
+                'has_overprint': False,
+                'overprint_areas': []
+            },
+            'pages': {},
+            'color_strategy_hints': {
+                'process_channels': [],
+                'spot_channels': [],
+                'needs_spot_plates': False
+            }
+        }
+        
+        gs_path = self.checker.gs_path
+        if not gs_path:
+            result['error'] = "Ghostscript가 설치되어 있지 않습니다."
+            return result
+        
+        temp_dir = self.checker.temp_dir
+        output_base = os.path.join(temp_dir, "sep_")
+        
+        # 렌더링할 페이지 지정 - 한 페이지는 기존 방식, 여러 페이지는 PageList로 한 번에
+        if len(self.pages) == 1:
+            page_args = [f"-dFirstPage={self.pages[0]}", f"-dLastPage={self.pages[0]}"]
+        else:
+            page_args = ["-sPageList=" + ",".join(str(p) for p in self.pages)]
+        
+        try:
+            # Ghostscript 명령어 구성
+            cmd = [
+                gs_path,
+                "-dNEWPDF=false",  # 이 용도에는 기존 PDF 인터프리터가 더 빠름
+                "-dNOPAUSE",
+                "-dBATCH",
+                "-dSAFER",
+                "-sDEVICE=tiffsep",
+                "-r72",  # 낮은 해상도로 빠른 검사
+                *page_args,
+                f"-sOutputFile={output_base}%d.tif",  # %d는 출력 순번 (1부터)
+                "-dOverprint=/simulate",  # 오버프린트 시뮬레이션
+                self.pdf_path
+            ]
+            
+            # Ghostscript 실행 (경고로 종료 코드가 0이 아닐 수 있으므로 파일 생성 여부로 판단)
+            subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir)
+            
+            # 생성된 분리 파일들 확인
+            sep_files = sorted(glob.glob(f"{output_base}*.tif"))
+            if not sep_files:
+                result['error'] = "색상 분리 파일이 생성되지 않았습니다"
+                return result
+            
+            # 분리된 색상 채널 분석 (출력 순번 → 실제 페이지 번호)
+            separations = {}
+            page_separations = {}
+            for sep_file in sep_files:
+                filename = os.path.basename(sep_file)
+                channel = self.checker._separation_channel(filename)
+                index = re.match(r'sep_(\d+)', filename)
+                if not channel or not index or not 1 <= int(index.group(1)) <= len(self.pages):
+                    continue
+                page = self.pages[int(index.group(1)) - 1]
+                page_separations.setdefault(page, {})[channel] = sep_file
+                separations[channel] = sep_file
+            result['separations'] = separations
+            
+            # 오버프린트 검사 로직
+            # 실제로는 각 분리 이미지를 분석하여 오버프린트 영역을 찾아야 함
+            # 여기서는 간단히 분리 파일의 존재로 판단
+            for page in sorted(page_separations):
+                channels = page_separations[page]
+                page_info = {
+                    'separations': channels,
+                    'has_overprint': False,
+                    'overprint_areas': []
+                }
+                if len(channels) > 4:  # CMYK 이상의 채널이 있으면 별색 사용
+                    page_info['has_overprint'] = True
+                    page_info['overprint_areas'].append({
+                        'type': 'spot_color_overprint',
+                        'channels': list(channels.keys())
+                    })
+                    result['overprint']['has_overprint'] = True
+                    result['overprint']['overprint_areas'].extend(page_info['overprint_areas'])
+                result['pages'][page] = page_info
+            
+            # 같은 분리 결과로 색상 사용 정보 구성
+            hints = result['color_strategy_hints']
+            hints['process_channels'] = [c for c in separations if not c.startswith('Spot-')]
+            hints['spot_channels'] = [c[len('Spot-'):] for c in separations if c.startswith('Spot-')]
+            hints['needs_spot_plates'] = bool(hints['spot_channels'])
+            
+            result['success'] = True
+            
+        except Exception as e:
+            result['error'] = f"Ghostscript 검사 중 오류: {str(e)}"
+        finally:
+            # 임시 파일 정리
+            for file in glob.glob(f"{output_base}*.tif"):
+                try:
+                    os.remove(file)
+                except OSError:
+                    pass
+        
+        return result
+
+
 # 기존 시스템과의 통합을 위한 어댑터 함수들
 
 def check_fonts_external(pdf_path: str) -> Dict:
@@ -408,18 +500,23 @@ def check_fonts_external(pdf_path: str) -> Dict:
     return fonts_info
 
 
-def check_overprint_external(pdf_path: str, check_all_pages: bool = False) -> Dict:
+def check_overprint_external(pdf_path: str, check_all_pages: bool = False,
+                             session: Optional[GhostscriptSession] = None,
+                             pages: Optional[List[int]] = None) -> Dict:
     """
     print_quality_checker.py의 check_overprint 메서드를 대체할 함수
     
     Args:
         pdf_path: PDF 파일 경로
         check_all_pages: 모든 페이지 검사 여부
+        session: 공유할 GhostscriptSession (없으면 새로 만들어 실행)
+        pages: 검사할 표본 페이지 번호 목록 (없으면 첫 페이지만, session을 넘기면 무시)
         
     Returns:
         기존 형식과 호환되는 딕셔너리
     """
-    checker = ExternalPDFChecker()
+    if session is None:
+        session = GhostscriptSession(pdf_path, pages=pages)
     
     overprint_info = {
         'has_overprint': False,
@@ -432,23 +529,34 @@ def check_overprint_external(pdf_path: str, check_all_pages: bool = False) -> Di
         'image_overprint_pages': []
     }
     
-    # 첫 페이지만 검사 (성능을 위해)
+    # 표본 페이지만 검사 (성능을 위해, 기본은 첫 페이지)
     # 실제로는 check_all_pages가 True면 모든 페이지 검사해야 함
-    result = checker.check_overprint_with_ghostscript(pdf_path, page_num=1)
+    result = session.overprint()
+    
+    # 호출 쪽(check_overprint)이 실행 성공 여부를 확인할 수 있도록 전달
+    overprint_info['success'] = result['success']
+    overprint_info['error'] = result['error']
+    
+    # 같은 Ghostscript 실행에서 얻은 색상 사용 정보
+    overprint_info['color_strategy_hints'] = session.run()['color_strategy_hints']
     
     if result['success'] and result['has_overprint']:
         overprint_info['has_overprint'] = True
-        overprint_info['pages_with_overprint'].append(1)
         
-        # 오버프린트 타입 분류
-        for area in result['overprint_areas']:
-            if area['type'] == 'spot_color_overprint':
-                overprint_info['has_problematic_overprint'] = True
-                overprint_info['overprint_objects'].append({
-                    'page': 1,
-                    'type': 'spot_overprint',
-                    'channels': area['channels']
-                })
+        for page, page_info in session.run()['pages'].items():
+            if not page_info['has_overprint']:
+                continue
+            overprint_info['pages_with_overprint'].append(page)
+            
+            # 오버프린트 타입 분류
+            for area in page_info['overprint_areas']:
+                if area['type'] == 'spot_color_overprint':
+                    overprint_info['has_problematic_overprint'] = True
+                    overprint_info['overprint_objects'].append({
+                        'page': page,
+                        'type': 'spot_overprint',
+                        'channels': area['channels']
+                    })
     
     return overprint_info
 
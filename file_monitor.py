@@ -168,7 +168,9 @@ class PDFHandler(FileSystemEventHandler):
             if print_quality:
                 # 투명도
                 if print_quality.get('transparency', {}).get('has_transparency'):
-                    pages_count = len(print_quality['transparency'].get('pages_with_transparency', []))
+                    transparency = print_quality['transparency']
+                    pages_count = transparency.get('transparency_page_count',
+                                                   len(transparency.get('pages_with_transparency', [])))
                     print(f"\n  ⚠️  투명도: {pages_count}개 페이지에서 발견")
                 
                 # 재단선
@@ -179,7 +181,9 @@ class PDFHandler(FileSystemEventHandler):
                 
                 # 중복인쇄
                 if print_quality.get('overprint', {}).get('has_overprint'):
-                    pages_count = len(set(print_quality['overprint'].get('pages_with_overprint', [])))
+                    overprint = print_quality['overprint']
+                    pages_count = overprint.get('overprint_page_count',
+                                                len(set(overprint.get('pages_with_overprint', []))))
                     print(f"  ⚠️  중복인쇄: {pages_count}개 페이지에서 설정됨")
             
             # 잉크량 정보 출력
@@ -13,7 +13,7 @@ from pdf_analyzer import PDFAnalyzer
 from report_generator import ReportGenerator
 from file_monitor import PDFMonitor, check_existing_files
 from preflight_profiles import PreflightProfiles
-from utils import format_datetime
+from utils import format_datetime, setup_console_logging
 import shutil
 
 def print_banner():
@@ -375,6 +375,7 @@ def main():
         monitor.start()
 
 if __name__ == "__main__":
+    setup_console_logging()
     try:
         main()
     except KeyboardInterrupt:
@@ -21,7 +21,7 @@ import fitz  # PyMuPDF - PDF 파일을 읽고 분석하는 라이브러리 (이
 from pathlib import Path  # 파일 경로를 다루는 라이브러리
 from utils import (
     points_to_mm, format_size_mm, safe_str, format_file_size,
-    safe_integer, safe_float
+    safe_integer, safe_float, real_fonts
 )  # 유틸리티 함수들
 from config import Config  # 설정 파일
 from ink_calculator import InkCalculator  # 잉크량 계산기
@@ -761,11 +761,9 @@ class PDFAnalyzer:
         else:
             # 정상적으로 검사된 경우만 폰트 임베딩 문제 확인
             font_issues = {}
-            
-            for font_key, font_info in fonts.items():
-                if font_key.startswith('_'):  # 메타데이터는 건너뛰기
-                    continue
-                    
+
+            # 메타데이터('_'로 시작하는 키)는 제외하고 순회
+            for font_info in real_fonts(fonts).values():
                 # 임베딩되지 않았고 표준 폰트가 아닌 경우
                 if not font_info['embedded'] and not font_info.get('is_standard', False):
                     font_name = font_info.get('base_font', font_info['name'])
@@ -809,16 +807,17 @@ class PDFAnalyzer:
             })
         
         # 4. 별색 사용 검사
-        if colors['has_spot_colors'] and colors['spot_color_names']:
+        # 별색 이름 목록이 비어 있으면 아래 집계를 아예 수행하지 않음
+        if (spot_names := colors.get('spot_color_names')) and colors['has_spot_colors']:
             # PANTONE 색상 개수 확인
-            pantone_colors = [name for name in colors['spot_color_names'] 
+            pantone_colors = [name for name in spot_names 
                             if 'PANTONE' in name.upper()]
             
             # 별색 개수에 따른 심각도 결정
             severity = 'info'
             suggestion = "별색 사용 시 추가 인쇄 비용이 발생할 수 있습니다"
             
-            if len(colors['spot_color_names']) > 2:
+            if len(spot_names) > 2:
                 severity = 'warning'
                 suggestion = "별색이 많습니다. 비용 절감을 위해 CMYK 변환을 고려하세요"
             
@@ -831,16 +830,17 @@ class PDFAnalyzer:
             issues.append({
                 'type': 'spot_colors',
                 'severity': severity,
-                'message': f"별색 {len(colors['spot_color_names'])}개 사용: {', '.join(colors['spot_color_names'][:3])}",
+                'message': f"별색 {len(spot_names)}개 사용: {', '.join(spot_names[:3])}",
                 'affected_pages': spot_pages,
-                'spot_colors': colors['spot_color_names'],
+                'spot_colors': spot_names,
                 'pantone_count': len(pantone_colors),
                 'suggestion': suggestion
             })
         
         # 5. 이미지 해상도 검사
         images = analysis_result.get('images', {})
-        if images.get('low_resolution_count', 0) > 0:
+        # 카운터(정수)를 먼저 확인하고, 0이면 이미지 목록은 순회하지 않음
+        if (low_res_count := images.get('low_resolution_count', 0)) > 0:
             # 저해상도 이미지들 수집
             low_res_images = [img for img in images.get('images', []) 
                             if img['dpi'] > 0 and img['dpi'] < Config.MIN_IMAGE_DPI]
@@ -856,7 +856,7 @@ class PDFAnalyzer:
             issues.append({
                 'type': 'low_resolution_image',
                 'severity': 'error',
-                'message': f"저해상도 이미지 - {images['low_resolution_count']}개",
+                'message': f"저해상도 이미지 - {low_res_count}개",
                 'affected_pages': low_res_pages,
                 'min_dpi': min_dpi,
                 'suggestion': f"인쇄 품질을 위해 최소 {Config.MIN_IMAGE_DPI} DPI 이상으로 교체하세요"
@@ -878,10 +878,10 @@ class PDFAnalyzer:
         
         # 6. 잉크량 검사
         ink = analysis_result.get('ink_coverage', {})
-        if 'summary' in ink and ink['summary']['problem_pages']:
+        if (ink_problems := ink.get('summary', {}).get('problem_pages')):
             problem_pages = []
             max_coverage = 0
-            for problem in ink['summary']['problem_pages']:
+            for problem in ink_problems:
                 problem_pages.append(problem['page'])
                 if problem['max_coverage'] > max_coverage:
                     max_coverage = problem['max_coverage']
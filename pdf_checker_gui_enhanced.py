@@ -7,6 +7,7 @@ PDF 품질 검수 시스템 v4.0 - Modularized Edition
 """
 
 from gui.main_window import EnhancedPDFCheckerGUI
+from utils import setup_console_logging
 
 def main():
     """메인 함수"""
@@ -18,4 +19,5 @@ def main():
 
 # 프로그램 진입점
 if __name__ == "__main__":
+    setup_console_logging()
     main()
\ No newline at end of file
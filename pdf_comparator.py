@@ -7,20 +7,395 @@ pdf_comparator.py - PDF 비교 검사 엔진
 """
 
 import fitz  # PyMuPDF
-import numpy as np
 from pathlib import Path
 from datetime import datetime
-import json
-from typing import Dict, List, Tuple, Optional, Any
-from PIL import Image, ImageDraw, ImageFont, ImageChops
-import io
-import base64
+from typing import Callable, Dict, List, Tuple, Optional, Any
+import os
+import sys
+import threading
+import multiprocessing
+import difflib
+import hashlib
+import re
+from string import Template
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
 
 # 프로젝트 모듈
 from config import Config
-from utils import format_datetime, format_file_size, points_to_mm
+from utils import format_datetime, format_file_size, points_to_mm, dumps_json
 from simple_logger import SimpleLogger
 
+# 페이지 지문 계산용 - PDF 간접 참조("12 0 R")와 위쪽(부모/소속 페이지)으로 가는 참조
+_PDF_REF_RE = re.compile(r"(\d+) (\d+) R\b")
+_PDF_UPWARD_REF_RE = re.compile(r"/(?:Parent|P)\s*\d+ \d+ R\b")
+_PDF_PAGE_TYPE_RE = re.compile(r"/Type\s*/Page(?![A-Za-z])")
+
+# ---------------------------------------------------------------------------
+# HTML 리포트 템플릿
+# 모듈 로드 시 한 번만 만들어 두고 _create_html_report에서 substitute로 채움
+# (CSS 중괄호를 이스케이프할 필요가 없도록 string.Template 사용)
+# ---------------------------------------------------------------------------
+
+_REPORT_HEADER_TPL = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>PDF 비교 리포트 - $file1_name vs $file2_name</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: 'Segoe UI', 'Malgun Gothic', sans-serif;
+            background: #f3f4f6;
+            color: #1f2937;
+            line-height: 1.6;
+        }
+        
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 2rem;
+        }
+        
+        .header {
+            background: white;
+            border-radius: 12px;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+            margin-bottom: 2rem;
+        }
+        
+        .header h1 {
+            font-size: 2rem;
+            margin-bottom: 1rem;
+            color: #111827;
+        }
+        
+        .status-banner {
+            background: $status_color;
+            color: white;
+            padding: 1rem 1.5rem;
+            border-radius: 8px;
+            display: inline-flex;
+            align-items: center;
+            gap: 0.5rem;
+            margin-bottom: 1rem;
+        }
+        
+        .status-icon {
+            font-size: 1.5rem;
+        }
+        
+        .file-info {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 2rem;
+            margin-top: 1.5rem;
+        }
+        
+        .file-card {
+            background: #f9fafb;
+            padding: 1rem;
+            border-radius: 8px;
+            border: 1px solid #e5e7eb;
+        }
+        
+        .file-card h3 {
+            font-size: 0.875rem;
+            color: #6b7280;
+            margin-bottom: 0.5rem;
+        }
+        
+        .file-card .filename {
+            font-weight: 600;
+            color: #111827;
+            margin-bottom: 0.5rem;
+        }
+        
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+            margin-bottom: 2rem;
+        }
+        
+        .stat-card {
+            background: white;
+            padding: 1.5rem;
+            border-radius: 8px;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+            text-align: center;
+        }
+        
+        .stat-value {
+            font-size: 2rem;
+            font-weight: 700;
+            color: #111827;
+            margin-bottom: 0.25rem;
+        }
+        
+        .stat-label {
+            font-size: 0.875rem;
+            color: #6b7280;
+        }
+        
+        .pages-section {
+            background: white;
+            border-radius: 12px;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+            margin-bottom: 2rem;
+        }
+        
+        .pages-section h2 {
+            font-size: 1.5rem;
+            margin-bottom: 1.5rem;
+            color: #111827;
+        }
+        
+        .page-item {
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+            background: #f9fafb;
+        }
+        
+        .page-item.modified {
+            border-color: #fbbf24;
+            background: #fffbeb;
+        }
+        
+        .page-item.added {
+            border-color: #34d399;
+            background: #ecfdf5;
+        }
+        
+        .page-item.deleted {
+            border-color: #f87171;
+            background: #fef2f2;
+        }
+        
+        .page-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 0.5rem;
+        }
+        
+        .page-number {
+            font-weight: 600;
+            color: #111827;
+        }
+        
+        .page-status {
+            font-size: 0.875rem;
+            padding: 0.25rem 0.75rem;
+            border-radius: 9999px;
+            font-weight: 500;
+        }
+        
+        .status-identical { background: #d1fae5; color: #065f46; }
+        .status-modified { background: #fed7aa; color: #92400e; }
+        .status-added { background: #d1fae5; color: #065f46; }
+        .status-deleted { background: #fee2e2; color: #991b1b; }
+        
+        .diff-list {
+            margin-top: 1rem;
+            padding-left: 1.5rem;
+        }
+        
+        .diff-item {
+            margin-bottom: 0.5rem;
+            color: #4b5563;
+            font-size: 0.875rem;
+        }
+        
+        .diff-image {
+            margin-top: 1rem;
+            max-width: 100%;
+            border: 1px solid #e5e7eb;
+            border-radius: 4px;
+        }
+        
+        .summary-section {
+            background: white;
+            border-radius: 12px;
+            padding: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+        
+        .change-types {
+            margin-top: 1.5rem;
+        }
+        
+        .change-type {
+            display: flex;
+            justify-content: space-between;
+            padding: 0.5rem 0;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        
+        .similarity-meter {
+            margin: 2rem 0;
+            text-align: center;
+        }
+        
+        .similarity-bar {
+            width: 100%;
+            height: 30px;
+            background: #e5e7eb;
+            border-radius: 15px;
+            overflow: hidden;
+            position: relative;
+        }
+        
+        .similarity-fill {
+            height: 100%;
+            background: linear-gradient(to right, #ef4444, #f59e0b, #10b981);
+            width: $similarity%;
+            transition: width 1s ease;
+        }
+        
+        .similarity-text {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            font-weight: 600;
+            color: #111827;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <!-- 헤더 -->
+        <div class="header">
+            <h1>PDF 비교 리포트</h1>
+            
+            <div class="status-banner">
+                <span class="status-icon">$status_icon</span>
+                <span>$status_text</span>
+            </div>
+            $truncated_notice
+            
+            <div class="file-info">
+                <div class="file-card">
+                    <h3>원본 파일</h3>
+                    <div class="filename">$file1_name</div>
+                    <div style="font-size: 0.875rem; color: #6b7280;">
+                        $file1_pages 페이지 • $file1_size
+                    </div>
+                </div>
+                <div class="file-card">
+                    <h3>비교 파일</h3>
+                    <div class="filename">$file2_name</div>
+                    <div style="font-size: 0.875rem; color: #6b7280;">
+                        $file2_pages 페이지 • $file2_size
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <!-- 일치율 표시 -->
+        <div class="summary-section">
+            <h2 style="text-align: center; margin-bottom: 1rem;">전체 일치율</h2>
+            <div class="similarity-meter">
+                <div class="similarity-bar">
+                    <div class="similarity-fill"></div>
+                    <div class="similarity-text">$similarity%</div>
+                </div>
+            </div>
+        </div>
+        
+        <!-- 통계 카드 -->
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-value">$total_pages</div>
+                <div class="stat-label">전체 페이지</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value" style="color: #10b981;">$identical_pages</div>
+                <div class="stat-label">동일 페이지</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value" style="color: #f59e0b;">$modified_pages</div>
+                <div class="stat-label">수정된 페이지</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value" style="color: #ef4444;">$total_differences</div>
+                <div class="stat-label">총 차이점</div>
+            </div>
+        </div>
+        
+        <!-- 페이지별 상세 -->
+        <div class="pages-section">
+            <h2>페이지별 비교 결과</h2>
+""")
+
+_REPORT_PAGE_TPL = Template("""
+            <div class="page-item $status">
+                <div class="page-header">
+                    <div class="page-number">페이지 $page</div>
+                    <div class="page-status status-$status">$description</div>
+                </div>
+""")
+
+_REPORT_DIFF_ITEM_TPL = Template('<div class="diff-item">• $description</div>')
+
+_REPORT_DIFF_IMAGE_TPL = Template('<img src="$src" class="diff-image" alt="차이점 시각화">')
+
+_REPORT_CHANGE_TYPES_OPEN = """
+        </div>
+        
+        <!-- 변경 유형 요약 -->
+        <div class="summary-section">
+            <h2>변경 유형별 요약</h2>
+            <div class="change-types">
+"""
+
+_REPORT_CHANGE_TYPE_TPL = Template("""
+                <div class="change-type">
+                    <span>$type_name</span>
+                    <span style="font-weight: 600;">${count}건</span>
+                </div>
+""")
+
+_REPORT_FOOTER_TPL = Template("""
+            </div>
+        </div>
+    </div>
+    
+    <script>
+        // 페이지 로드 시 애니메이션
+        document.addEventListener('DOMContentLoaded', function() {
+            const fill = document.querySelector('.similarity-fill');
+            setTimeout(() => {
+                fill.style.width = '${similarity}%';
+            }, 100);
+        });
+    </script>
+</body>
+</html>
+""")
+
+# 변경 타입별 표시 이름
+_CHANGE_TYPE_NAMES = {
+    'page_size': '페이지 크기',
+    'text_content': '텍스트 내용',
+    'text_structure': '텍스트 구조',
+    'visual': '시각적 변경',
+    'image_count': '이미지 수',
+    'image_size': '이미지 크기',
+    'image_content': '이미지 내용',
+    'metadata': '메타데이터'
+}
+
 
 class PDFComparator:
     """PDF 비교 검사를 수행하는 클래스"""
@@ -40,9 +415,31 @@ class PDFComparator:
             'visual_compare': True,  # 시각적 비교
             'highlight_color': (255, 0, 0, 100),  # 차이점 표시 색상 (빨간색)
             'comparison_dpi': 150,  # 비교용 렌더링 해상도
+            'parallel_visual': True,  # 시각적 비교를 프로세스 풀로 병렬 처리
+            'phash_prescreen': False,  # 지각 해시가 같으면 픽셀 비교 생략 (작은 변경은 놓칠 수 있음)
+            'skip_visual_if_text_same': False,  # 텍스트·이미지가 같으면 렌더링 생략 (도형/색상 변경은 놓침)
+            'max_differences': None,  # 차이점이 이만큼 쌓이면 남은 페이지 비교 중단 (0/None이면 끝까지)
         }
         
-    def compare(self, pdf_path1: Path, pdf_path2: Path, output_dir: Path = None) -> Dict:
+        # 비교 중인 파일 경로 (프로세스 풀 워커에 전달)
+        self.pdf_path1 = None
+        self.pdf_path2 = None
+        
+        # 백그라운드에서 저장 중인 차이 이미지 (Future 목록)
+        self._io_futures = []
+        
+        # 페이지 지문 계산 시 스트림 해시 캐시 (문서, xref) → 해시 (compare마다 초기화)
+        self._stream_digests = {}
+        
+        # 진행 상황 보고 / 취소 요청 (compare 호출마다 초기화)
+        self._progress_cb = None
+        self._progress_done = 0
+        self._progress_total = 0
+        self._cancel_event = None
+        
+    def compare(self, pdf_path1: Path, pdf_path2: Path, output_dir: Path = None,
+                progress_cb: Optional[Callable[[int, int], None]] = None,
+                cancel_event: Optional[threading.Event] = None) -> Dict:
         """
         두 PDF 파일을 비교하는 메인 메서드
         
@@ -50,14 +447,24 @@ class PDFComparator:
             pdf_path1: 원본 PDF 경로
             pdf_path2: 비교할 PDF 경로
             output_dir: 비교 결과를 저장할 디렉토리
+            progress_cb: 진행 상황 콜백 (비교 완료 페이지 수, 전체 페이지 수)
+                         - 비교 스레드에서 호출되므로 GUI를 직접 갱신하면 안 됨
+            cancel_event: 설정되면 남은 페이지 비교를 건너뛰고 중단
             
         Returns:
             dict: 비교 결과
         """
         self.logger.log(f"PDF 비교 시작: {pdf_path1.name} vs {pdf_path2.name}")
+        self._progress_cb = progress_cb
+        self._progress_done = 0
+        self._progress_total = 0
+        self._cancel_event = cancel_event
+        self._stream_digests = {}
         
         try:
             # PDF 열기
+            self.pdf_path1 = pdf_path1
+            self.pdf_path2 = pdf_path2
             self.doc1 = fitz.open(pdf_path1)
             self.doc2 = fitz.open(pdf_path2)
             
@@ -84,7 +491,8 @@ class PDFComparator:
                 'output_dir': str(output_dir),
                 'summary': {},
                 'page_comparisons': [],
-                'differences': []
+                'differences': [],
+                'truncated': False  # max_differences에 도달해 일부 페이지만 비교했는지
             }
             
             # 1. 기본 정보 비교
@@ -93,6 +501,10 @@ class PDFComparator:
             # 2. 페이지별 비교
             self._compare_pages(output_dir)
             
+            if self._is_cancelled():
+                self.logger.log("PDF 비교 취소됨")
+                return {'error': '사용자가 비교를 취소했습니다', 'cancelled': True}
+            
             # 3. 전체 요약 생성
             self._generate_summary()
             
@@ -108,6 +520,9 @@ class PDFComparator:
             return {'error': str(e)}
             
         finally:
+            # 아직 저장 중인 차이 이미지가 있으면 마무리
+            self._wait_pending_saves()
+            
             # 문서 닫기
             if self.doc1:
                 self.doc1.close()
@@ -121,20 +536,24 @@ class PDFComparator:
         differences = []
         
         # 페이지 수 비교
-        if len(self.doc1) != len(self.doc2):
+        n1 = len(self.doc1)
+        n2 = len(self.doc2)
+        if n1 != n2:
             differences.append({
                 'type': 'page_count',
                 'severity': 'major',
-                'description': f"페이지 수 차이: {len(self.doc1)}페이지 → {len(self.doc2)}페이지",
-                'value1': len(self.doc1),
-                'value2': len(self.doc2)
+                'description': f"페이지 수 차이: {n1}페이지 → {n2}페이지",
+                'value1': n1,
+                'value2': n2
             })
         
-        # 메타데이터 비교
+        # 메타데이터 비교 (metadata 속성은 접근할 때마다 dict를 새로 만들므로 한 번만 읽음)
+        metadata1 = self.doc1.metadata or {}
+        metadata2 = self.doc2.metadata or {}
         metadata_keys = ['/Title', '/Author', '/Subject', '/Creator', '/Producer']
         for key in metadata_keys:
-            val1 = self.doc1.metadata.get(key, '')
-            val2 = self.doc2.metadata.get(key, '')
+            val1 = metadata1.get(key, '')
+            val2 = metadata2.get(key, '')
             if val1 != val2:
                 differences.append({
                     'type': 'metadata',
@@ -151,26 +570,38 @@ class PDFComparator:
         """페이지별 상세 비교"""
         self.logger.log("페이지별 비교 시작...")
         
-        max_pages = max(len(self.doc1), len(self.doc2))
+        # 페이지 수는 루프 밖에서 한 번만 조회
+        n1 = len(self.doc1)
+        n2 = len(self.doc2)
+        max_pages = max(n1, n2)
+        visual_jobs = []  # (페이지 인덱스, 페이지 비교 결과, 시각 차이 삽입 위치)
+        self._progress_total = max_pages
+        max_differences = self.settings.get('max_differences')
+        diff_count = 0  # 지금까지 확정된 차이점 수 (대기 중인 시각 비교 결과는 제외)
         
         for page_num in range(max_pages):
-            self.logger.log(f"  {page_num + 1}/{max_pages} 페이지 비교 중...")
+            if self._is_cancelled():
+                return
+            
+            self.logger.log("  %d/%d 페이지 비교 중...", page_num + 1, max_pages)
             
             # 페이지 존재 여부 확인
-            if page_num >= len(self.doc1):
+            if page_num >= n1:
                 self.comparison_result['page_comparisons'].append({
                     'page': page_num + 1,
                     'status': 'added',
                     'description': '새로 추가된 페이지'
                 })
+                self._advance_progress()
                 continue
                 
-            if page_num >= len(self.doc2):
+            if page_num >= n2:
                 self.comparison_result['page_comparisons'].append({
                     'page': page_num + 1,
                     'status': 'deleted',
                     'description': '삭제된 페이지'
                 })
+                self._advance_progress()
                 continue
             
             # 페이지 비교
@@ -182,36 +613,217 @@ class PDFComparator:
                 'differences': []
             }
             
+            # 0. 빠른 경로: 페이지가 참조하는 내용(리소스, 주석 포함)이 모두 같으면
+            #    렌더링을 포함한 모든 비교를 건너뜀
+            if self._page_fingerprint(page1) == self._page_fingerprint(page2):
+                self.comparison_result['page_comparisons'].append(page_comparison)
+                self._advance_progress()
+                continue
+            
             # 1. 페이지 크기 비교
             size_diff = self._compare_page_size(page1, page2)
             if size_diff:
                 page_comparison['differences'].append(size_diff)
             
-            # 2. 텍스트 내용 비교
+            # 2. 텍스트 내용 비교 (텍스트는 한 번만 추출해서 재사용)
+            skip_if_same = self.settings.get('skip_visual_if_text_same', False)
+            texts = None
+            if self.settings['text_compare'] or skip_if_same:
+                texts = (page1.get_text(), page2.get_text())
             if self.settings['text_compare']:
-                text_diffs = self._compare_text_content(page1, page2)
+                text_diffs = self._compare_text_content(page1, page2, texts)
                 page_comparison['differences'].extend(text_diffs)
             
-            # 3. 시각적 비교 (픽셀 단위)
-            if self.settings['visual_compare']:
-                visual_diff = self._compare_visual(page1, page2, page_num + 1, output_dir)
-                if visual_diff:
-                    page_comparison['differences'].append(visual_diff)
+            # 시각 차이는 나중에 텍스트 차이 바로 뒤 위치에 삽입
+            visual_position = len(page_comparison['differences'])
             
-            # 4. 이미지 비교
+            # 4. 이미지 비교 (시각적 비교 생략 여부 판단에 쓰므로 먼저 수행)
+            image_diffs = None
             if self.settings['image_compare']:
                 image_diffs = self._compare_images(page1, page2)
                 page_comparison['differences'].extend(image_diffs)
             
-            # 페이지 상태 결정
+            # 3. 시각적 비교 (픽셀 단위) - 렌더링 비용이 크므로 모아서 한 번에 처리
+            if self.settings['visual_compare']:
+                if skip_if_same and not size_diff and self._text_and_images_same(
+                        page1, page2, texts, image_diffs):
+                    self._advance_progress()  # 렌더링 없이 완료
+                else:
+                    visual_jobs.append((page_num, page_comparison, visual_position))
+            
+            self.comparison_result['page_comparisons'].append(page_comparison)
+            
+            # 시각적 비교가 남은 페이지는 그 결과가 나올 때 완료로 셈
+            if not self.settings['visual_compare']:
+                self._advance_progress()
+            
+            # 차이점이 충분히 모이면 남은 페이지는 비교하지 않음 (빠른 실패)
+            diff_count += len(page_comparison['differences'])
+            if max_differences and diff_count >= max_differences and page_num + 1 < max_pages:
+                self.comparison_result['truncated'] = True
+                self.logger.log(f"차이점 {diff_count}개 - {page_num + 1}/{max_pages} 페이지에서 비교 중단")
+                self._advance_progress(max_pages - page_num - 1)  # 건너뛴 페이지도 완료로 셈
+                break
+        
+        # 시각적 비교 실행 후 원래 순서(크기 → 텍스트 → 시각 → 이미지) 위치에 삽입
+        visual_results = self._run_visual_jobs([job[0] for job in visual_jobs], output_dir)
+        self._wait_pending_saves()  # 리포트가 차이 이미지 존재 여부를 확인하므로
+        if self._is_cancelled():
+            return
+        for page_num, page_comparison, position in visual_jobs:
+            visual_diff = visual_results.get(page_num)
+            if visual_diff:
+                page_comparison['differences'].insert(position, visual_diff)
+        
+        # 페이지 상태 결정
+        for page_comparison in self.comparison_result['page_comparisons']:
+            if 'status' in page_comparison:
+                continue  # 추가/삭제된 페이지
+            
             if not page_comparison['differences']:
                 page_comparison['status'] = 'identical'
                 page_comparison['description'] = '변경 없음'
             else:
                 page_comparison['status'] = 'modified'
                 page_comparison['description'] = f"{len(page_comparison['differences'])}개 차이점 발견"
-            
-            self.comparison_result['page_comparisons'].append(page_comparison)
+    
+    def _run_visual_jobs(self, page_indices: List[int], output_dir: Path) -> Dict[int, Optional[Dict]]:
+        """
+        여러 페이지의 시각적 비교 실행
+        
+        페이지 렌더링과 픽셀 비교는 CPU 작업이라 GIL의 영향을 받으므로,
+        페이지가 2개 이상이고 코어가 여럿이면 프로세스 풀로 나눠 처리합니다.
+        (PyMuPDF는 스레드 간 문서 공유가 안전하지 않음)
+        
+        Returns:
+            dict: {페이지 인덱스: 시각적 차이 dict 또는 None}
+        """
+        if not page_indices:
+            return {}
+        
+        workers = min(os.cpu_count() or 1, len(page_indices))
+        
+        if self.settings.get('parallel_visual', True) and workers > 1:
+            # 워커마다 연속된 페이지 묶음 하나씩 - 문서 열기/피클 비용을 묶음 단위로 분산
+            chunk_size = -(-len(page_indices) // workers)
+            jobs = [
+                (str(self.pdf_path1), str(self.pdf_path2),
+                 page_indices[start:start + chunk_size],
+                 dict(self.settings), str(output_dir))
+                for start in range(0, len(page_indices), chunk_size)
+            ]
+            progress_before = self._progress_done
+            try:
+                from pdf_compare_visual import visual_range
+                results = {}
+                # spawn: 부모의 스레드를 fork로 물려받으면 자식이 멈출 수 있으므로
+                # Windows와 같은 방식으로 통일
+                with ProcessPoolExecutor(max_workers=len(jobs),
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    futures = [executor.submit(visual_range, *job) for job in jobs]
+                    # 끝난 묶음부터 결과를 모음 (느린 묶음이 진행 상황 보고를 막지 않음)
+                    for future in as_completed(futures):
+                        if self._is_cancelled():
+                            # 아직 시작하지 않은 묶음은 취소하고 결과 수집 중단
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                        chunk = future.result()
+                        results.update(chunk)
+                        self._advance_progress(len(chunk))
+                        self.logger.log(f"  시각적 비교 {len(results)}/{len(page_indices)} 페이지 완료")
+                return results
+            except Exception as e:
+                # 프로세스 생성 실패 등 - 순차 처리로 폴백 (진행률도 되돌림)
+                self.logger.log(f"병렬 시각 비교 실패, 순차 처리로 전환: {str(e)}")
+                self._progress_done = progress_before
+        
+        results = {}
+        for page_num in page_indices:
+            if self._is_cancelled():
+                break
+            results[page_num] = self._compare_visual(
+                self.doc1[page_num], self.doc2[page_num], page_num + 1, output_dir
+            )
+            self._advance_progress()
+        return results
+    
+    def _is_cancelled(self) -> bool:
+        """비교 취소가 요청되었는지 확인"""
+        return self._cancel_event is not None and self._cancel_event.is_set()
+    
+    def _advance_progress(self, count: int = 1):
+        """비교 완료 페이지 수를 늘리고 진행 상황 콜백 호출"""
+        self._progress_done += count
+        if self._progress_cb:
+            self._progress_cb(self._progress_done, self._progress_total)
+    
+    def _page_fingerprint(self, page) -> bytes:
+        """
+        페이지 내용의 지문(해시) 계산
+        
+        페이지 크기/회전과 페이지 객체에서 닿는 모든 객체 - 내용 스트림, 리소스
+        (폼 XObject 안쪽까지 재귀적으로, 이미지, 글꼴, 그래픽 상태 등), 주석과
+        그 모양 스트림 - 의 정의와 원본 스트림을 blake2b로 해시합니다.
+        두 페이지의 지문이 같으면 렌더링 결과와 텍스트도 같다고 봅니다.
+        
+        객체 번호는 방문 순서 번호로 바꿔 해시하므로 두 파일에서 번호가 달라도
+        내용이 같으면 지문이 같습니다. 부모(/Parent, /P)로 올라가는 참조와
+        다른 페이지 객체(링크 대상 등)의 내용은 따라가지 않습니다.
+        """
+        doc = page.parent
+        xref_count = doc.xref_length()
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((tuple(page.rect), page.rotation)).encode())
+        
+        order = {page.xref: 0}
+        pending = []
+        
+        def normalize(source: str) -> str:
+            # 간접 참조를 방문 순서 번호로 바꾸고, 처음 보는 객체는 방문 대기열에 추가
+            def ref(match):
+                xref = int(match.group(1))
+                if not 0 < xref < xref_count:
+                    return "null"
+                if xref not in order:
+                    order[xref] = len(order)
+                    pending.append(xref)
+                return f"@{order[xref]}"
+            return _PDF_REF_RE.sub(ref, _PDF_UPWARD_REF_RE.sub("", source))
+        
+        h.update(normalize(doc.xref_object(page.xref, compressed=True)).encode())
+        
+        # 페이지 트리에서 물려받는 리소스 (페이지 객체에 /Resources가 없을 때)
+        if doc.xref_get_key(page.xref, "Resources")[0] == "null":
+            parent = doc.xref_get_key(page.xref, "Parent")
+            while parent[0] == "xref":
+                parent_xref = int(parent[1].split()[0])
+                kind, value = doc.xref_get_key(parent_xref, "Resources")
+                if kind != "null":
+                    h.update(normalize(f"/Resources {value}").encode())
+                    break
+                parent = doc.xref_get_key(parent_xref, "Parent")
+        
+        while pending:
+            xref = pending.pop()
+            h.update(f"@{order[xref]}=".encode())
+            source = doc.xref_object(xref, compressed=True)
+            if _PDF_PAGE_TYPE_RE.search(source):
+                h.update(b"page")  # 다른 페이지 - 내용은 그 페이지의 지문에서 다룸
+                continue
+            h.update(normalize(source).encode())
+            if doc.xref_is_stream(xref):
+                h.update(self._stream_digest(doc, xref))
+        return h.digest()
+    
+    def _stream_digest(self, doc, xref: int) -> bytes:
+        """객체 스트림(압축된 원본) 해시 - 여러 페이지가 공유하는 글꼴/이미지는 한 번만 계산"""
+        key = (doc, xref)  # 문서 객체를 키에 넣어 캐시가 남아 있는 동안 id가 재사용되지 않게 함
+        digest = self._stream_digests.get(key)
+        if digest is None:
+            digest = hashlib.blake2b(doc.xref_stream_raw(xref) or b'', digest_size=16).digest()
+            self._stream_digests[key] = digest
+        return digest
     
     def _compare_page_size(self, page1, page2) -> Optional[Dict]:
         """페이지 크기 비교"""
@@ -233,13 +845,23 @@ class PDFComparator:
         
         return None
     
-    def _compare_text_content(self, page1, page2) -> List[Dict]:
-        """텍스트 내용 비교"""
+    def _compare_text_content(self, page1, page2,
+                              texts: Optional[Tuple[str, str]] = None) -> List[Dict]:
+        """
+        텍스트 내용 비교
+        
+        Args:
+            page1, page2: 비교할 페이지
+            texts: 이미 추출한 (text1, text2), 없으면 여기서 추출
+        """
         differences = []
         
         # 텍스트 추출
-        text1 = page1.get_text()
-        text2 = page2.get_text()
+        if texts is not None:
+            text1, text2 = texts
+        else:
+            text1 = page1.get_text()
+            text2 = page2.get_text()
         
         # 간단한 비교 (전체 텍스트)
         if text1 != text2:
@@ -259,125 +881,119 @@ class PDFComparator:
                     'description': f"텍스트 블록 수 변경: {len(text_blocks1)}개 → {len(text_blocks2)}개"
                 })
             
-            # 각 블록의 텍스트 비교
-            for i, (block1, block2) in enumerate(zip(text_blocks1, text_blocks2)):
-                text1 = self._extract_block_text(block1)
-                text2 = self._extract_block_text(block2)
+            # 블록 텍스트를 해시로 정렬(align)하여 같은 블록은 문자열 비교 없이 건너뜀
+            # (블록이 중간에 추가/삭제되어도 이후 블록이 모두 변경으로 잡히지 않음)
+            blocks_text1 = [self._extract_block_text(b) for b in text_blocks1]
+            blocks_text2 = [self._extract_block_text(b) for b in text_blocks2]
+            hashes1 = list(map(hash, blocks_text1))
+            hashes2 = list(map(hash, blocks_text2))
+            
+            matcher = difflib.SequenceMatcher(a=hashes1, b=hashes2, autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == 'equal':
+                    continue
                 
-                if text1 != text2:
+                # 변경된 구간은 위치(y 좌표)가 같은 블록끼리 짝지어 비교하고,
+                # 짝이 없는 블록은 추가/삭제로 표시
+                for i, j in self._match_blocks_by_position(
+                    text_blocks1, range(i1, i2), text_blocks2, range(j1, j2)
+                ):
+                    text1 = blocks_text1[i] if i is not None else ""
+                    text2 = blocks_text2[j] if j is not None else ""
+                    
+                    if i is not None and j is not None:
+                        description = f"텍스트 변경 감지 (블록 {i+1})"
+                        bbox = text_blocks1[i]["bbox"]
+                    elif i is not None:
+                        description = f"텍스트 블록 삭제 (블록 {i+1})"
+                        bbox = text_blocks1[i]["bbox"]
+                    else:
+                        description = f"텍스트 블록 추가 (블록 {j+1})"
+                        bbox = text_blocks2[j]["bbox"]
+                    
                     differences.append({
                         'type': 'text_content',
                         'severity': 'major',
-                        'description': f"텍스트 변경 감지 (블록 {i+1})",
+                        'description': description,
                         'text1': text1[:100] + "..." if len(text1) > 100 else text1,
                         'text2': text2[:100] + "..." if len(text2) > 100 else text2,
-                        'position': (block1["bbox"][0], block1["bbox"][1])
+                        'position': (bbox[0], bbox[1])
                     })
         
         return differences
     
+    @staticmethod
+    def _match_blocks_by_position(blocks1: List[Dict], indices1, blocks2: List[Dict], indices2,
+                                  grid: float = 5.0) -> List[Tuple[Optional[int], Optional[int]]]:
+        """
+        블록 위치(bbox 상단 y 좌표)를 격자로 양자화한 인덱스로 블록 짝짓기
+        
+        Args:
+            blocks1, blocks2: 원본/수정본 텍스트 블록 목록
+            indices1, indices2: 짝지을 블록 인덱스 범위
+            grid: y 좌표 양자화 간격 (pt)
+            
+        Returns:
+            (원본 인덱스, 수정본 인덱스) 목록 - 짝이 없으면 한쪽이 None
+        """
+        # 양자화된 y → 원본 블록 인덱스 목록
+        index = {}
+        for i in indices1:
+            index.setdefault(round(blocks1[i]["bbox"][1] / grid), []).append(i)
+        
+        pairs = []
+        matched = set()
+        for j in indices2:
+            key = round(blocks2[j]["bbox"][1] / grid)
+            hit = None
+            # 경계에 걸친 좌표를 위해 이웃 칸까지 조회
+            for k in (key, key - 1, key + 1):
+                for i in index.get(k, ()):
+                    if i not in matched:
+                        hit = i
+                        break
+                if hit is not None:
+                    break
+            if hit is not None:
+                matched.add(hit)
+            pairs.append((hit, j))
+        
+        # 짝이 없는 원본 블록은 삭제
+        pairs.extend((i, None) for i in indices1 if i not in matched)
+        pairs.sort(key=lambda pair: pair[0] if pair[0] is not None else pair[1])
+        return pairs
+    
     def _extract_block_text(self, block) -> str:
         """텍스트 블록에서 텍스트 추출"""
-        text = ""
-        for line in block.get("lines", []):
-            for span in line.get("spans", []):
-                text += span.get("text", "")
-        return text.strip()
+        return "".join(
+            span["text"] for line in block["lines"] for span in line["spans"]
+        ).strip()
     
-    def _compare_visual(self, page1, page2, page_num: int, output_dir: Path) -> Optional[Dict]:
-        """시각적 비교 (픽셀 단위)"""
-        # 페이지를 이미지로 렌더링
-        zoom = self.settings['comparison_dpi'] / 72.0
-        mat = fitz.Matrix(zoom, zoom)
-        
-        pix1 = page1.get_pixmap(matrix=mat)
-        pix2 = page2.get_pixmap(matrix=mat)
-        
-        # PIL 이미지로 변환
-        img1 = Image.open(io.BytesIO(pix1.tobytes("png")))
-        img2 = Image.open(io.BytesIO(pix2.tobytes("png")))
-        
-        # 크기가 다른 경우 맞춤
-        if img1.size != img2.size:
-            # 더 큰 크기에 맞춤
-            max_width = max(img1.width, img2.width)
-            max_height = max(img1.height, img2.height)
-            
-            # 캔버스 생성
-            canvas1 = Image.new('RGB', (max_width, max_height), 'white')
-            canvas2 = Image.new('RGB', (max_width, max_height), 'white')
-            
-            canvas1.paste(img1, (0, 0))
-            canvas2.paste(img2, (0, 0))
-            
-            img1 = canvas1
-            img2 = canvas2
-        
-        # 차이 계산
-        diff = ImageChops.difference(img1, img2)
-        
-        # 차이가 있는지 확인
-        if diff.getbbox():
-            # 차이점 하이라이트 이미지 생성
-            diff_highlighted = self._create_diff_visualization(img1, img2, diff)
-            
-            # 차이 이미지 저장
-            diff_path = output_dir / f"page_{page_num}_diff.png"
-            diff_highlighted.save(diff_path)
-            
-            # 차이 영역 계산
-            diff_pixels = np.array(diff)
-            total_pixels = diff_pixels.shape[0] * diff_pixels.shape[1]
-            changed_pixels = np.sum(diff_pixels > self.settings['pixel_threshold'])
-            change_percentage = (changed_pixels / total_pixels) * 100
-            
-            return {
-                'type': 'visual',
-                'severity': 'major' if change_percentage > 10 else 'minor',
-                'description': f"시각적 차이 {change_percentage:.1f}% 감지",
-                'change_percentage': change_percentage,
-                'diff_image': str(diff_path),
-                'bbox': diff.getbbox()
-            }
+    def clear_caches(self):
+        """
+        렌더링 캐시 해제
         
-        return None
+        캐시는 순차 시각 비교(이 프로세스)에서만 채워지며 페이지 배열을 최대 16장
+        (150 DPI A4 기준 약 100MB) 보관합니다. 같은 파일을 반복 비교할 때만 이득이므로
+        GUI처럼 오래 떠 있는 프로세스는 비교가 끝날 때마다 호출합니다.
+        """
+        # 시각 비교 모듈을 아직 불러오지 않았다면 비울 캐시도 없음
+        visual = sys.modules.get('pdf_compare_visual')
+        if visual is not None:
+            visual.clear_render_cache()
     
-    def _create_diff_visualization(self, img1: Image, img2: Image, diff: Image) -> Image:
-        """차이점 시각화 이미지 생성"""
-        # 기본 이미지는 img2 (새 버전)
-        result = img2.copy()
-        
-        # 차이점을 빨간색으로 표시
-        diff_array = np.array(diff)
-        mask = np.any(diff_array > self.settings['pixel_threshold'], axis=2)
-        
-        # 오버레이 생성
-        overlay = Image.new('RGBA', img2.size, (255, 255, 255, 0))
-        draw = ImageDraw.Draw(overlay)
-        
-        # 변경된 영역을 사각형으로 표시
-        # 연결된 컴포넌트 찾기 (간단한 구현)
-        from scipy import ndimage
-        labeled, num_features = ndimage.label(mask)
-        
-        for i in range(1, num_features + 1):
-            component = (labeled == i)
-            rows = np.any(component, axis=1)
-            cols = np.any(component, axis=0)
-            rmin, rmax = np.where(rows)[0][[0, -1]]
-            cmin, cmax = np.where(cols)[0][[0, -1]]
-            
-            # 사각형 그리기
-            draw.rectangle(
-                [(cmin-5, rmin-5), (cmax+5, rmax+5)],
-                outline=(255, 0, 0, 255),
-                width=3
-            )
-        
-        # 결과 이미지에 오버레이 합성
-        result = Image.alpha_composite(result.convert('RGBA'), overlay)
-        
-        return result.convert('RGB')
+    def _compare_visual(self, page1, page2, page_num: int, output_dir: Path) -> Optional[Dict]:
+        """시각적 비교 (픽셀 단위) - 차이 이미지는 백그라운드에서 저장"""
+        # NumPy/PIL 등 무거운 의존성은 시각 비교가 필요할 때만 불러옴
+        from pdf_compare_visual import visual_diff
+        return visual_diff(page1, page2, page_num, self.settings, output_dir, self._io_futures)
+    
+    def _wait_pending_saves(self):
+        """백그라운드 차이 이미지 저장이 모두 끝날 때까지 대기"""
+        futures, self._io_futures = self._io_futures, []
+        wait(futures)
+        for future in futures:
+            future.result()  # 저장 중 발생한 예외를 호출자에게 전달
     
     def _compare_images(self, page1, page2) -> List[Dict]:
         """페이지 내 이미지 비교"""
@@ -395,24 +1011,99 @@ class PDFComparator:
                 'description': f"이미지 수 변경: {len(images1)}개 → {len(images2)}개"
             })
         
-        # 각 이미지 비교 (간단한 구현)
-        for i, (img1, img2) in enumerate(zip(images1, images2)):
-            # 이미지 크기 비교
-            if img1[2:4] != img2[2:4]:  # width, height
+        # 이미지 원본 스트림 해시로 비교 (순서가 바뀐 것은 변경으로 보지 않음)
+        hashes1 = self._image_hashes(page1.parent, images1)
+        hashes2 = self._image_hashes(page2.parent, images2)
+        
+        if hashes1 is None or hashes2 is None:
+            # 스트림을 읽을 수 없으면 기존 방식(같은 순서끼리 크기 비교)으로 대체
+            for i, (img1, img2) in enumerate(zip(images1, images2)):
+                if img1[2:4] != img2[2:4]:  # width, height
+                    differences.append({
+                        'type': 'image_size',
+                        'severity': 'minor',
+                        'description': f"이미지 {i+1} 크기 변경",
+                        'size1': img1[2:4],
+                        'size2': img2[2:4]
+                    })
+            return differences
+        
+        set1 = set(hashes1)
+        set2 = set(hashes2)
+        removed = [(i, img) for i, (h, img) in enumerate(zip(hashes1, images1)) if h not in set2]
+        added = [(j, img) for j, (h, img) in enumerate(zip(hashes2, images2)) if h not in set1]
+        
+        # 사라진 이미지와 새 이미지를 순서대로 짝지어 크기/내용 변경으로 보고
+        for (i, img1), (j, img2) in zip(removed, added):
+            if img1[2:4] != img2[2:4]:
                 differences.append({
                     'type': 'image_size',
                     'severity': 'minor',
-                    'description': f"이미지 {i+1} 크기 변경",
+                    'description': f"이미지 {j+1} 크기 변경",
+                    'size1': img1[2:4],
+                    'size2': img2[2:4]
+                })
+            else:
+                differences.append({
+                    'type': 'image_content',
+                    'severity': 'major',
+                    'description': f"이미지 {j+1} 내용 변경",
                     'size1': img1[2:4],
                     'size2': img2[2:4]
                 })
         
         return differences
     
+    def _text_and_images_same(self, page1, page2, texts: Tuple[str, str],
+                              image_diffs: Optional[List[Dict]]) -> bool:
+        """
+        텍스트와 이미지가 모두 같아 렌더링 비교를 생략해도 되는지 판단
+        
+        벡터 도형이나 색상만 바뀐 경우는 구분하지 못하므로
+        'skip_visual_if_text_same' 설정이 켜져 있을 때만 사용합니다.
+        
+        Args:
+            texts: (text1, text2) 추출된 페이지 텍스트
+            image_diffs: 이미 계산한 이미지 비교 결과 (없으면 None)
+        """
+        if texts[0] != texts[1]:
+            return False
+        if image_diffs is not None:
+            return not image_diffs
+        
+        images1 = page1.get_images()
+        images2 = page2.get_images()
+        hashes1 = self._image_hashes(page1.parent, images1)
+        hashes2 = self._image_hashes(page2.parent, images2)
+        if hashes1 is None or hashes2 is None:
+            return False
+        return sorted(hashes1) == sorted(hashes2)
+    
+    def _image_hashes(self, doc, images: List) -> Optional[List[bytes]]:
+        """
+        이미지 원본 스트림의 blake2b 해시 목록
+        
+        디코딩하지 않은 스트림을 해시하므로 extract_image보다 훨씬 가볍습니다.
+        
+        Returns:
+            이미지 순서대로의 해시 목록, 읽기 실패 시 None
+        """
+        hashes = []
+        try:
+            for img in images:
+                data = doc.xref_stream_raw(img[0])
+                if data is None:
+                    return None
+                hashes.append(hashlib.blake2b(data, digest_size=16).digest())
+        except Exception:
+            return None
+        return hashes
+    
     def _generate_summary(self):
         """전체 비교 요약 생성"""
         summary = {
-            'total_pages': max(len(self.doc1), len(self.doc2)),
+            'total_pages': max(self.comparison_result['file1']['pages'],
+                               self.comparison_result['file2']['pages']),
             'identical_pages': 0,
             'modified_pages': 0,
             'added_pages': 0,
@@ -420,7 +1111,9 @@ class PDFComparator:
             'total_differences': 0,
             'major_differences': 0,
             'minor_differences': 0,
-            'change_types': {}
+            'change_types': {},
+            'compared_pages': len(self.comparison_result['page_comparisons']),
+            'truncated': self.comparison_result.get('truncated', False)
         }
         
         # 페이지별 통계
@@ -467,7 +1160,7 @@ class PDFComparator:
         # JSON 데이터 저장
         json_path = output_dir / "comparison_data.json"
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.comparison_result, f, ensure_ascii=False, indent=2)
+            f.write(dumps_json(self.comparison_result, indent=True))
         
         self.logger.log(f"비교 리포트 생성 완료: {output_dir}")
     
@@ -489,387 +1182,76 @@ class PDFComparator:
             status_text = '경미한 변경사항'
             status_icon = 'ℹ️'
         
-        html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PDF 비교 리포트 - {self.comparison_result['file1']['name']} vs {self.comparison_result['file2']['name']}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', 'Malgun Gothic', sans-serif;
-            background: #f3f4f6;
-            color: #1f2937;
-            line-height: 1.6;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 2rem;
-        }}
-        
-        .header {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            margin-bottom: 2rem;
-        }}
-        
-        .header h1 {{
-            font-size: 2rem;
-            margin-bottom: 1rem;
-            color: #111827;
-        }}
-        
-        .status-banner {{
-            background: {status_color};
-            color: white;
-            padding: 1rem 1.5rem;
-            border-radius: 8px;
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }}
-        
-        .status-icon {{
-            font-size: 1.5rem;
-        }}
-        
-        .file-info {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 2rem;
-            margin-top: 1.5rem;
-        }}
-        
-        .file-card {{
-            background: #f9fafb;
-            padding: 1rem;
-            border-radius: 8px;
-            border: 1px solid #e5e7eb;
-        }}
-        
-        .file-card h3 {{
-            font-size: 0.875rem;
-            color: #6b7280;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .file-card .filename {{
-            font-weight: 600;
-            color: #111827;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 1.5rem;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            text-align: center;
-        }}
-        
-        .stat-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #111827;
-            margin-bottom: 0.25rem;
-        }}
-        
-        .stat-label {{
-            font-size: 0.875rem;
-            color: #6b7280;
-        }}
-        
-        .pages-section {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            margin-bottom: 2rem;
-        }}
-        
-        .pages-section h2 {{
-            font-size: 1.5rem;
-            margin-bottom: 1.5rem;
-            color: #111827;
-        }}
-        
-        .page-item {{
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            background: #f9fafb;
-        }}
-        
-        .page-item.modified {{
-            border-color: #fbbf24;
-            background: #fffbeb;
-        }}
-        
-        .page-item.added {{
-            border-color: #34d399;
-            background: #ecfdf5;
-        }}
-        
-        .page-item.deleted {{
-            border-color: #f87171;
-            background: #fef2f2;
-        }}
-        
-        .page-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .page-number {{
-            font-weight: 600;
-            color: #111827;
-        }}
-        
-        .page-status {{
-            font-size: 0.875rem;
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-            font-weight: 500;
-        }}
-        
-        .status-identical {{ background: #d1fae5; color: #065f46; }}
-        .status-modified {{ background: #fed7aa; color: #92400e; }}
-        .status-added {{ background: #d1fae5; color: #065f46; }}
-        .status-deleted {{ background: #fee2e2; color: #991b1b; }}
-        
-        .diff-list {{
-            margin-top: 1rem;
-            padding-left: 1.5rem;
-        }}
-        
-        .diff-item {{
-            margin-bottom: 0.5rem;
-            color: #4b5563;
-            font-size: 0.875rem;
-        }}
-        
-        .diff-image {{
-            margin-top: 1rem;
-            max-width: 100%;
-            border: 1px solid #e5e7eb;
-            border-radius: 4px;
-        }}
-        
-        .summary-section {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .change-types {{
-            margin-top: 1.5rem;
-        }}
-        
-        .change-type {{
-            display: flex;
-            justify-content: space-between;
-            padding: 0.5rem 0;
-            border-bottom: 1px solid #e5e7eb;
-        }}
-        
-        .similarity-meter {{
-            margin: 2rem 0;
-            text-align: center;
-        }}
-        
-        .similarity-bar {{
-            width: 100%;
-            height: 30px;
-            background: #e5e7eb;
-            border-radius: 15px;
-            overflow: hidden;
-            position: relative;
-        }}
-        
-        .similarity-fill {{
-            height: 100%;
-            background: linear-gradient(to right, #ef4444, #f59e0b, #10b981);
-            width: {summary['similarity_percentage']:.1f}%;
-            transition: width 1s ease;
-        }}
-        
-        .similarity-text {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-weight: 600;
-            color: #111827;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <!-- 헤더 -->
-        <div class="header">
-            <h1>PDF 비교 리포트</h1>
-            
-            <div class="status-banner">
-                <span class="status-icon">{status_icon}</span>
-                <span>{status_text}</span>
-            </div>
-            
-            <div class="file-info">
-                <div class="file-card">
-                    <h3>원본 파일</h3>
-                    <div class="filename">{self.comparison_result['file1']['name']}</div>
-                    <div style="font-size: 0.875rem; color: #6b7280;">
-                        {self.comparison_result['file1']['pages']} 페이지 • {format_file_size(self.comparison_result['file1']['size'])}
-                    </div>
-                </div>
-                <div class="file-card">
-                    <h3>비교 파일</h3>
-                    <div class="filename">{self.comparison_result['file2']['name']}</div>
-                    <div style="font-size: 0.875rem; color: #6b7280;">
-                        {self.comparison_result['file2']['pages']} 페이지 • {format_file_size(self.comparison_result['file2']['size'])}
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 일치율 표시 -->
-        <div class="summary-section">
-            <h2 style="text-align: center; margin-bottom: 1rem;">전체 일치율</h2>
-            <div class="similarity-meter">
-                <div class="similarity-bar">
-                    <div class="similarity-fill"></div>
-                    <div class="similarity-text">{summary['similarity_percentage']:.1f}%</div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- 통계 카드 -->
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-value">{summary['total_pages']}</div>
-                <div class="stat-label">전체 페이지</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value" style="color: #10b981;">{summary['identical_pages']}</div>
-                <div class="stat-label">동일 페이지</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value" style="color: #f59e0b;">{summary['modified_pages']}</div>
-                <div class="stat-label">수정된 페이지</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value" style="color: #ef4444;">{summary['total_differences']}</div>
-                <div class="stat-label">총 차이점</div>
-            </div>
-        </div>
+        file1 = self.comparison_result['file1']
+        file2 = self.comparison_result['file2']
+        similarity = f"{summary['similarity_percentage']:.1f}"
+        
+        # 빠른 실패로 중단된 경우 비교하지 않은 페이지가 있음을 알림
+        truncated_notice = ''
+        if summary['truncated']:
+            truncated_notice = (
+                f'<p style="margin-top: 1rem; color: #b45309;">※ 차이점이 많아 '
+                f'{summary["compared_pages"]}/{summary["total_pages"]}페이지까지만 비교했습니다. '
+                f'나머지 페이지는 일치율에서 동일하지 않은 것으로 계산됩니다.</p>'
+            )
         
-        <!-- 페이지별 상세 -->
-        <div class="pages-section">
-            <h2>페이지별 비교 결과</h2>
-"""
+        parts = [_REPORT_HEADER_TPL.substitute(
+            file1_name=file1['name'],
+            file2_name=file2['name'],
+            file1_pages=file1['pages'],
+            file2_pages=file2['pages'],
+            file1_size=format_file_size(file1['size']),
+            file2_size=format_file_size(file2['size']),
+            status_color=status_color,
+            status_icon=status_icon,
+            status_text=status_text,
+            truncated_notice=truncated_notice,
+            similarity=similarity,
+            total_pages=summary['total_pages'],
+            identical_pages=summary['identical_pages'],
+            modified_pages=summary['modified_pages'],
+            total_differences=summary['total_differences'],
+        )]
         
         # 변경된 페이지만 표시 (최대 20개)
         changed_pages = [p for p in self.comparison_result['page_comparisons'] if p['status'] != 'identical']
         
         for page_comp in changed_pages[:20]:
-            status_class = f"status-{page_comp['status']}"
-            
-            html += f"""
-            <div class="page-item {page_comp['status']}">
-                <div class="page-header">
-                    <div class="page-number">페이지 {page_comp['page']}</div>
-                    <div class="page-status {status_class}">{page_comp['description']}</div>
-                </div>
-"""
+            parts.append(_REPORT_PAGE_TPL.substitute(
+                status=page_comp['status'],
+                page=page_comp['page'],
+                description=page_comp['description'],
+            ))
             
             if page_comp.get('differences'):
-                html += '<div class="diff-list">'
+                parts.append('<div class="diff-list">')
                 for diff in page_comp['differences']:
-                    html += f'<div class="diff-item">• {diff["description"]}</div>'
+                    parts.append(_REPORT_DIFF_ITEM_TPL.substitute(description=diff['description']))
                     
                     # 차이 이미지가 있으면 표시
                     if diff.get('diff_image'):
                         img_path = Path(diff['diff_image'])
                         if img_path.exists():
-                            html += f'<img src="{img_path.name}" class="diff-image" alt="차이점 시각화">'
+                            parts.append(_REPORT_DIFF_IMAGE_TPL.substitute(src=img_path.name))
                 
-                html += '</div>'
+                parts.append('</div>')
             
-            html += '</div>'
+            parts.append('</div>')
         
         if len(changed_pages) > 20:
-            html += f'<p style="text-align: center; color: #6b7280; margin-top: 1rem;">... 외 {len(changed_pages) - 20}개 페이지</p>'
-        
-        html += """
-        </div>
+            parts.append(f'<p style="text-align: center; color: #6b7280; margin-top: 1rem;">... 외 {len(changed_pages) - 20}개 페이지</p>')
         
-        <!-- 변경 유형 요약 -->
-        <div class="summary-section">
-            <h2>변경 유형별 요약</h2>
-            <div class="change-types">
-"""
+        parts.append(_REPORT_CHANGE_TYPES_OPEN)
         
         # 변경 타입별 통계
-        change_type_names = {
-            'page_size': '페이지 크기',
-            'text_content': '텍스트 내용',
-            'text_structure': '텍스트 구조',
-            'visual': '시각적 변경',
-            'image_count': '이미지 수',
-            'image_size': '이미지 크기',
-            'metadata': '메타데이터'
-        }
-        
         for change_type, count in summary['change_types'].items():
-            type_name = change_type_names.get(change_type, change_type)
-            html += f"""
-                <div class="change-type">
-                    <span>{type_name}</span>
-                    <span style="font-weight: 600;">{count}건</span>
-                </div>
-"""
+            type_name = _CHANGE_TYPE_NAMES.get(change_type, change_type)
+            parts.append(_REPORT_CHANGE_TYPE_TPL.substitute(type_name=type_name, count=count))
         
-        html += f"""
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // 페이지 로드 시 애니메이션
-        document.addEventListener('DOMContentLoaded', function() {{
-            const fill = document.querySelector('.similarity-fill');
-            setTimeout(() => {{
-                fill.style.width = '{summary['similarity_percentage']:.1f}%';
-            }}, 100);
-        }});
-    </script>
-</body>
-</html>
-"""
+        parts.append(_REPORT_FOOTER_TPL.substitute(similarity=similarity))
         
-        return html
+        # 문자열 += 반복은 매번 전체를 복사하므로 조각을 모아 한 번에 합침
+        return "".join(parts)
 
 
 # 명령줄 인터페이스를 위한 함수
@@ -917,6 +1299,8 @@ def compare_pdfs_cli(pdf1_path: str, pdf2_path: str, output_dir: str = None):
     print(f"  • 수정: {summary['modified_pages']}페이지")
     print(f"  • 추가: {summary['added_pages']}페이지")
     print(f"  • 삭제: {summary['deleted_pages']}페이지")
+    if summary['truncated']:
+        print(f"  ※ 차이점이 많아 {summary['compared_pages']}페이지까지만 비교했습니다")
     
     print(f"\n🔍 차이점 통계:")
     print(f"  • 총 차이점: {summary['total_differences']}개")
@@ -0,0 +1,395 @@
+# pdf_compare_visual.py - PDF 비교용 픽셀 비교 엔진
+# 페이지 렌더링, 픽셀 차이 계산, 차이 이미지 생성
+
+"""
+pdf_compare_visual.py - PDF 시각적(픽셀) 비교 엔진
+NumPy/PIL(선택적으로 numba/OpenCV)을 사용하는 무거운 코드를 모아 두어
+pdf_comparator는 시각적 비교가 실제로 필요할 때만 이 모듈을 불러옵니다.
+"""
+
+import fitz  # PyMuPDF
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+from PIL import Image
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# numba가 있으면 픽셀 차이 집계를 JIT 컴파일된 병렬 커널로 수행
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# OpenCV가 있으면 연결 영역 검출에 사용 (없으면 scipy.ndimage로 폴백)
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+
+# 페이지마다 새로 할당하지 않고 재사용하는 작업 버퍼 (스레드/워커 프로세스별)
+_scratch = threading.local()
+
+# 필요한 크기가 기존 버퍼보다 이 비율 이상 작으면 버퍼를 새로 만들어 메모리를 돌려줌
+_SCRATCH_MAX_DEVIATION = 0.25
+
+
+def _scratch_buffer(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """
+    이름별로 재사용하는 작업 배열 (내용은 초기화되지 않음)
+    
+    비슷한 크기의 페이지가 이어지면 같은 메모리를 다시 쓰고, 더 큰 페이지가
+    나오거나 크기가 크게 줄면 새로 할당합니다. 반환 배열은 다음 호출에서
+    덮어써지므로 한 페이지 처리 안에서만 사용해야 합니다.
+    """
+    buffers = getattr(_scratch, 'buffers', None)
+    if buffers is None:
+        buffers = _scratch.buffers = {}
+    
+    size = int(np.prod(shape))
+    buf = buffers.get(name)
+    if (buf is None or buf.dtype != dtype or buf.size < size
+            or size < buf.size * (1 - _SCRATCH_MAX_DEVIATION)):
+        buf = buffers[name] = np.empty(size, dtype=dtype)
+    return buf[:size].reshape(shape)
+
+
+def _diff_stats_numpy(arr1: np.ndarray, arr2: np.ndarray, threshold: int,
+                      mask: np.ndarray) -> Tuple[int, np.ndarray]:
+    """
+    픽셀 차이 집계 (NumPy 버전)
+    
+    Args:
+        mask: 결과를 채울 (높이, 너비) bool 배열
+        
+    Returns:
+        tuple: (임계값을 넘는 픽셀 수, mask)
+    """
+    # uint8 그대로 절대 차이를 구해 int16 변환 복사본(원본의 2배 크기)을 만들지 않음
+    diff = _scratch_buffer('diff', arr1.shape, np.uint8)
+    if HAS_CV2:
+        cv2.absdiff(arr1, arr2, dst=diff)
+    else:
+        # |a - b| = max - min
+        np.maximum(arr1, arr2, out=diff)
+        diff -= np.minimum(arr1, arr2)
+    channel_max = _scratch_buffer('channel_max', mask.shape, np.uint8)
+    np.max(diff, axis=2, out=channel_max)
+    np.greater(channel_max, threshold, out=mask)
+    return int(np.count_nonzero(mask)), mask
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _diff_stats(arr1, arr2, threshold, mask):
+        """
+        픽셀 차이 집계 (numba 버전)
+        
+        임계값 비교, 채널 간 최대값, 개수 세기를 한 번의 순회로 처리하여
+        중간 bool 배열(H*W*3)을 만들지 않고 행 단위로 병렬 처리합니다.
+        mask의 모든 칸을 덮어쓰므로 재사용 버퍼를 그대로 넘겨도 됩니다.
+        """
+        height, width, channels = arr1.shape
+        count = 0
+        for y in numba.prange(height):
+            for x in range(width):
+                d = 0
+                for c in range(channels):
+                    # numba에서 int(uint8)은 부호 없는 정수로 남아 뺄셈이 넘침 → int16으로 변환
+                    v = abs(np.int16(arr1[y, x, c]) - np.int16(arr2[y, x, c]))
+                    if v > d:
+                        d = v
+                changed = d > threshold
+                mask[y, x] = changed
+                if changed:
+                    count += 1
+        return count, mask
+else:
+    _diff_stats = _diff_stats_numpy
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """n×n 정규직교 DCT-II 변환 행렬"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix.astype(np.float32)
+
+
+# 지각 해시(pHash)용 32×32 DCT 행렬 (모듈 로드 시 한 번만 계산)
+_DCT_32 = _dct_matrix(32)
+
+
+def _phash(arr: np.ndarray) -> np.ndarray:
+    """
+    렌더링된 페이지의 64비트 지각 해시(pHash)
+    
+    32×32 그레이스케일로 축소 → 2D DCT → 저주파 8×8 계수를 중앙값과 비교한
+    비트열을 8바이트로 압축하여 반환합니다.
+    """
+    gray = arr.mean(axis=2, dtype=np.float32)
+    if HAS_CV2:
+        small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+    else:
+        small = np.asarray(Image.fromarray(gray, mode='F').resize((32, 32), Image.BILINEAR))
+    
+    dct = _DCT_32 @ small @ _DCT_32.T
+    low = dct[:8, :8].flatten()
+    median = np.median(low[1:])  # DC 성분 제외
+    return np.packbits(low > median)
+
+
+def _pixmap_to_array(pix) -> np.ndarray:
+    """
+    Pixmap 샘플 버퍼를 (높이, 너비, 3) uint8 배열로 변환
+    
+    PNG 인코딩/디코딩을 거치지 않고 pix.samples를 그대로 사용합니다.
+    pix.samples는 bytes 복사본이므로 반환 배열은 Pixmap보다 오래 살아도 안전합니다.
+    렌더링은 항상 RGB/알파 없음(n=3)으로 하므로 채널 수를 확인하지 않습니다.
+    """
+    return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.h, pix.w, 3)
+
+
+def _pad_to(arr: np.ndarray, height: int, width: int, name: str) -> np.ndarray:
+    """배열을 지정 크기의 흰색 캔버스(name 작업 버퍼) 왼쪽 위에 배치"""
+    if arr.shape[:2] == (height, width):
+        return arr
+    canvas = _scratch_buffer(name, (height, width, 3), np.uint8)
+    canvas.fill(255)
+    canvas[:arr.shape[0], :arr.shape[1]] = arr
+    return canvas
+
+
+class _PageRenderCache:
+    """
+    렌더링된 페이지 배열의 LRU 캐시
+    
+    키는 (파일 경로, 수정 시각, 페이지 인덱스, DPI)이므로 같은 페이지를
+    다시 비교할 때는 래스터화 없이 배열을 돌려주고, 파일이 바뀌면 자동으로
+    새로 렌더링합니다. 열린 문서는 캐시하지 않으므로 파일 잠금이 남지 않습니다.
+    
+    캐시는 프로세스마다 따로 있으므로 순차 비교(메인 프로세스)에서만 씁니다.
+    병렬 시각 비교의 워커는 비교마다 새로 시작되어 적중할 일이 없으므로 쓰지 않습니다.
+    메인 프로세스에서는 비교가 끝난 뒤 PDFComparator.clear_caches()로 비웁니다.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._matrices = {}  # DPI → fitz.Matrix (페이지마다 새로 만들지 않음)
+    
+    def render(self, page, dpi: int, cached: bool = True) -> np.ndarray:
+        """페이지를 지정 DPI로 렌더링 (cached이면 캐시 적중 시 재사용)"""
+        path = page.parent.name
+        mtime = None  # None이면 캐시를 보지도 채우지도 않음
+        if cached:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                pass  # 메모리 문서 등 - 캐시하지 않음
+        key = (path, mtime, page.number, dpi)
+        
+        if mtime is not None:
+            with self._lock:
+                arr = self._items.get(key)
+                if arr is not None:
+                    self._items.move_to_end(key)
+                    return arr
+        
+        matrix = self._matrices.get(dpi)
+        if matrix is None:
+            zoom = dpi / 72.0
+            matrix = self._matrices[dpi] = fitz.Matrix(zoom, zoom)
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+        arr = _pixmap_to_array(pix)
+        pix = None  # 샘플은 복사되었으므로 Pixmap 버퍼는 바로 해제
+        
+        if mtime is not None:
+            with self._lock:
+                self._items[key] = arr
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+        return arr
+    
+    def clear(self):
+        """캐시된 배열 모두 해제"""
+        with self._lock:
+            self._items.clear()
+
+
+# 150 DPI A4 한 장이 약 6.5MB이므로 16장(약 100MB)까지만 보관
+_render_cache = _PageRenderCache(maxsize=16)
+
+# 차이 이미지(PNG) 저장용 스레드 풀 - zlib 압축과 디스크 쓰기를 다음 페이지 처리와 겹침
+_io_pool = ThreadPoolExecutor(max_workers=4)
+
+
+def visual_diff(page1, page2, page_num: int, settings: Dict, output_dir: Path,
+                 pending_saves: Optional[List] = None, use_cache: bool = True) -> Optional[Dict]:
+    """
+    두 페이지의 시각적 비교 (픽셀 단위)
+    
+    PDFComparator._compare_visual과 프로세스 풀 워커가 함께 사용합니다.
+    반환값은 피클 가능한 dict입니다.
+    
+    pending_saves 리스트를 넘기면 차이 이미지는 백그라운드에서 저장되고
+    해당 Future가 리스트에 추가됩니다. 호출자는 리포트를 만들기 전에 기다려야 합니다.
+    use_cache가 False이면 렌더링 캐시를 쓰지 않습니다 (프로세스 풀 워커).
+    """
+    threshold = settings['pixel_threshold']
+    
+    # 페이지를 이미지로 렌더링 (같은 페이지를 다시 비교하면 캐시 재사용)
+    dpi = settings['comparison_dpi']
+    arr1 = _render_cache.render(page1, dpi, use_cache)
+    arr2 = _render_cache.render(page2, dpi, use_cache)
+    
+    # 크기가 다른 경우 더 큰 크기에 맞춤
+    if arr1.shape != arr2.shape:
+        height = max(arr1.shape[0], arr2.shape[0])
+        width = max(arr1.shape[1], arr2.shape[1])
+        arr1 = _pad_to(arr1, height, width, 'pad1')
+        arr2 = _pad_to(arr2, height, width, 'pad2')
+    
+    # 지각 해시가 완전히 같으면 전체 해상도 픽셀 비교를 건너뜀 (선택 사항)
+    if settings.get('phash_prescreen') and np.array_equal(_phash(arr1), _phash(arr2)):
+        return None
+    
+    # 차이 계산 - 임계값을 넘는 픽셀 수와 마스크를 한 번에 구함
+    mask = _scratch_buffer('mask', arr1.shape[:2], np.bool_)
+    changed_pixels, mask = _diff_stats(arr1, arr2, threshold, mask)
+    
+    # 임계값을 넘는 차이가 없으면 동일한 페이지
+    if changed_pixels == 0:
+        return None
+    
+    rows = np.where(mask.any(axis=1))[0]
+    cols = np.where(mask.any(axis=0))[0]
+    bbox = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+    
+    # 차이점 하이라이트 이미지 생성 및 저장 (PIL 변환은 저장 시에만)
+    diff_highlighted = _create_diff_visualization(arr2, mask)
+    # QA용 결과물이므로 압축률보다 속도 우선 (기본값 6은 deflate에 대부분의 시간을 씀)
+    diff_path = Path(output_dir) / f"page_{page_num}_diff.png"
+    if pending_saves is None:
+        diff_highlighted.save(diff_path, compress_level=1)
+    else:
+        pending_saves.append(
+            _io_pool.submit(diff_highlighted.save, diff_path, compress_level=1)
+        )
+    
+    # 차이 영역 계산 (변경된 픽셀 / 전체 픽셀)
+    total_pixels = mask.shape[0] * mask.shape[1]
+    change_percentage = (changed_pixels / total_pixels) * 100
+    
+    return {
+        'type': 'visual',
+        'severity': 'major' if change_percentage > 10 else 'minor',
+        'description': f"시각적 차이 {change_percentage:.1f}% 감지",
+        'change_percentage': float(change_percentage),
+        'diff_image': str(diff_path),
+        'bbox': bbox
+    }
+
+
+def _find_diff_regions(mask: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """
+    변경 마스크에서 연결된 영역(8방향)의 경계 상자 목록 추출
+    
+    Returns:
+        list: [(x, y, 너비, 높이), ...]
+    """
+    if HAS_CV2:
+        # 한 번의 C++ 패스로 라벨링과 경계 상자 계산
+        num, _, stats, _ = cv2.connectedComponentsWithStats(
+            mask.astype(np.uint8), connectivity=8
+        )
+        return [tuple(int(v) for v in stats[i, :4]) for i in range(1, num)]
+    
+    from scipy import ndimage
+    labeled, _ = ndimage.label(mask, structure=np.ones((3, 3), dtype=bool))
+    return [
+        (sl[1].start, sl[0].start, sl[1].stop - sl[1].start, sl[0].stop - sl[0].start)
+        for sl in ndimage.find_objects(labeled)
+    ]
+
+
+def _fill_rect(out: np.ndarray, x0: int, y0: int, x1: int, y1: int, color: Tuple[int, int, int]):
+    """배열의 [y0, y1) × [x0, x1) 영역을 색으로 채움 (이미지 밖은 잘라냄)"""
+    height, width = out.shape[:2]
+    x0, x1 = max(x0, 0), min(x1, width)
+    y0, y1 = max(y0, 0), min(y1, height)
+    if x0 < x1 and y0 < y1:
+        out[y0:y1, x0:x1] = color
+
+
+def _create_diff_visualization(arr2: np.ndarray, mask: np.ndarray,
+                               color: Tuple[int, int, int] = (255, 0, 0),
+                               margin: int = 5, line_width: int = 3) -> Image:
+    """
+    차이점 시각화 이미지 생성
+    
+    새 버전(arr2) 복사본에 변경 영역 테두리를 직접 그린 뒤, 저장을 위해
+    마지막에 한 번만 PIL 이미지로 감쌉니다.
+    """
+    result = arr2.copy()
+    
+    # 변경된 영역을 사각형 테두리로 표시 (영역보다 margin만큼 크게)
+    for x, y, w, h in _find_diff_regions(mask):
+        left, top = x - margin, y - margin
+        right, bottom = x + w - 1 + margin, y + h - 1 + margin
+        
+        _fill_rect(result, left, top, right + 1, top + line_width, color)            # 위
+        _fill_rect(result, left, bottom - line_width + 1, right + 1, bottom + 1, color)  # 아래
+        _fill_rect(result, left, top, left + line_width, bottom + 1, color)          # 왼쪽
+        _fill_rect(result, right - line_width + 1, top, right + 1, bottom + 1, color)    # 오른쪽
+    
+    return Image.fromarray(result)
+
+
+def visual_range(pdf_path1: str, pdf_path2: str, page_indices: List[int],
+                 settings: Dict, output_dir: str) -> List[Tuple[int, Optional[Dict]]]:
+    """
+    프로세스 풀 워커 - 여러 페이지의 시각적 비교
+    
+    fitz.Document는 피클할 수 없으므로 워커 안에서 두 PDF를 직접 엽니다.
+    페이지 묶음 단위로 받아 문서 열기 비용을 페이지마다 반복하지 않습니다.
+    워커는 비교마다 새로 시작되므로 렌더링 캐시는 쓰지 않습니다.
+    
+    Args:
+        pdf_path1, pdf_path2: 원본/비교 PDF 경로
+        page_indices: 비교할 페이지 인덱스 목록
+        settings: 비교 설정
+        output_dir: 차이 이미지 저장 폴더
+        
+    Returns:
+        list: [(page_index, 시각적 차이 dict 또는 None), ...]
+    """
+    doc1 = fitz.open(pdf_path1)
+    doc2 = fitz.open(pdf_path2)
+    pending_saves = []
+    try:
+        return [
+            (page_index, visual_diff(
+                doc1[page_index], doc2[page_index], page_index + 1, settings, output_dir,
+                pending_saves, use_cache=False
+            ))
+            for page_index in page_indices
+        ]
+    finally:
+        doc1.close()
+        doc2.close()
+        # 메인 프로세스가 리포트를 만들 때 이미지 파일이 있어야 하므로 저장 완료 대기
+        for future in pending_saves:
+            future.result()
+
+
+def clear_render_cache():
+    """렌더링 캐시에 보관된 페이지 배열 모두 해제"""
+    _render_cache.clear()
@@ -10,13 +10,36 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import threading
+import queue
 import webbrowser
-from datetime import datetime
+import hashlib
+import json
+import os
 
-# 프로젝트 모듈
-from pdf_comparator import PDFComparator
+# 프로젝트 모듈 (PDFComparator는 비교를 실행할 때 불러옴)
 from config import Config
 from simple_logger import SimpleLogger
+from utils import dumps_json, unique_timestamp
+
+# 비교 해상도 선택지 (렌더링 비용은 DPI²에 비례하므로 300 DPI는 제외)
+COMPARISON_DPI_CHOICES = [100, 120, 150, 200]
+DEFAULT_COMPARISON_DPI = 120
+
+# 한 페이지 렌더링 픽셀 수 상한 - 넘으면 최저 해상도로 낮춤 (대형 판형 대비)
+MAX_RENDER_PIXELS = 8_000_000
+
+# 첫 페이지에서 이미지가 이 비율 이상을 덮으면 스캔 문서로 보고 최저 해상도로 비교
+SCANNED_IMAGE_COVERAGE = 0.8
+
+# 빠른 실패 모드에서 비교를 멈추는 차이점 수 (끄면 PDFComparator 기본값 사용)
+FAST_FAIL_MAX_DIFFERENCES = 20
+
+# 비교 스레드 메시지 큐를 비우고 화면을 갱신하는 간격 (ms)
+UI_POLL_MS = 50
+
+# 비교 결과 캐시 (같은 두 파일을 같은 설정으로 다시 비교하면 재사용)
+COMPARE_CACHE_DIR = Config.REPORTS_PATH / "compare_cache"
+COMPARE_CACHE_MAX_ENTRIES = 20
 
 
 class PDFComparisonWindow:
@@ -45,6 +68,14 @@ class PDFComparisonWindow:
         self.is_comparing = False
         self.comparison_result = None
         
+        # 비교 스레드 → GUI 메시지 전달
+        # ('progress', 완료 페이지 수, 전체 페이지 수) / ('note', 알림) / ('done', 결과) / ('error', 메시지)
+        self._msg_q = queue.Queue()
+        self._progress_note = ""  # 진행률 옆에 함께 보여줄 알림 (해상도 조정 등)
+        
+        # 창을 닫으면 진행 중인 비교를 중단하기 위한 신호
+        self._cancel = threading.Event()
+        
         # 로거
         self.logger = SimpleLogger()
         
@@ -53,6 +84,14 @@ class PDFComparisonWindow:
         
         # 창 중앙 배치
         self._center_window()
+        
+        # 제목 표시줄의 닫기 버튼도 비교 취소 후 닫기
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+    
+    def _close(self):
+        """창 닫기 - 진행 중인 비교가 있으면 취소 요청"""
+        self._cancel.set()
+        self.window.destroy()
     
     def _center_window(self):
         """창을 화면 중앙에 배치"""
@@ -151,24 +190,32 @@ class PDFComparisonWindow:
         
         # DPI 설정
         ttk.Label(option_frame, text="비교 해상도:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
-        self.comparison_dpi = tk.IntVar(value=150)
+        self.comparison_dpi = tk.IntVar(value=DEFAULT_COMPARISON_DPI)
         dpi_combo = ttk.Combobox(
             option_frame,
             textvariable=self.comparison_dpi,
-            values=[100, 150, 200, 300],
+            values=COMPARISON_DPI_CHOICES,
             state='readonly',
             width=10
         )
         dpi_combo.grid(row=1, column=1, sticky=tk.W, pady=(10, 0))
         ttk.Label(option_frame, text="DPI").grid(row=1, column=2, sticky=tk.W, pady=(10, 0))
         
+        # 빠른 실패 모드 - 차이점이 어느 정도 쌓이면 남은 페이지는 비교하지 않음
+        self.fast_fail = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            option_frame,
+            text=f"빠른 실패 모드 (차이점 {FAST_FAIL_MAX_DIFFERENCES}개에서 중단)",
+            variable=self.fast_fail
+        ).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+        
         # 진행률 표시
         self.progress_frame = ttk.Frame(main_frame)
         self.progress_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         self.progress_frame.columnconfigure(0, weight=1)
         
         self.progress_label = ttk.Label(self.progress_frame, text="")
-        self.progress_bar = ttk.Progressbar(self.progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(self.progress_frame, mode='determinate')
         
         # 버튼들
         button_frame = ttk.Frame(main_frame)
@@ -194,7 +241,7 @@ class PDFComparisonWindow:
         ttk.Button(
             button_frame,
             text="❌ 닫기",
-            command=self.window.destroy,
+            command=self._close,
             width=20
         ).pack(side=tk.LEFT, padx=5)
     
@@ -224,6 +271,7 @@ class PDFComparisonWindow:
         
         # UI 업데이트
         self.is_comparing = True
+        self._cancel.clear()
         self.compare_button.config(state='disabled')
         self.report_button.config(state='disabled')
         
@@ -231,7 +279,9 @@ class PDFComparisonWindow:
         self.progress_label.grid(row=0, column=0, pady=(0, 5))
         self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         self.progress_label.config(text="비교 분석 중...")
-        self.progress_bar.start()
+        self.progress_bar.config(value=0, maximum=1)
+        self._progress_note = ""
+        self.window.after(UI_POLL_MS, self._pump)
         
         # 별도 스레드에서 비교 실행
         compare_thread = threading.Thread(target=self._run_comparison)
@@ -240,44 +290,211 @@ class PDFComparisonWindow:
     
     def _run_comparison(self):
         """실제 비교 작업 (스레드)"""
+        comparator = None
         try:
-            # 비교기 생성
+            # 비교기 생성 - 창을 열기만 할 때는 비교 엔진을 불러오지 않음
+            from pdf_comparator import PDFComparator
             comparator = PDFComparator()
             
+            # 경로는 한 번만 만들어 재사용
+            orig_p = Path(self.original_path.get())
+            mod_p = Path(self.modified_path.get())
+            
             # 설정 적용
             comparator.settings['text_compare'] = self.text_compare.get()
             comparator.settings['image_compare'] = self.image_compare.get()
             comparator.settings['visual_compare'] = self.visual_compare.get()
-            comparator.settings['comparison_dpi'] = self.comparison_dpi.get()
+            if self.fast_fail.get():
+                comparator.settings['max_differences'] = FAST_FAIL_MAX_DIFFERENCES
+            comparator.settings['comparison_dpi'] = self._capped_dpi(
+                (orig_p, mod_p), self.comparison_dpi.get()
+            )
+            
+            # 같은 파일/설정의 이전 결과가 있으면 비교 없이 재사용
+            cache_key = self._comparison_cache_key(orig_p, mod_p, comparator.settings)
+            cached = self._load_cached_result(cache_key)
+            if cached is not None:
+                self.logger.log("이전 비교 결과 재사용: %s", cached['output_dir'])
+                self._msg_q.put(('done', cached))
+                return
             
             # 출력 디렉토리 생성
-            output_dir = Config.REPORTS_PATH / f"compare_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_dir = Config.REPORTS_PATH / f"compare_{unique_timestamp()}"
             
             # 비교 실행
-            self.logger.log(f"PDF 비교 시작: {Path(self.original_path.get()).name} vs {Path(self.modified_path.get()).name}")
+            self.logger.log("PDF 비교 시작: %s vs %s", orig_p.name, mod_p.name)
             
             result = comparator.compare(
-                Path(self.original_path.get()),
-                Path(self.modified_path.get()),
-                output_dir
+                orig_p,
+                mod_p,
+                output_dir,
+                progress_cb=lambda done, total: self._msg_q.put(('progress', done, total)),
+                cancel_event=self._cancel
             )
             
             if 'error' in result:
                 raise Exception(result['error'])
             
-            self.comparison_result = result
+            self._store_cached_result(cache_key, result)
             
-            # UI 업데이트
-            self.window.after(0, self._comparison_complete)
+            # UI 업데이트 (UI 스레드의 _pump가 처리)
+            self._msg_q.put(('done', result))
             
         except Exception as e:
             self.logger.error(f"비교 중 오류: {str(e)}")
-            self.window.after(0, lambda: self._comparison_error(str(e)))
+            self._msg_q.put(('error', str(e)))
+        finally:
+            # 렌더링한 페이지 배열을 창이 열려 있는 동안 붙잡고 있지 않도록 해제
+            if comparator is not None:
+                comparator.clear_caches()
+    
+    def _comparison_cache_key(self, path1: Path, path2: Path, settings: dict) -> str:
+        """
+        비교 결과 캐시 키 생성
+        
+        파일 내용을 읽지 않고 경로/크기/수정 시각과 비교 설정으로 만듭니다.
+        파일이 바뀌면 수정 시각이 달라지므로 자동으로 새로 비교합니다.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for path in (path1, path2):
+            stat = path.stat()
+            h.update(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8'))
+        h.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+        return h.hexdigest()
+    
+    def _load_cached_result(self, cache_key: str):
+        """
+        캐시된 비교 결과 읽기
+        
+        Returns:
+            dict 또는 None - 캐시가 없거나 리포트 폴더가 지워졌으면 None
+        """
+        cache_file = COMPARE_CACHE_DIR / f"{cache_key}.json"
+        try:
+            result = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        # 리포트가 삭제되었으면 결과만으로는 보여줄 수 없으므로 다시 비교
+        if not (Path(result['output_dir']) / "comparison_report.html").exists():
+            return None
+        
+        os.utime(cache_file)  # 최근 사용 표시 (오래된 항목부터 정리)
+        return result
+    
+    def _store_cached_result(self, cache_key: str, result: dict):
+        """비교 결과를 캐시에 저장하고 오래된 항목 정리"""
+        try:
+            COMPARE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (COMPARE_CACHE_DIR / f"{cache_key}.json").write_text(
+                dumps_json(result), encoding='utf-8'
+            )
+            
+            entries = sorted(COMPARE_CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+            for old in entries[:-COMPARE_CACHE_MAX_ENTRIES]:
+                old.unlink()
+        except OSError as e:
+            # 캐시는 부가 기능이므로 실패해도 비교 결과에는 영향 없음
+            self.logger.log(f"비교 결과 캐시 저장 실패: {str(e)}")
+    
+    def _capped_dpi(self, pdf_paths, dpi: int) -> int:
+        """
+        렌더링 전에 두 파일의 첫 페이지만 살펴보고 비교 해상도 제한
+        
+        대형 판형(MAX_RENDER_PIXELS 초과)이거나 이미지가 페이지 대부분을 덮는
+        스캔 문서는 선택한 DPI로 렌더링하면 오래 걸리므로 최저 해상도로 낮추고
+        진행 표시줄에 알립니다. 페이지 내용은 읽지 않으므로 금방 끝납니다.
+        
+        Args:
+            pdf_paths: (원본 경로, 수정본 경로)
+            dpi: 사용자가 선택한 DPI
+            
+        Returns:
+            int: 실제로 사용할 DPI
+        """
+        capped = COMPARISON_DPI_CHOICES[0]
+        if capped >= dpi:
+            return dpi
+        
+        # PyMuPDF는 여기서만 쓰므로 창을 열 때가 아니라 비교를 시작할 때 불러옴
+        import fitz
+        
+        scale = dpi / 72.0
+        for pdf_path in pdf_paths:
+            try:
+                with fitz.open(pdf_path) as doc:
+                    if doc.page_count == 0:
+                        continue
+                    page = doc[0]
+                    rect = page.rect
+                    page_area = abs(rect)
+                    image_area = sum(
+                        abs(fitz.Rect(info['bbox']) & rect) for info in page.get_image_info()
+                    )
+                    page_count = doc.page_count
+            except Exception:
+                continue  # 열기 실패는 비교 단계에서 오류로 보고됨
+            
+            if page_area * scale * scale > MAX_RENDER_PIXELS:
+                reason = "페이지가 커서"
+            elif page_area and image_area / page_area >= SCANNED_IMAGE_COVERAGE:
+                reason = f"스캔 문서로 보여서 ({page_count}페이지)"
+            else:
+                continue
+            
+            note = f"{reason} 비교 해상도를 {dpi} → {capped} DPI로 낮춥니다"
+            self.logger.log(f"{pdf_path.name}: {note}")
+            self._msg_q.put(('note', note))
+            return capped
+        return dpi
+    
+    def _pump(self):
+        """
+        비교 스레드 메시지를 한 번에 처리 (UI 스레드)
+        
+        비교 스레드는 큐에 넣기만 하고, 여기서 주기마다 쌓인 메시지를 모두 꺼내
+        진행률은 마지막 값만 한 번 반영합니다. 완료/오류 메시지가 오면 폴링을 멈춥니다.
+        """
+        if self._cancel.is_set():
+            return  # 창이 닫힘 - 더 이상 위젯을 갱신하지 않음
+        
+        progress = None
+        final = None
+        try:
+            while True:
+                msg = self._msg_q.get_nowait()
+                if msg[0] == 'progress':
+                    progress = msg
+                elif msg[0] == 'note':
+                    self._progress_note = msg[1]
+                    self.progress_label.config(text=f"비교 분석 중... ({msg[1]})")
+                else:
+                    final = msg
+        except queue.Empty:
+            pass
+        
+        if final is not None:
+            if final[0] == 'done':
+                self.comparison_result = final[1]
+                self._comparison_complete()
+            else:
+                self._comparison_error(final[1])
+            return
+        
+        if progress is not None:
+            _, done, total = progress
+            self.progress_bar.config(maximum=max(total, 1), value=done)
+            text = f"비교 분석 중... ({done}/{total} 페이지)"
+            if self._progress_note:
+                text += f" - {self._progress_note}"
+            self.progress_label.config(text=text)
+        
+        if self.is_comparing:
+            self.window.after(UI_POLL_MS, self._pump)
     
     def _comparison_complete(self):
         """비교 완료 처리"""
         self.is_comparing = False
-        self.progress_bar.stop()
         self.progress_bar.grid_remove()
         self.progress_label.grid_remove()
         
@@ -296,13 +513,16 @@ class PDFComparisonWindow:
 
 리포트가 생성되었습니다."""
         
+        if self.comparison_result.get('truncated'):
+            compared = len(self.comparison_result['page_comparisons'])
+            result_text += f"\n\n※ 차이점이 많아 {compared}페이지까지만 비교했습니다."
+        
         # 결과 창 표시
         self._show_result_dialog(result_text)
     
     def _comparison_error(self, error_msg):
         """비교 오류 처리"""
         self.is_comparing = False
-        self.progress_bar.stop()
         self.progress_bar.grid_remove()
         self.progress_label.grid_remove()
         
@@ -6,32 +6,124 @@ pdf_fixer.py - PDF 자동 수정 모듈
 분석된 문제점을 자동으로 수정하는 기능 제공
 """
 
+import os
 import shutil
+import functools
+import importlib.util
 from pathlib import Path
-from datetime import datetime
-import json
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
+
+import fitz  # PyMuPDF
 
 # 프로젝트 모듈
 from config import Config
 from simple_logger import SimpleLogger
+from utils import loads_json, unique_timestamp, count_unembedded_fonts
 
-# 수정 모듈들 (구현 예정)
-try:
-    from color_converter import ColorConverter
-    HAS_COLOR_CONVERTER = True
-except ImportError:
-    HAS_COLOR_CONVERTER = False
+# 수정 모듈들 - 존재 여부만 미리 확인하고, 실제 수정이 필요할 때 처음 불러옴
+HAS_COLOR_CONVERTER = importlib.util.find_spec('color_converter') is not None
+if not HAS_COLOR_CONVERTER:
     print("경고: color_converter 모듈을 찾을 수 없습니다.")
 
-try:
-    from font_handler import FontHandler
-    HAS_FONT_HANDLER = True
-except ImportError:
-    HAS_FONT_HANDLER = False
+HAS_FONT_HANDLER = importlib.util.find_spec('font_handler') is not None
+if not HAS_FONT_HANDLER:
     print("경고: font_handler 모듈을 찾을 수 없습니다.")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_color_converter():
+    """ColorConverter 지연 생성 (프로세스당 하나, 모듈이 없으면 None)"""
+    if not HAS_COLOR_CONVERTER:
+        return None
+    try:
+        from color_converter import ColorConverter
+    except ImportError:
+        return None
+    return ColorConverter()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font_handler():
+    """FontHandler 지연 생성 (프로세스당 하나, 모듈이 없으면 None)"""
+    if not HAS_FONT_HANDLER:
+        return None
+    try:
+        from font_handler import FontHandler
+    except ImportError:
+        return None
+    return FontHandler()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_settings_file(path: str, mtime_ns: int) -> Dict:
+    """
+    설정 파일 파싱 결과 캐시
+    
+    수정 시각을 키에 포함하므로 파일이 바뀌면 자동으로 다시 읽습니다.
+    배치 작업에서 파일마다 PDFFixer를 만들어도 파싱은 한 번만 합니다.
+    """
+    return loads_json(Path(path).read_bytes())
+
+
+# 백업 복사용 스레드 (I/O 대기 중에는 GIL이 풀려 수정 작업과 동시에 진행)
+_backup_pool = ThreadPoolExecutor(max_workers=1)
+
+
+def _copy_file_fast(src: Path, dst: Path):
+    """
+    메타데이터를 포함한 파일 복사 (shutil.copy2 대체)
+    
+    Linux에서는 os.copy_file_range로 커널 안에서 복사하여
+    (Btrfs/XFS 등에서는 reflink로 즉시 완료) 사용자 공간 버퍼를 거치지 않습니다.
+    지원하지 않는 환경이면 shutil.copyfile(sendfile/fcopyfile 사용)로 대체합니다.
+    
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                copied = remaining == 0
+        except OSError:
+            copied = False  # 파일 시스템 간 복사 거부 등 - 일반 복사로 대체
+    
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+# 일괄 수정 워커 프로세스마다 하나씩 만드는 PDFFixer
+_worker_fixer = None
+
+
+def _init_fix_worker(settings: Dict):
+    """
+    일괄 수정 워커 초기화 (프로세스당 한 번)
+    
+    설정을 받아 PDFFixer를 만들고 색상/폰트 변환 모듈도 미리 생성해
+    파일마다 초기화 비용을 반복하지 않습니다.
+    """
+    global _worker_fixer
+    _worker_fixer = PDFFixer(settings)
+    _get_color_converter()
+    _get_font_handler()
+
+
+def _fix_in_worker(job: Tuple[str, Dict]) -> Dict:
+    """일괄 수정 워커 - 파일 하나 수정"""
+    return _worker_fixer._fix_job(*job)
+
+
 class PDFFixer:
     """PDF 자동 수정 클래스"""
     
@@ -51,15 +143,21 @@ class PDFFixer:
         else:
             self.settings = self._load_settings(settings_path)
         
-        # 수정 모듈 초기화
-        self.color_converter = ColorConverter() if HAS_COLOR_CONVERTER else None
-        self.font_handler = FontHandler() if HAS_FONT_HANDLER else None
-        
         # 백업 폴더 확인
         self.backup_folder = Config.OUTPUT_PATH / Config.BACKUP_FOLDER
         self.fixed_folder = Config.OUTPUT_PATH / Config.FIXED_FOLDER
         self._ensure_folders()
     
+    @property
+    def color_converter(self):
+        """색상 변환 모듈 (처음 사용할 때 불러옴)"""
+        return _get_color_converter()
+    
+    @property
+    def font_handler(self):
+        """폰트 처리 모듈 (처음 사용할 때 불러옴)"""
+        return _get_font_handler()
+    
     def _load_settings(self, settings_path: str) -> Dict:
         """
         설정 파일 로드
@@ -74,10 +172,11 @@ class PDFFixer:
         
         if settings_file.exists():
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    self.logger.log(f"설정 파일 로드됨: {settings_path}")
-                    return settings
+                mtime_ns = settings_file.stat().st_mtime_ns
+                # 캐시된 dict를 인스턴스마다 수정하지 않도록 복사본 반환
+                settings = dict(_read_settings_file(str(settings_file.resolve()), mtime_ns))
+                self.logger.log(f"설정 파일 로드됨: {settings_path}")
+                return settings
             except Exception as e:
                 self.logger.error(f"설정 파일 로드 실패: {e}")
         
@@ -110,7 +209,7 @@ class PDFFixer:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
         
-        self.logger.log(f"자동 수정 시작: {pdf_path.name}")
+        self.logger.log("자동 수정 시작: %s", pdf_path.name)
         
         # 결과 초기화
         result = {
@@ -121,24 +220,18 @@ class PDFFixer:
             'errors': []
         }
         
-        # 1. 백업 생성 (항상)
+        # 1. 백업 생성 (항상) - 디스크 복사는 백그라운드에서 수행하고 수정 작업과 겹침
+        #    (수정 결과는 별도 파일로만 쓰므로 백업 중에도 원본은 바뀌지 않음)
+        backup_future = None
         if self.settings.get('always_backup', True):
-            try:
-                backup_path = self._create_backup(pdf_path)
-                result['backup'] = str(backup_path)
-                self.logger.log(f"백업 생성 완료: {backup_path.name}")
-            except Exception as e:
-                error_msg = f"백업 생성 실패: {str(e)}"
-                self.logger.error(error_msg)
-                result['errors'].append(error_msg)
-                # 백업 실패시 중단
-                return result
+            backup_future = _backup_pool.submit(self._create_backup, pdf_path)
         
         # 2. 수정이 필요한지 확인
         modifications_needed = self._check_modifications_needed(analysis_result)
         
         if not modifications_needed:
             self.logger.log("수정이 필요한 문제가 없습니다.")
+            self._collect_backup(backup_future, result)
             return result
         
         # 3. 수정 작업 수행
@@ -146,8 +239,24 @@ class PDFFixer:
         temp_paths = []  # 임시 파일 추적용
         
         try:
+            # 색상 변환과 아웃라인 변환이 모두 필요하면 한 번의 읽기/쓰기로 처리
+            fused = False
+            if ('rgb_to_cmyk' in modifications_needed and 'font_outline' in modifications_needed
+                    and self.color_converter and self.font_handler):
+                self.logger.log("RGB→CMYK 색상 변환 및 폰트 아웃라인 변환 중...")
+                temp_path = self._get_temp_path(current_path, "fixed")
+                
+                if self._fused_fix(current_path, temp_path):
+                    fused = True
+                    current_path = temp_path
+                    temp_paths.append(temp_path)
+                    result['modifications'].extend(['RGB→CMYK 변환', '폰트 아웃라인 변환'])
+                    self.logger.log("색상 변환 및 폰트 아웃라인 변환 완료")
+                else:
+                    self.logger.log("통합 변환 실패 - 단계별 변환으로 재시도")
+            
             # RGB→CMYK 변환
-            if 'rgb_to_cmyk' in modifications_needed:
+            if 'rgb_to_cmyk' in modifications_needed and not fused:
                 if self.color_converter:
                     self.logger.log("RGB→CMYK 색상 변환 중...")
                     
@@ -173,7 +282,7 @@ class PDFFixer:
                     result['errors'].append("색상 변환 모듈을 사용할 수 없습니다")
             
             # 폰트 아웃라인 변환
-            if 'font_outline' in modifications_needed:
+            if 'font_outline' in modifications_needed and not fused:
                 if self.font_handler:
                     self.logger.log("폰트 아웃라인 변환 중...")
                     
@@ -201,7 +310,7 @@ class PDFFixer:
             # 4. 최종 파일 저장
             if result['modifications']:
                 # 수정된 파일을 fixed 폴더로 이동
-                fixed_path = self._save_fixed_file(current_path, pdf_path.name)
+                fixed_path = self._save_fixed_file(current_path, pdf_path)
                 result['fixed'] = str(fixed_path)
                 
                 # 임시 파일 정리
@@ -211,7 +320,7 @@ class PDFFixer:
                     except:
                         pass
                 
-                self.logger.log(f"자동 수정 완료: {', '.join(result['modifications'])}")
+                self.logger.log("자동 수정 완료: %s", ', '.join(result['modifications']))
             
         except Exception as e:
             error_msg = f"자동 수정 중 오류 발생: {str(e)}"
@@ -226,8 +335,124 @@ class PDFFixer:
                 except:
                     pass
         
+        # 백업 완료 대기
+        self._collect_backup(backup_future, result)
+        
         return result
     
+    def fix_batch(self, jobs: List[Tuple[Union[str, Path], Dict]]) -> List[Dict]:
+        """
+        여러 PDF를 프로세스 풀로 나눠 수정
+        
+        색상 변환/폰트 아웃라인은 CPU 작업이라 코어 수만큼 나눠 처리합니다.
+        워커마다 현재 설정으로 PDFFixer와 변환 모듈을 한 번만 만듭니다.
+        
+        Args:
+            jobs: [(PDF 경로, PDFAnalyzer 분석 결과), ...]
+            
+        Returns:
+            jobs와 같은 순서의 수정 결과 딕셔너리 목록
+        """
+        jobs = [(str(pdf_path), analysis_result) for pdf_path, analysis_result in jobs]
+        workers = min(os.cpu_count() or 1, len(jobs))
+        
+        if workers > 1:
+            try:
+                # spawn: 부모의 백업 스레드 풀 등을 fork로 물려받지 않도록 (Windows와 동일)
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_fix_worker,
+                                         initargs=(self.settings,)) as executor:
+                    chunksize = max(1, len(jobs) // (workers * 4))
+                    return list(executor.map(_fix_in_worker, jobs, chunksize=chunksize))
+            except Exception as e:
+                # 프로세스 생성 실패 등 - 순차 처리로 폴백
+                self.logger.log("병렬 수정 실패, 순차 처리로 전환: %s", str(e))
+        
+        return [self._fix_job(pdf_path, analysis_result) for pdf_path, analysis_result in jobs]
+    
+    def _fix_job(self, pdf_path: str, analysis_result: Dict) -> Dict:
+        """일괄 수정 한 건 - 예외가 나도 나머지 파일은 계속 처리하도록 결과에 기록"""
+        try:
+            return self.fix_pdf(pdf_path, analysis_result)
+        except Exception as e:
+            self.logger.error(f"자동 수정 실패: {str(e)}")
+            return {
+                'original': pdf_path,
+                'fixed': None,
+                'backup': None,
+                'modifications': [],
+                'errors': [str(e)]
+            }
+    
+    def _count_unembedded(self, analysis_result: Dict) -> int:
+        """
+        미임베딩 폰트 수
+        
+        _check_modifications_needed와 get_fixable_issues, 프리플라이트 규칙이
+        같은 기준으로 세도록 utils.count_unembedded_fonts를 함께 씁니다.
+        
+        Args:
+            analysis_result: 분석 결과
+            
+        Returns:
+            미임베딩 폰트 수
+        """
+        return count_unembedded_fonts(analysis_result)
+    
+    def _fused_fix(self, input_path: Path, output_path: Path) -> bool:
+        """
+        RGB→CMYK 변환과 폰트 아웃라인 변환을 한 번에 수행
+        
+        단계별로 처리하면 중간 PDF를 저장했다가 다시 파싱해야 하므로,
+        원본을 한 번만 열고 페이지마다 두 변환을 적용한 뒤 한 번만 저장합니다.
+        
+        Args:
+            input_path: 입력 PDF 경로
+            output_path: 출력 PDF 경로
+            
+        Returns:
+            성공 여부
+        """
+        src_doc = None
+        new_doc = None
+        try:
+            src_doc = fitz.open(str(input_path))
+            new_doc = fitz.open()
+            
+            page_count = len(src_doc)
+            for page_num, src_page in enumerate(src_doc):
+                self.logger.log("  페이지 %d/%d 처리 중...", page_num + 1, page_count)
+                
+                # 색상 변환 (원본 페이지에 적용)
+                self.color_converter._convert_page_colors(src_page)
+                
+                # 아웃라인 변환 (새 페이지로 복사)
+                new_page = new_doc.new_page(
+                    width=src_page.rect.width,
+                    height=src_page.rect.height
+                )
+                self.font_handler._convert_page_to_outline(src_page, new_page)
+            
+            # 메타데이터 복사 및 업데이트 (PyMuPDF 메타데이터 키는 소문자)
+            metadata = src_doc.metadata
+            if metadata:
+                metadata['creator'] = f"{metadata.get('creator') or ''} (RGB→CMYK Converted, Font Outlined)"
+                new_doc.set_metadata(metadata)
+            
+            new_doc.save(str(output_path), garbage=4, deflate=True)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"통합 변환 실패: {str(e)}")
+            return False
+            
+        finally:
+            if new_doc:
+                new_doc.close()
+            if src_doc:
+                src_doc.close()
+    
     def _check_modifications_needed(self, analysis_result: Dict) -> List[str]:
         """
         어떤 수정이 필요한지 확인
@@ -249,14 +474,36 @@ class PDFFixer:
         
         # 폰트 아웃라인 변환 필요 확인
         if self.settings.get('auto_outline_fonts', False):
-            fonts = analysis_result.get('fonts', {})
-            not_embedded = sum(1 for f in fonts.values() if not f.get('embedded', False))
+            not_embedded = self._count_unembedded(analysis_result)
             if not_embedded > 0:
                 modifications.append('font_outline')
-                self.logger.log(f"미임베딩 폰트 {not_embedded}개 발견 - 아웃라인 변환 필요")
+                self.logger.log("미임베딩 폰트 %d개 발견 - 아웃라인 변환 필요", not_embedded)
         
         return modifications
     
+    def _collect_backup(self, backup_future, result: Dict):
+        """
+        백그라운드 백업 완료를 기다려 결과에 반영
+        
+        백업이 실패해도 원본은 그대로이므로 이미 만든 수정 파일은 유지하고
+        오류만 기록합니다.
+        
+        Args:
+            backup_future: _create_backup 작업 (백업하지 않으면 None)
+            result: 수정 결과 딕셔너리
+        """
+        if backup_future is None:
+            return
+        
+        try:
+            backup_path = backup_future.result()
+            result['backup'] = str(backup_path)
+            self.logger.log("백업 생성 완료: %s", backup_path.name)
+        except Exception as e:
+            error_msg = f"백업 생성 실패: {str(e)}"
+            self.logger.error(error_msg)
+            result['errors'].append(error_msg)
+    
     def _create_backup(self, pdf_path: Path) -> Path:
         """
         원본 파일 백업 생성
@@ -268,12 +515,12 @@ class PDFFixer:
             백업 파일 경로
         """
         # 백업 파일명 생성 (타임스탬프 포함)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = unique_timestamp()
         backup_name = f"{pdf_path.stem}_backup_{timestamp}{pdf_path.suffix}"
         backup_path = self.backup_folder / backup_name
         
-        # 파일 복사
-        shutil.copy2(pdf_path, backup_path)
+        # 파일 복사 (커널 복사 우선)
+        _copy_file_fast(pdf_path, backup_path)
         
         return backup_path
     
@@ -292,27 +539,32 @@ class PDFFixer:
         temp_name = f"{current_path.stem}_{suffix}{current_path.suffix}"
         return self.fixed_folder / temp_name
     
-    def _save_fixed_file(self, source_path: Path, original_name: str) -> Path:
+    def _save_fixed_file(self, source_path: Path, original_name: Path) -> Path:
         """
         수정된 파일을 최종 위치에 저장
         
         Args:
             source_path: 수정된 파일 경로
-            original_name: 원본 파일명
+            original_name: 원본 파일 경로 (파일명만 사용)
             
         Returns:
             최종 파일 경로
         """
         # 최종 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fixed_name = f"{Path(original_name).stem}_fixed_{timestamp}.pdf"
+        timestamp = unique_timestamp()
+        fixed_name = f"{original_name.stem}_fixed_{timestamp}.pdf"
         fixed_path = self.fixed_folder / fixed_name
         
         # 파일 이동 (이미 fixed 폴더에 있으면 이름만 변경)
         if source_path.parent == self.fixed_folder:
             source_path.rename(fixed_path)
         else:
-            shutil.move(str(source_path), str(fixed_path))
+            try:
+                # 같은 파일 시스템이면 rename 한 번으로 원자적으로 이동
+                source_path.replace(fixed_path)
+            except OSError:
+                # 다른 드라이브/마운트 - 복사 후 삭제
+                shutil.move(str(source_path), str(fixed_path))
         
         return fixed_path
     
@@ -338,8 +590,7 @@ class PDFFixer:
             }
         
         # 폰트 임베딩 문제
-        fonts = analysis_result.get('fonts', {})
-        not_embedded = sum(1 for f in fonts.values() if not f.get('embedded', False))
+        not_embedded = self._count_unembedded(analysis_result)
         if not_embedded > 0:
             fixable['폰트 미임베딩'] = {
                 'can_fix': HAS_FONT_HANDLER,
@@ -8,19 +8,103 @@ preflight_profiles.py - 인쇄 방식별 검사 프로파일
 각 인쇄 방식에 맞는 검사 기준을 정의하고 적용
 """
 
+import sys
+import functools
 from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, List, Optional, Any
 from config import Config
+from utils import count_unembedded_fonts
 
-@dataclass
+# 분석 결과에 항목이 없을 때 쓰는 공용 빈 dict (읽기 전용)
+_EMPTY = MappingProxyType({})
+
+def _analysis_view(analysis_result: Dict) -> SimpleNamespace:
+    """
+    규칙 검사기들이 읽는 분석 결과 하위 항목을 한 번에 꺼내 둔 뷰
+    
+    규칙마다 같은 키를 다시 조회하거나 빈 dict를 새로 만들지 않도록
+    check()에서 한 번만 만듭니다.
+    """
+    print_quality = analysis_result.get('print_quality') or _EMPTY
+    return SimpleNamespace(
+        analysis_result=analysis_result,
+        ink_coverage=analysis_result.get('ink_coverage') or _EMPTY,
+        images=analysis_result.get('images') or _EMPTY,
+        colors=analysis_result.get('colors') or _EMPTY,
+        bleed=print_quality.get('bleed') or _EMPTY,
+        transparency=print_quality.get('transparency') or _EMPTY,
+        overprint=print_quality.get('overprint') or _EMPTY
+    )
+
+def _count_pages_without_bleed(analysis_result: Dict, min_bleed: float) -> int:
+    """재단 여백이 없거나 min_bleed(mm)보다 작은 페이지 수"""
+    return sum(
+        1 for page in analysis_result.get('pages') or []
+        if not page.get('has_bleed') or page.get('min_bleed', 0) < min_bleed
+    )
+
+# Python 3.10+에서는 슬롯 기반 dataclass로 규칙마다 __dict__를 두지 않음
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+class CheckType(str, Enum):
+    """규칙 검사 종류 (문자열과 그대로 비교/해시되므로 기존 'max_ink_coverage' 등과 호환)"""
+    MAX_INK_COVERAGE = 'max_ink_coverage'
+    MIN_RESOLUTION = 'min_resolution'
+    COLOR_MODE = 'color_mode'
+    FONT_EMBEDDING = 'font_embedding'
+    BLEED_MARGIN = 'bleed_margin'
+    TRANSPARENCY = 'transparency'
+    SPOT_COLORS = 'spot_colors'
+    OVERPRINT = 'overprint'
+
+class Severity(str, Enum):
+    """규칙 심각도 (문자열 'error'/'warning'/'info'와 호환)"""
+    ERROR = 'error'
+    WARNING = 'warning'
+    INFO = 'info'
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PreflightRule:
-    """프리플라이트 규칙 정의"""
+    """프리플라이트 규칙 정의 (생성 후 변경 불가)"""
     name: str
-    check_type: str
+    check_type: CheckType
     expected_value: Any
-    severity: str  # 'error', 'warning', 'info'
+    severity: Severity
     auto_fix: bool = False
     description: str = ""
+    
+    def __post_init__(self):
+        # 문자열로 넘어와도 열거형으로 바꿔 검사 중 비교를 'is'로 할 수 있게 함
+        # (오타는 여기서 ValueError로 드러남)
+        object.__setattr__(self, 'check_type', CheckType(self.check_type))
+        object.__setattr__(self, 'severity', Severity(self.severity))
+    
+    @classmethod
+    def intern(cls, **fields) -> 'PreflightRule':
+        """
+        같은 내용의 규칙은 하나의 객체로 공유 (여러 프로파일에 같은 규칙이 반복됨)
+        
+        규칙은 변경 불가이므로 공유해도 안전하며, 규칙 객체를 키로 결과를
+        캐시하는 코드도 같은 규칙을 하나로 봅니다.
+        
+        Returns:
+            PreflightRule: 등록된 같은 규칙, 없으면 새로 만든 규칙
+        """
+        rule = cls(**fields)
+        # True == 1처럼 값은 같고 타입이 다른 기준값은 구분
+        key = (rule, type(rule.expected_value))
+        try:
+            return _RULE_POOL.setdefault(key, rule)
+        except TypeError:
+            return rule  # 리스트 등 해시할 수 없는 기준값은 공유하지 않음
+
+# PreflightRule.intern이 공유하는 규칙 객체 (사전 정의 규칙은 수십 개뿐이라 일반 dict 사용)
+_RULE_POOL: Dict[tuple, PreflightRule] = {}
+
+# 빠른 실패 검사에서 규칙을 평가하는 순서
+_SEVERITY_ORDER = {Severity.ERROR: 0, Severity.WARNING: 1, Severity.INFO: 2}
 
 class PreflightProfile:
     """프리플라이트 프로파일 클래스"""
@@ -29,20 +113,49 @@ class PreflightProfile:
         self.name = name
         self.description = description
         self.rules: List[PreflightRule] = []
+        self._checks = []  # (규칙, 검사기) - 검사할 때 타입 조회를 반복하지 않도록
+        self._checks_by_severity = []  # _checks를 심각도 순(error → warning → info)으로 정렬
         
     def add_rule(self, rule: PreflightRule):
         """규칙 추가"""
+        check = (rule, self._CHECKERS[rule.check_type])
         self.rules.append(rule)
+        self._checks.append(check)
+        
+        # 같은 심각도 안에서는 추가한 순서 유지
+        order = _SEVERITY_ORDER[rule.severity]
+        index = len(self._checks_by_severity)
+        while index and _SEVERITY_ORDER[self._checks_by_severity[index - 1][0].severity] > order:
+            index -= 1
+        self._checks_by_severity.insert(index, check)
+    
+    def iter_rules_by_severity(self):
+        """심각도 순(error → warning → info)으로 규칙 반환"""
+        return (rule for rule, _ in self._checks_by_severity)
+    
+    def finalize(self) -> 'PreflightProfile':
+        """
+        규칙 목록을 튜플로 고정 (공유되는 프로파일이 수정되지 않도록)
+        
+        Returns:
+            자기 자신
+        """
+        self.rules = tuple(self.rules)
+        self._checks = tuple(self._checks)
+        self._checks_by_severity = tuple(self._checks_by_severity)
+        return self
     
-    def check(self, analysis_result: Dict) -> Dict:
+    def check(self, analysis_result: Dict, fast_fail: bool = False) -> Dict:
         """
         분석 결과를 프로파일 규칙과 비교
         
         Args:
             analysis_result: PDF 분석 결과
+            fast_fail: True면 error 규칙부터 검사하고 처음 실패한 error 규칙에서
+                       바로 'fail'을 반환 (나머지 규칙은 검사하지 않음)
             
         Returns:
-            검사 결과 딕셔너리
+            검사 결과 딕셔너리 (fast_fail로 중단했으면 'stopped_early': True)
         """
         results = {
             'profile': self.name,
@@ -53,18 +166,24 @@ class PreflightProfile:
             'auto_fixable': []
         }
         
-        for rule in self.rules:
-            check_result = self._check_rule(rule, analysis_result)
+        view = _analysis_view(analysis_result)
+        checks = self._checks_by_severity if fast_fail else self._checks
+        for rule, handler in checks:
+            check_result = self._run_rule(rule, handler, view)
             
             if check_result['status'] == 'pass':
                 results['passed'].append(check_result)
-            elif rule.severity == 'error':
+            elif rule.severity is Severity.ERROR:
                 results['failed'].append(check_result)
                 if rule.auto_fix:
                     results['auto_fixable'].append(check_result)
-            elif rule.severity == 'warning':
+                if fast_fail:
+                    results['overall_status'] = 'fail'
+                    results['stopped_early'] = True
+                    return results
+            elif rule.severity is Severity.WARNING:
                 results['warnings'].append(check_result)
-            elif rule.severity == 'info':  # 2025.01 추가
+            elif rule.severity is Severity.INFO:  # 2025.01 추가
                 results['info'].append(check_result)
         
         # 전체 상태 결정
@@ -79,6 +198,10 @@ class PreflightProfile:
     
     def _check_rule(self, rule: PreflightRule, analysis_result: Dict) -> Dict:
         """개별 규칙 검사"""
+        return self._run_rule(rule, self._CHECKERS[rule.check_type], _analysis_view(analysis_result))
+    
+    def _run_rule(self, rule: PreflightRule, handler, view: SimpleNamespace) -> Dict:
+        """규칙 하나를 검사기로 실행"""
         result = {
             'rule_name': rule.name,
             'description': rule.description,
@@ -88,118 +211,128 @@ class PreflightProfile:
             'message': ''
         }
         
-        # 규칙 타입별 검사
-        if rule.check_type == 'max_ink_coverage':
-            ink_data = analysis_result.get('ink_coverage', {})
-            if 'summary' in ink_data:
-                max_ink = ink_data['summary']['max_coverage']
-                result['found'] = f"{max_ink:.1f}%"
-                
-                if max_ink > rule.expected_value:
-                    result['status'] = 'fail'
-                    result['message'] = f"잉크량 {max_ink:.1f}%가 기준 {rule.expected_value}%를 초과"
-        
-        elif rule.check_type == 'min_resolution':
-            images = analysis_result.get('images', {})
-            low_res_count = images.get('low_resolution_count', 0)
-            result['found'] = f"{low_res_count}개 저해상도 이미지"
+        handler(self, rule, view, result)
+        return result
+    
+    # 규칙 타입별 검사기 - view(_analysis_view)를 읽고 result를 직접 채움
+    
+    def _check_max_ink_coverage(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """최대 잉크량 검사"""
+        ink_data = view.ink_coverage
+        if 'summary' in ink_data:
+            max_ink = ink_data['summary']['max_coverage']
+            result['found'] = f"{max_ink:.1f}%"
             
-            if low_res_count > 0:
+            if max_ink > rule.expected_value:
                 result['status'] = 'fail'
-                result['message'] = f"{low_res_count}개 이미지가 {rule.expected_value} DPI 미만"
-        
-        elif rule.check_type == 'color_mode':
-            colors = analysis_result.get('colors', {})
-            if rule.expected_value == 'CMYK':
-                if colors.get('has_rgb') and not colors.get('has_cmyk'):
-                    result['status'] = 'fail'
-                    result['found'] = 'RGB'
-                    result['message'] = "RGB 색상 사용 (CMYK 필요)"
-                else:
-                    result['found'] = 'CMYK' if colors.get('has_cmyk') else 'Unknown'
-        
-        elif rule.check_type == 'font_embedding':
-            fonts = analysis_result.get('fonts', {})
-            not_embedded = sum(1 for f in fonts.values() if not f.get('embedded', False))
-            result['found'] = f"{not_embedded}개 미임베딩"
-            
-            if not_embedded > 0:
+                result['message'] = f"잉크량 {max_ink:.1f}%가 기준 {rule.expected_value}%를 초과"
+    
+    def _check_min_resolution(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """최소 이미지 해상도 검사"""
+        images = view.images
+        low_res_count = images.get('low_resolution_count', 0)
+        result['found'] = f"{low_res_count}개 저해상도 이미지"
+        
+        if low_res_count > 0:
+            result['status'] = 'fail'
+            result['message'] = f"{low_res_count}개 이미지가 {rule.expected_value} DPI 미만"
+    
+    def _check_color_mode(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """색상 모드 검사"""
+        colors = view.colors
+        if rule.expected_value == 'CMYK':
+            if colors.get('has_rgb') and not colors.get('has_cmyk'):
                 result['status'] = 'fail'
-                result['message'] = f"{not_embedded}개 폰트가 임베딩되지 않음"
-        
-        elif rule.check_type == 'bleed_margin':
-            # 2025.06 수정: print_quality의 bleed 결과를 사용 (중복 제거)
-            print_quality = analysis_result.get('print_quality', {})
-            bleed_info = print_quality.get('bleed', {})
-            
-            # print_quality_checker에서 이미 처리된 결과 사용
-            if bleed_info:
-                if not bleed_info.get('has_proper_bleed', True):
-                    result['status'] = 'fail'  # severity가 info여도 status는 fail로 유지
-                    result['found'] = f"재단 여백 부족"
-                    pages_without = len(bleed_info.get('pages_without_bleed', []))
-                    result['message'] = f"{pages_without}개 페이지에 {rule.expected_value}mm 재단 여백 부족"
-                else:
-                    result['found'] = f"{rule.expected_value}mm 이상"
+                result['found'] = 'RGB'
+                result['message'] = "RGB 색상 사용 (CMYK 필요)"
             else:
-                # print_quality 검사가 수행되지 않은 경우 pages 정보에서 직접 확인
-                pages = analysis_result.get('pages', [])
-                pages_without_bleed = []
-                
-                for page in pages:
-                    if page.get('has_bleed'):
-                        if page.get('min_bleed', 0) < rule.expected_value:
-                            pages_without_bleed.append(page['page_number'])
-                    else:
-                        pages_without_bleed.append(page['page_number'])
-                
-                if pages_without_bleed:
-                    result['status'] = 'fail'
-                    result['found'] = f"재단 여백 부족"
-                    result['message'] = f"{len(pages_without_bleed)}개 페이지에 {rule.expected_value}mm 재단 여백 부족"
-                else:
-                    result['found'] = f"{rule.expected_value}mm 이상"
-        
-        elif rule.check_type == 'transparency':
-            print_quality = analysis_result.get('print_quality', {})
-            transparency = print_quality.get('transparency', {})
-            
-            if transparency.get('has_transparency'):
-                result['found'] = '투명도 사용'
-                if not rule.expected_value:  # 투명도 불허
-                    result['status'] = 'fail'
-                    result['message'] = "투명도가 발견됨 (평탄화 필요)"
-                else:
-                    result['status'] = 'warning'
-                    result['message'] = "투명도 사용 중 (확인 필요)"
+                result['found'] = 'CMYK' if colors.get('has_cmyk') else 'Unknown'
+    
+    def _check_font_embedding(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """폰트 임베딩 검사"""
+        not_embedded = count_unembedded_fonts(view.analysis_result)
+        result['found'] = f"{not_embedded}개 미임베딩"
+        
+        if not_embedded > 0:
+            result['status'] = 'fail'
+            result['message'] = f"{not_embedded}개 폰트가 임베딩되지 않음"
+    
+    def _check_bleed_margin(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """재단 여백 검사"""
+        # 2025.06 수정: print_quality의 bleed 결과를 사용 (중복 제거)
+        bleed_info = view.bleed
+        
+        # print_quality_checker에서 이미 처리된 결과 사용
+        if bleed_info:
+            if not bleed_info.get('has_proper_bleed', True):
+                result['status'] = 'fail'  # severity가 info여도 status는 fail로 유지
+                result['found'] = f"재단 여백 부족"
+                pages_without = len(bleed_info.get('pages_without_bleed', []))
+                result['message'] = f"{pages_without}개 페이지에 {rule.expected_value}mm 재단 여백 부족"
             else:
-                result['found'] = '투명도 없음'
-        
-        elif rule.check_type == 'spot_colors':
-            colors = analysis_result.get('colors', {})
-            spot_count = len(colors.get('spot_color_names', []))
-            result['found'] = f"{spot_count}개"
+                result['found'] = f"{rule.expected_value}mm 이상"
+        else:
+            # print_quality 검사가 수행되지 않은 경우 pages 정보에서 직접 확인
+            pages_without_bleed = _count_pages_without_bleed(view.analysis_result, rule.expected_value)
             
-            if spot_count > rule.expected_value:
+            if pages_without_bleed:
                 result['status'] = 'fail'
-                result['message'] = f"별색 {spot_count}개가 허용치 {rule.expected_value}개 초과"
-        
-        elif rule.check_type == 'overprint':
-            print_quality = analysis_result.get('print_quality', {})
-            overprint = print_quality.get('overprint', {})
-            
-            # 2025.06: 문제가 되는 오버프린트만 체크
-            if overprint.get('has_problematic_overprint'):
-                result['found'] = '문제가 되는 중복인쇄 설정됨'
-                result['status'] = 'warning'
-                result['message'] = "문제가 되는 중복인쇄 설정 확인 필요"
-            elif overprint.get('has_overprint'):
-                result['found'] = '정상적인 중복인쇄 사용'
-                # K100% 오버프린트 등 정상적인 경우는 pass
+                result['found'] = f"재단 여백 부족"
+                result['message'] = f"{pages_without_bleed}개 페이지에 {rule.expected_value}mm 재단 여백 부족"
             else:
-                result['found'] = '중복인쇄 없음'
+                result['found'] = f"{rule.expected_value}mm 이상"
+    
+    def _check_transparency(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """투명도 검사"""
+        transparency = view.transparency
         
-        return result
+        if transparency.get('has_transparency'):
+            result['found'] = '투명도 사용'
+            if not rule.expected_value:  # 투명도 불허
+                result['status'] = 'fail'
+                result['message'] = "투명도가 발견됨 (평탄화 필요)"
+            else:
+                result['status'] = 'warning'
+                result['message'] = "투명도 사용 중 (확인 필요)"
+        else:
+            result['found'] = '투명도 없음'
+    
+    def _check_spot_colors(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """별색 개수 검사"""
+        colors = view.colors
+        spot_count = len(colors.get('spot_color_names', []))
+        result['found'] = f"{spot_count}개"
+        
+        if spot_count > rule.expected_value:
+            result['status'] = 'fail'
+            result['message'] = f"별색 {spot_count}개가 허용치 {rule.expected_value}개 초과"
+    
+    def _check_overprint(self, rule: PreflightRule, view: SimpleNamespace, result: Dict):
+        """중복인쇄 검사"""
+        overprint = view.overprint
+        
+        # 2025.06: 문제가 되는 오버프린트만 체크
+        if overprint.get('has_problematic_overprint'):
+            result['found'] = '문제가 되는 중복인쇄 설정됨'
+            result['status'] = 'warning'
+            result['message'] = "문제가 되는 중복인쇄 설정 확인 필요"
+        elif overprint.get('has_overprint'):
+            result['found'] = '정상적인 중복인쇄 사용'
+            # K100% 오버프린트 등 정상적인 경우는 pass
+        else:
+            result['found'] = '중복인쇄 없음'
+    
+    # check_type → 검사기 (if/elif 대신 사전 조회 한 번으로 선택)
+    _CHECKERS = {
+        CheckType.MAX_INK_COVERAGE: _check_max_ink_coverage,
+        CheckType.MIN_RESOLUTION: _check_min_resolution,
+        CheckType.COLOR_MODE: _check_color_mode,
+        CheckType.FONT_EMBEDDING: _check_font_embedding,
+        CheckType.BLEED_MARGIN: _check_bleed_margin,
+        CheckType.TRANSPARENCY: _check_transparency,
+        CheckType.SPOT_COLORS: _check_spot_colors,
+        CheckType.OVERPRINT: _check_overprint,
+    }
 
 # 사전 정의된 프로파일들
 class PreflightProfiles:
@@ -214,64 +347,64 @@ class PreflightProfiles:
         )
         
         # 필수 규칙들
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최대 잉크량",
-            check_type="max_ink_coverage",
+            check_type=CheckType.MAX_INK_COVERAGE,
             expected_value=300,
-            severity="error",
+            severity=Severity.ERROR,
             description="총 잉크량은 300%를 초과할 수 없습니다"
         ))
         
         # 이미지 해상도 기준 완화 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최소 이미지 해상도",
-            check_type="min_resolution",
+            check_type=CheckType.MIN_RESOLUTION,
             expected_value=150,  # 300에서 150으로 완화
-            severity="warning",  # error에서 warning으로 완화
+            severity=Severity.WARNING,  # error에서 warning으로 완화
             description="모든 이미지는 150 DPI 이상이어야 합니다"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="색상 모드",
-            check_type="color_mode",
+            check_type=CheckType.COLOR_MODE,
             expected_value="CMYK",
-            severity="error",
+            severity=Severity.ERROR,
             auto_fix=True,
             description="CMYK 색상 모드 필수"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="폰트 임베딩",
-            check_type="font_embedding",
+            check_type=CheckType.FONT_EMBEDDING,
             expected_value=True,
-            severity="error",
+            severity=Severity.ERROR,
             auto_fix=True,
             description="모든 폰트는 임베딩되어야 합니다"
         ))
         
         # 재단 여백을 정보 제공용으로 변경 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="재단 여백",
-            check_type="bleed_margin",
+            check_type=CheckType.BLEED_MARGIN,
             expected_value=3,
-            severity="info",  # error에서 info로 변경
+            severity=Severity.INFO,  # error에서 info로 변경
             description="최소 3mm의 재단 여백 권장"
         ))
         
         # 권장 규칙들
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="투명도",
-            check_type="transparency",
+            check_type=CheckType.TRANSPARENCY,
             expected_value=False,
-            severity="warning",
+            severity=Severity.WARNING,
             description="투명도는 평탄화를 권장합니다"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="별색 제한",
-            check_type="spot_colors",
+            check_type=CheckType.SPOT_COLORS,
             expected_value=2,
-            severity="warning",
+            severity=Severity.WARNING,
             description="별색은 2개 이하 권장"
         ))
         
@@ -285,37 +418,37 @@ class PreflightProfiles:
             description="디지털 인쇄기용 설정 (RGB 허용)"
         )
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최대 잉크량",
-            check_type="max_ink_coverage",
+            check_type=CheckType.MAX_INK_COVERAGE,
             expected_value=280,
-            severity="error",
+            severity=Severity.ERROR,
             description="디지털 인쇄는 280% 이하 권장"
         ))
         
         # 이미지 해상도 기준 완화 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최소 이미지 해상도",
-            check_type="min_resolution",
+            check_type=CheckType.MIN_RESOLUTION,
             expected_value=100,  # 200에서 100으로 완화
-            severity="warning",
+            severity=Severity.WARNING,
             description="디지털 인쇄는 100 DPI 이상 권장"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="폰트 임베딩",
-            check_type="font_embedding",
+            check_type=CheckType.FONT_EMBEDDING,
             expected_value=True,
-            severity="error",
+            severity=Severity.ERROR,
             description="모든 폰트는 임베딩되어야 합니다"
         ))
         
         # 재단 여백을 정보 제공용으로 변경 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="재단 여백",
-            check_type="bleed_margin",
+            check_type=CheckType.BLEED_MARGIN,
             expected_value=2,
-            severity="info",  # warning에서 info로 변경
+            severity=Severity.INFO,  # warning에서 info로 변경
             description="최소 2mm의 재단 여백 권장"
         ))
         
@@ -329,36 +462,36 @@ class PreflightProfiles:
             description="신문 윤전기용 특수 설정"
         )
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최대 잉크량",
-            check_type="max_ink_coverage",
+            check_type=CheckType.MAX_INK_COVERAGE,
             expected_value=240,
-            severity="error",
+            severity=Severity.ERROR,
             description="신문 용지는 240% 이하 필수"
         ))
         
         # 이미지 해상도 기준 완화 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최소 이미지 해상도",
-            check_type="min_resolution",
+            check_type=CheckType.MIN_RESOLUTION,
             expected_value=72,  # 150에서 72로 완화
-            severity="warning",
+            severity=Severity.WARNING,
             description="신문 인쇄는 72 DPI 이상"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="색상 모드",
-            check_type="color_mode",
+            check_type=CheckType.COLOR_MODE,
             expected_value="CMYK",
-            severity="error",
+            severity=Severity.ERROR,
             description="CMYK 색상 모드 필수"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="별색 제한",
-            check_type="spot_colors",
+            check_type=CheckType.SPOT_COLORS,
             expected_value=0,
-            severity="error",
+            severity=Severity.ERROR,
             description="신문 인쇄는 별색 사용 불가"
         ))
         
@@ -373,28 +506,28 @@ class PreflightProfiles:
         )
         
         # 이미지 해상도 기준 완화 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최소 이미지 해상도",
-            check_type="min_resolution",
+            check_type=CheckType.MIN_RESOLUTION,
             expected_value=72,  # 100에서 72로 완화
-            severity="warning",
+            severity=Severity.WARNING,
             description="대형 인쇄는 72 DPI 이상 (원거리 관람)"
         ))
         
         # 재단 여백을 정보 제공용으로 변경 (2025.01 수정)
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="재단 여백",
-            check_type="bleed_margin",
+            check_type=CheckType.BLEED_MARGIN,
             expected_value=10,
-            severity="info",  # error에서 info로 변경
+            severity=Severity.INFO,  # error에서 info로 변경
             description="대형 인쇄는 10mm 재단 여백 권장"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="폰트 임베딩",
-            check_type="font_embedding",
+            check_type=CheckType.FONT_EMBEDDING,
             expected_value=True,
-            severity="error",
+            severity=Severity.ERROR,
             description="모든 폰트는 임베딩되어야 합니다"
         ))
         
@@ -408,36 +541,36 @@ class PreflightProfiles:
             description="화보집, 아트북 등 최고 품질 인쇄"
         )
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최대 잉크량",
-            check_type="max_ink_coverage",
+            check_type=CheckType.MAX_INK_COVERAGE,
             expected_value=320,
-            severity="warning",
+            severity=Severity.WARNING,
             description="고품질 용지는 320%까지 허용"
         ))
         
         # 고품질 인쇄는 해상도 기준 유지
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="최소 이미지 해상도",
-            check_type="min_resolution",
+            check_type=CheckType.MIN_RESOLUTION,
             expected_value=300,  # 고품질은 300 DPI 유지
-            severity="error",
+            severity=Severity.ERROR,
             description="고품질 인쇄는 300 DPI 이상 필수"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="색상 모드",
-            check_type="color_mode",
+            check_type=CheckType.COLOR_MODE,
             expected_value="CMYK",
-            severity="error",
+            severity=Severity.ERROR,
             description="CMYK 색상 모드 필수"
         ))
         
-        profile.add_rule(PreflightRule(
+        profile.add_rule(PreflightRule.intern(
             name="중복인쇄",
-            check_type="overprint",
+            check_type=CheckType.OVERPRINT,
             expected_value=True,
-            severity="info",
+            severity=Severity.INFO,
             description="중복인쇄 설정 확인 필요"
         ))
         
@@ -445,32 +578,61 @@ class PreflightProfiles:
     
     @staticmethod
     def get_all_profiles() -> Dict[str, PreflightProfile]:
-        """모든 사전 정의 프로파일 반환"""
-        return {
-            'offset': PreflightProfiles.get_offset_printing(),
-            'digital': PreflightProfiles.get_digital_printing(),
-            'newspaper': PreflightProfiles.get_newspaper_printing(),
-            'large_format': PreflightProfiles.get_large_format_printing(),
-            'high_quality': PreflightProfiles.get_high_quality_printing()
-        }
+        """
+        모든 사전 정의 프로파일 반환
+        
+        프로파일은 처음 한 번만 만들어 공유하므로 규칙은 읽기 전용(튜플)입니다.
+        반환되는 dict는 복사본이라 호출자가 항목을 바꿔도 캐시에는 영향이 없습니다.
+        """
+        return dict(_builtin_profiles())
     
     @staticmethod
     def get_profile_by_name(name: str) -> Optional[PreflightProfile]:
         """이름으로 프로파일 가져오기"""
-        profiles = PreflightProfiles.get_all_profiles()
+        exact, candidates = _profile_name_index()
+        name_lower = name.lower()
         
-        # 정확한 매칭
-        if name in profiles:
-            return profiles[name]
+        # 정확한 매칭 (키 또는 프로파일 이름, 대소문자 무시)
+        profile = exact.get(name_lower)
+        if profile is not None:
+            return profile
         
-        # 부분 매칭
-        name_lower = name.lower()
-        for key, profile in profiles.items():
-            if name_lower in key.lower() or name_lower in profile.name.lower():
+        # 부분 매칭 - 미리 소문자로 바꿔 둔 이름에서 검색
+        for key_lower, profile_name_lower, profile in candidates:
+            if name_lower in key_lower or name_lower in profile_name_lower:
                 return profile
         
         return None
 
+@functools.lru_cache(maxsize=None)
+def _builtin_profiles() -> Dict[str, PreflightProfile]:
+    """사전 정의 프로파일을 한 번만 생성 (이후 호출은 같은 객체 공유)"""
+    return {
+        'offset': PreflightProfiles.get_offset_printing().finalize(),
+        'digital': PreflightProfiles.get_digital_printing().finalize(),
+        'newspaper': PreflightProfiles.get_newspaper_printing().finalize(),
+        'large_format': PreflightProfiles.get_large_format_printing().finalize(),
+        'high_quality': PreflightProfiles.get_high_quality_printing().finalize()
+    }
+
+@functools.lru_cache(maxsize=None)
+def _profile_name_index():
+    """
+    프로파일 이름 조회용 색인 (한 번만 생성)
+    
+    Returns:
+        tuple: ({소문자 키/이름: 프로파일}, ((소문자 키, 소문자 이름, 프로파일), ...))
+    """
+    exact = {}
+    candidates = []
+    for key, profile in _builtin_profiles().items():
+        key_lower = key.lower()
+        profile_name_lower = profile.name.lower()
+        exact.setdefault(key_lower, profile)
+        exact.setdefault(profile_name_lower, profile)
+        candidates.append((key_lower, profile_name_lower, profile))
+    return exact, tuple(candidates)
+
 # 커스텀 프로파일 생성 헬퍼
 def create_custom_profile(name: str, description: str, rules: List[Dict]) -> PreflightProfile:
     """
@@ -487,7 +649,7 @@ def create_custom_profile(name: str, description: str, rules: List[Dict]) -> Pre
     profile = PreflightProfile(name, description)
     
     for rule_dict in rules:
-        rule = PreflightRule(
+        rule = PreflightRule.intern(
             name=rule_dict['name'],
             check_type=rule_dict['check_type'],
             expected_value=rule_dict['expected_value'],
@@ -18,19 +18,517 @@ print_quality_checker.py - 인쇄 품질을 전문적으로 검사하는 클래
 import fitz  # PyMuPDF - PDF 파일을 읽고 분석하는 라이브러리 (이미지 검사용으로만 사용)
 import pikepdf  # PDF 파일의 내부 구조를 정밀하게 분석하는 라이브러리
 from pathlib import Path  # 파일 경로를 다루는 라이브러리
+from contextlib import ExitStack, nullcontext  # 공유 문서 열기/닫기 관리
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor  # 검사 그룹 동시 실행, 텍스트 크기 검사 병렬화
+from itertools import repeat
+import copy
+import multiprocessing
+import os
+import sys
+from dataclasses import dataclass
 from utils import points_to_mm, safe_float  # 유틸리티 함수들
+from quality_utils import estimate_jpeg_quality  # JPEG 양자화 테이블 기반 품질 추정
+import numpy as np
 from config import Config  # 설정 파일
 import re  # 정규표현식 라이브러리
+from collections import Counter, defaultdict
+import hashlib  # 파일 지문(해시) 계산
+import logging
+import pickle  # 검사 결과 캐시 저장
+
+# 진행 상황/오류 메시지용 로거
+# 진입점에서 utils.setup_console_logging()을 호출하면 INFO까지 콘솔에 표시
+# (핸들러가 없으면 WARNING 이상만 logging 기본 처리로 stderr에 출력)
+log = logging.getLogger(__name__)
 
 # 새로 추가된 외부 도구 모듈을 안전하게 가져오기 시도
 try:
     # external_tools 모듈에서 필요한 함수들을 가져옵니다
-    from external_tools import check_overprint_external, check_external_tools_status
+    from external_tools import check_overprint_external, check_external_tools_status, GhostscriptSession
     HAS_EXTERNAL_TOOLS = True  # 외부 도구를 사용할 수 있음을 표시
 except ImportError:
     # 만약 external_tools 모듈이 없다면 기존 방식으로 동작
     HAS_EXTERNAL_TOOLS = False
-    print("경고: external_tools 모듈을 찾을 수 없습니다. 기존 방식으로 폴백합니다.")
+    log.warning("경고: external_tools 모듈을 찾을 수 없습니다. 기존 방식으로 폴백합니다.")
+
+# pyahocorasick이 있으면 여러 연산자를 Aho-Corasick 자동자로 한 번에 탐색 (없으면 정규식으로 폴백)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# 검사 결과 디스크 캐시 (같은 내용의 파일을 다시 검사하면 재사용)
+CHECK_CACHE_DIR = Config.REPORTS_PATH / "check_cache"
+CHECK_CACHE_MAX_ENTRIES = 500
+
+# 검사별 결과 형식 버전 - 검사 로직이나 결과 구조가 바뀌면 올려서 이전 캐시를 무효화
+CHECK_CACHE_VERSIONS = {
+    'transparency': 4,
+    'overprint': 4,
+    'spot_colors': 3,
+    'image_compression': 3,
+    'text_size': 3,
+}
+
+# 검사 결과에 남길 페이지 번호 표본 수 (전체 개수는 *_page_count로 따로 보고)
+PAGE_SAMPLE_SIZE = 20
+
+# 디버그용: True면 표본 대신 해당하는 모든 페이지 번호를 결과에 남김
+REPORT_ALL_PAGES = False
+
+# 투명도 관련 PDF 연산자/키 (내용 스트림을 한 번만 훑도록 하나의 정규식으로 묶음)
+#   /CA    스트로크 알파 (선 그리기의 투명도)
+#   /ca    채우기 알파 (채우기의 투명도)
+#   /BM    블렌드 모드 (색상 혼합 방식)
+#   /SMask 소프트 마스크 (복잡한 투명도 효과)
+#   gs     그래픽 상태 (투명도 설정 포함 가능)
+_TRANSPARENCY_OPERATORS = (b'/CA', b'/ca', b'/BM', b'/SMask', b'gs')
+_TRANSPARENCY_OPERATOR_RE = re.compile(rb'/CA\b|/ca\b|/BM\b|/SMask\b|\bgs\b')
+
+# 정규식 \b와 같은 기준의 단어 문자 (ASCII 영문자/숫자/밑줄)
+_WORD_BYTES = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+
+
+def _build_transparency_automaton():
+    """투명도 연산자용 Aho-Corasick 자동자 (pyahocorasick 유니코드 빌드면 latin-1 문자열 키)"""
+    automaton = ahocorasick.Automaton()
+    for op in _TRANSPARENCY_OPERATORS:
+        automaton.add_word(op.decode('latin-1') if ahocorasick.unicode else op, op)
+    automaton.make_automaton()
+    return automaton
+
+
+_TRANSPARENCY_AUTOMATON = _build_transparency_automaton() if HAS_AHOCORASICK else None
+
+
+def _find_transparency_operator(contents):
+    """
+    내용 스트림에서 처음 나오는 투명도 연산자 찾기
+    
+    pyahocorasick이 있으면 자동자로 한 번 훑으면서 모든 후보를 위치 순서대로 받고,
+    정규식과 같은 단어 경계 조건(연산자 뒤, 'gs'는 앞도)을 만족하는 첫 후보를 고릅니다.
+    
+    Args:
+        contents: 내용 스트림 (bytes 또는 memoryview)
+        
+    Returns:
+        bytes: 발견된 연산자 (없으면 None)
+    """
+    if _TRANSPARENCY_AUTOMATON is None:
+        match = _TRANSPARENCY_OPERATOR_RE.search(contents)
+        return match.group() if match else None
+    
+    if ahocorasick.unicode:
+        # 유니코드 빌드는 문자열만 받으므로 바이트를 1:1로 옮기는 latin-1로 변환
+        haystack = str(contents, 'latin-1')
+        code = ord
+    else:
+        haystack = bytes(contents)
+        code = int
+    
+    last = len(haystack) - 1
+    for end, op in _TRANSPARENCY_AUTOMATON.iter(haystack):
+        if end < last and code(haystack[end + 1]) in _WORD_BYTES:
+            continue  # 더 긴 이름의 일부 (예: /CAx)
+        start = end - len(op) + 1
+        if op == b'gs' and start > 0 and code(haystack[start - 1]) in _WORD_BYTES:
+            continue  # 다른 토큰 안의 'gs'
+        return op
+    return None
+
+
+# 별색 색상 공간 종류 (pikepdf Name 객체를 미리 만들어 두고 그대로 비교)
+_SEPARATION = pikepdf.Name.Separation
+_DEVICE_N = pikepdf.Name.DeviceN
+
+# DeviceN 색료 중 별색이 아닌 것 (CMYK 원색, 빈 색료)
+_NON_SPOT_COLORANTS = (
+    pikepdf.Name.Cyan, pikepdf.Name.Magenta, pikepdf.Name.Yellow,
+    pikepdf.Name.Black, pikepdf.Name('/None')
+)
+
+# PANTONE 별색 이름 (대소문자 무시 - 이름마다 대문자 사본을 만들지 않음)
+_PANTONE_RE = re.compile(r'PANTONE', re.IGNORECASE)
+
+# 이미지 데이터를 만드는 전용 필터 - 필터 체인에서는 항상 마지막에 옴
+# (get_images(full=True)는 체인의 첫 필터만 알려 주므로, 이 필터들일 때만 체인 전체를 읽지 않음)
+_IMAGE_ONLY_FILTERS = frozenset({'DCTDecode', 'JPXDecode', 'JBIG2Decode', 'CCITTFaxDecode'})
+
+# 이미지 압축 검사에서 양자화 테이블까지 읽어 상세 분석하는 JPEG 이미지 수 (압축된 크기가 큰 순)
+DEEP_ANALYSIS_MAX_IMAGES = 50
+
+# 최소 권장 텍스트 크기 (포인트)
+MIN_TEXT_SIZE = 4.0
+
+# 텍스트 크기 검사용 TextPage 플래그 - 이미지 블록(이미지 데이터 포함)과 합자 보존을 빼서
+# 글자 크기에 필요 없는 데이터는 만들지 않음 (결과 블록은 모두 텍스트 블록)
+_TEXT_SIZE_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES & ~fitz.TEXT_PRESERVE_LIGATURES
+
+# 텍스트 크기 검사를 프로세스 풀로 나누는 최소 페이지 수와 최대 워커 수
+# (spawn 워커 시작에 모듈 로딩까지 1초 가까이 걸리므로 페이지가 충분히 많을 때만)
+TEXT_SCAN_PARALLEL_MIN_PAGES = 100
+TEXT_SCAN_MAX_WORKERS = 4
+
+# 파일 지문 계산 시 한 번에 읽는 크기 (1 MiB)
+FINGERPRINT_CHUNK_SIZE = 1 << 20
+
+# Python 3.10+에서는 슬롯 기반 dataclass로 레코드마다 __dict__를 두지 않음
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class SmallTextPage:
+    """작은 텍스트가 있는 페이지 기록 (small_text_pages 항목)"""
+    page: int
+    min_size: float
+
+
+def file_fingerprint(pdf_path):
+    """
+    PDF 파일 내용의 지문(MD5) 계산
+    
+    파일 전체를 메모리에 올리지 않고 1 MiB씩 나눠 읽습니다.
+    경로나 수정 시각이 아닌 내용 기준이므로 복사/이름 변경된 파일도 같은 지문이 됩니다.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        
+    Returns:
+        str: 16진수 지문 문자열
+    """
+    h = hashlib.md5()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _overprint_sample_pages(pdf_path, pages_info=None):
+    """
+    Ghostscript 오버프린트 검사에 쓸 표본 페이지 (첫/가운데/마지막 페이지)
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        pages_info: pdf_analyzer의 페이지 정보 (있으면 파일을 열지 않고 페이지 수를 얻음)
+        
+    Returns:
+        list: 1부터 시작하는 페이지 번호 목록
+    """
+    if pages_info:
+        page_count = len(pages_info)
+    else:
+        try:
+            with fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+        except Exception:
+            page_count = 1  # 열 수 없으면 기존처럼 첫 페이지만
+    
+    if page_count < 1:
+        return [1]
+    return sorted({1, (page_count + 1) // 2, page_count})
+
+
+def _spot_color_names(colorspaces):
+    """
+    ColorSpace 리소스 사전에서 별색(Separation) 이름 추출
+    
+    Args:
+        colorspaces: 페이지 Resources의 /ColorSpace 사전 (pikepdf 객체)
+        
+    Returns:
+        list: 항목 순서대로의 별색 이름 (같은 이름이 여러 번 나올 수 있음)
+    """
+    spot_names = []
+    # 색상 공간들을 하나씩 검사 (문자열 변환 없이 pikepdf Name끼리 비교)
+    for cs_obj in colorspaces.values():
+        if not isinstance(cs_obj, pikepdf.Array) or len(cs_obj) == 0:
+            continue
+        family = cs_obj[0]
+        
+        if family == _SEPARATION:
+            # Separation 색상 공간 = 별색 하나 (별색의 PDF 내부 표현)
+            spot_names.append(str(cs_obj[1]) if len(cs_obj) > 1 else 'Unknown')
+        elif family == _DEVICE_N and len(cs_obj) > 1 and isinstance(cs_obj[1], pikepdf.Array):
+            # DeviceN 색상 공간 = 여러 색료 묶음 (원색/None을 뺀 나머지가 별색)
+            for colorant in cs_obj[1]:
+                if colorant not in _NON_SPOT_COLORANTS:
+                    spot_names.append(str(colorant))
+    return spot_names
+
+
+def _image_filters(pdf, doc, xref):
+    """
+    이미지 사전의 /Filter 값을 이미지 디코딩 없이 읽기
+    
+    pikepdf 객체에서 Name/Array를 그대로 읽으므로 [/ASCII85Decode /DCTDecode] 같은
+    필터 체인도 문자열 파싱 없이 정확히 얻습니다.
+    pikepdf에서 객체를 찾지 못하면 PyMuPDF의 xref 키로 대신 읽습니다.
+    
+    Args:
+        pdf: pikepdf 문서
+        doc: PyMuPDF 문서
+        xref: 이미지 참조 번호
+        
+    Returns:
+        list: 적용 순서대로의 필터 이름 (슬래시 제외, 필터가 없으면 빈 목록)
+    """
+    obj = pdf.get_object((xref, 0))
+    if obj is not None:
+        filters = obj.get('/Filter')
+        if isinstance(filters, pikepdf.Array):
+            return [str(f)[1:] for f in filters if isinstance(f, pikepdf.Name)]
+        if isinstance(filters, pikepdf.Name):
+            return [str(filters)[1:]]
+        return []
+    
+    kind, value = doc.xref_get_key(xref, "Filter")
+    if kind not in ('name', 'array'):
+        return []
+    return re.findall(r'/([^\s/\[\]<>()]+)', value)
+
+
+def _image_size(doc, xref):
+    """
+    이미지 사전의 /Width, /Height 읽기 (픽셀 디코딩 없음)
+    
+    Returns:
+        tuple: (너비, 높이) - 값이 없으면 0
+    """
+    width = doc.xref_get_key(xref, "Width")[1]
+    height = doc.xref_get_key(xref, "Height")[1]
+    return (int(width) if width.isdigit() else 0,
+            int(height) if height.isdigit() else 0)
+
+
+def _analyze_image(doc, xref):
+    """
+    이미지 하나의 압축률, JPEG 품질, 인쇄 적합성 분석
+    
+    Args:
+        doc: PyMuPDF 문서
+        xref: 이미지 참조 번호
+        
+    Returns:
+        tuple: (크기 문자열, 압축률, JPEG 품질 분류, JPEG 품질 계수 또는 None, 시각적 영향, 인쇄 적합성)
+    """
+    # 크기와 색상 채널 수는 이미지 헤더에서 읽음 (픽셀을 디코딩하는 픽스맵은 만들지 않음)
+    image_info = doc.extract_image(xref)
+    if not image_info:
+        raise ValueError(f"이미지 {xref} 정보를 읽을 수 없음")
+    width, height = image_info['width'], image_info['height']
+    pixel_count = width * height * image_info['colorspace']  # 색상 채널 고려
+    
+    # 압축된 이미지 데이터 (xref_stream()은 JPEG까지 디코딩하므로 원본 스트림 사용)
+    stream = doc.xref_stream_raw(xref)
+    compressed_size = len(stream)
+    compression_ratio = compressed_size / pixel_count if pixel_count > 0 else 1
+    
+    # JPEG 품질 추정 - 원본 스트림의 양자화 테이블에서 읽음
+    estimated_quality = 'Unknown'
+    jpeg_quality = estimate_jpeg_quality(np.frombuffer(stream, dtype=np.uint8))
+    if jpeg_quality is not None:
+        # 양자화 테이블에서 구한 실제 품질 계수(IJG 기준)로 분류
+        if jpeg_quality <= 50:
+            estimated_quality = '매우 낮음 (50 이하)'
+        elif jpeg_quality < 70:
+            estimated_quality = '낮음 (50-70)'
+        elif jpeg_quality < 85:
+            estimated_quality = '보통 (70-85)'
+        else:
+            estimated_quality = '높음 (85 이상)'
+    elif b'\xff\xdb' in stream[:500]:  # 양자화 테이블 마커가 있으면
+        # 테이블을 읽지 못한 경우 (필터 체인 등) 픽셀당 바이트 수로 간단히 추정
+        bytes_per_pixel = compressed_size / (width * height)
+        
+        # 픽셀당 바이트 수로 품질 추정
+        if bytes_per_pixel < 0.3:
+            estimated_quality = '매우 낮음 (50 이하)'
+        elif bytes_per_pixel < 0.5:
+            estimated_quality = '낮음 (50-70)'
+        elif bytes_per_pixel < 0.8:
+            estimated_quality = '보통 (70-85)'
+        else:
+            estimated_quality = '높음 (85 이상)'
+    
+    # 이미지 용도별 적합성 판단
+    if width < 300 or height < 300:
+        # 작은 이미지는 품질이 덜 중요
+        visual_impact = '작은 아이콘/로고'
+        print_suitability = '품질 무관'
+    else:
+        # 큰 이미지는 품질이 중요
+        bytes_per_pixel = compressed_size / (width * height)
+        if bytes_per_pixel < 0.3:
+            visual_impact = '눈에 띄는 품질 저하'
+            print_suitability = '인쇄 부적합'
+        elif bytes_per_pixel < 0.5:
+            visual_impact = '약간의 품질 저하'
+            print_suitability = '일반 문서 가능'
+        else:
+            visual_impact = '양호'
+            print_suitability = '고품질 인쇄 가능'
+    
+    return (f"{width}x{height}", compression_ratio, estimated_quality, jpeg_quality,
+            visual_impact, print_suitability)
+
+
+def _page_min_size(blocks):
+    """
+    페이지 텍스트 블록에서 가장 작은 글자 크기 찾기
+    
+    블록 → 라인 → 스팬(같은 스타일의 텍스트 구간)의 크기를 제너레이터로 펼쳐
+    내장 min()으로 한 번에 구합니다 (비교/갱신을 파이썬 루프로 하지 않음).
+    텍스트 블록의 키는 PyMuPDF가 항상 채우므로 .get() 대신 바로 꺼냅니다.
+    
+    Args:
+        blocks: TextPage.extractDICT()의 텍스트 블록 목록
+        
+    Returns:
+        float: 페이지의 최소 글자 크기 (텍스트가 없으면 999)
+    """
+    try:
+        page_min_size = min(
+            (span["size"]
+             for block in blocks if block["type"] == 0
+             for line in block["lines"]
+             for span in line["spans"]),
+            default=999
+        )
+        
+        # 크기가 0인 스팬이 있으면 그것만 빼고 다시 계산 (드문 경우)
+        if page_min_size <= 0:
+            page_min_size = min(
+                (font_size
+                 for block in blocks if block["type"] == 0
+                 for line in block["lines"]
+                 for span in line["spans"]
+                 if (font_size := span["size"]) > 0),
+                default=999
+            )
+    except (KeyError, TypeError) as e:
+        # 블록 구조가 예상과 다르면 (PyMuPDF 버전 차이 등) 이 페이지는 건너뜀
+        log.warning("      텍스트 블록 구조를 읽을 수 없음: %.50s", e)
+        return 999
+    
+    return page_min_size
+
+
+def _text_sizes_in_pages(doc, page_indices):
+    """
+    페이지들의 최소 텍스트 크기 수집 (최소 텍스트 크기 검사의 페이지 루프)
+    
+    Args:
+        doc: PyMuPDF 문서
+        page_indices: 검사할 페이지 인덱스 (0부터, 오름차순)
+        
+    Returns:
+        dict: {페이지 번호: 페이지의 최소 크기} - 텍스트가 있는 페이지만
+    """
+    page_sizes = {}
+    # 같은 크기 값은 하나의 float 객체로 공유 (문서에 쓰인 글자 크기는 보통 몇 가지뿐)
+    distinct_sizes = {}
+    
+    for page_index in page_indices:
+        page = doc[page_index]
+        
+        # 글꼴 리소스가 없는 페이지(스캔 이미지, 빈 페이지)에는 텍스트가 있을 수 없으므로
+        # 내용 스트림을 해석하지 않고 건너뜀 (폼 XObject 안의 글꼴도 포함해서 확인)
+        if not page.get_fonts():
+            continue
+        
+        # 텍스트 블록만 딕셔너리 형태로 추출 (이미지 블록은 TextPage 단계에서 제외)
+        textpage = page.get_textpage(flags=_TEXT_SIZE_FLAGS)
+        blocks = textpage.extractDICT(sort=False)["blocks"]
+        del textpage  # 페이지 텍스트 구조 즉시 해제
+        
+        # 페이지에서 텍스트를 찾았으면 기록
+        page_min_size = _page_min_size(blocks)
+        del blocks, page  # 다음 페이지를 추출하기 전에 이 페이지의 블록 딕셔너리 해제
+        if page_min_size < 999:
+            page_sizes[page_index + 1] = distinct_sizes.setdefault(page_min_size, page_min_size)
+    
+    return page_sizes
+
+
+def _scan_page_text_sizes(pdf_path, page_indices):
+    """
+    텍스트 크기 검사 워커 - 자기 프로세스에서 PDF를 직접 열어 페이지 범위 검사
+    
+    PyMuPDF 문서는 프로세스 간에 넘길 수 없으므로 경로만 받아 워커마다 엽니다.
+    
+    Returns:
+        dict: _text_sizes_in_pages()와 같은 형식
+    """
+    with fitz.open(pdf_path) as doc:
+        return _text_sizes_in_pages(doc, page_indices)
+
+
+def _scan_text_sizes_parallel(pdf_path, page_count):
+    """
+    텍스트 크기 검사를 페이지 범위별로 프로세스 풀에 나눠 수행
+    
+    페이지가 적거나 코어가 하나면 워커 시작 비용이 더 크므로 수행하지 않습니다.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        page_count: 전체 페이지 수
+        
+    Returns:
+        list: 페이지 순서대로의 범위별 _text_sizes_in_pages() 결과
+              (병렬로 처리하지 않았거나 실패하면 None → 순차 처리)
+    """
+    workers = min(os.cpu_count() or 1, TEXT_SCAN_MAX_WORKERS)
+    if workers < 2 or page_count < TEXT_SCAN_PARALLEL_MIN_PAGES:
+        return None
+    
+    # 워커마다 비슷한 수의 연속된 페이지 범위
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    ranges = [range(start, end) for start, end in zip(bounds, bounds[1:])]
+    try:
+        # spawn: 부모의 스레드/열린 문서를 fork로 물려받지 않도록 (Windows와 동일)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            return list(executor.map(_scan_page_text_sizes, repeat(str(pdf_path)), ranges))
+    except Exception as e:
+        log.warning("      병렬 텍스트 크기 검사 실패, 순차 처리로 전환: %.50s", e)
+        return None
+
+
+def _format_page_sample(sample, count):
+    """
+    경고 메시지용 페이지 목록 문자열 (예: "1, 3, 5 외 12개")
+    
+    Args:
+        sample: 표본 페이지 번호 목록
+        count: 해당하는 전체 페이지 수
+        
+    Returns:
+        str: 표본 페이지와 나머지 개수
+    """
+    text = ', '.join(map(str, sample))
+    if count > len(sample):
+        text += f" 외 {count - len(sample)}개"
+    return text
+
+
+def _open_or_reuse(opener, pdf_path, doc):
+    """
+    이미 열린 문서가 있으면 그대로 쓰고, 없으면 새로 열기
+    
+    전달받은 문서는 호출한 쪽 소유이므로 with 블록이 끝나도 닫지 않습니다.
+    
+    Args:
+        opener: 문서를 여는 함수 (fitz.open 또는 pikepdf.open)
+        pdf_path: PDF 파일 경로
+        doc: 이미 열린 문서 (없으면 None)
+        
+    Returns:
+        with 문에 사용할 컨텍스트 매니저
+    """
+    if doc is not None:
+        return nullcontext(doc)
+    return opener(pdf_path)
 
 
 class PrintQualityChecker:
@@ -50,6 +548,9 @@ class PrintQualityChecker:
         self.issues = []      # 심각한 문제들을 저장하는 리스트
         self.warnings = []    # 경고사항들을 저장하는 리스트
         
+        # 파일별 Ghostscript 세션 (check_all 한 번 동안 여러 검사가 같은 실행 결과를 공유)
+        self._gs_sessions = {}
+        
         # 외부 도구 상태 확인
         if HAS_EXTERNAL_TOOLS:
             # 외부 도구들(Ghostscript, pdffonts 등)의 설치 상태를 확인
@@ -57,7 +558,7 @@ class PrintQualityChecker:
             
             # Ghostscript가 설치되어 있지 않으면 경고 메시지 출력
             if not self.external_tools_status.get('ghostscript'):
-                print("⚠️  Ghostscript가 설치되어 있지 않습니다. 오버프린트 검사가 제한됩니다.")
+                log.warning("⚠️  Ghostscript가 설치되어 있지 않습니다. 오버프린트 검사가 제한됩니다.")
         
     def check_all(self, pdf_path, pages_info=None):
         """
@@ -70,37 +571,219 @@ class PrintQualityChecker:
         Returns:
             dict: 모든 검사 결과를 담은 딕셔너리
         """
-        print("\n🔍 고급 인쇄 품질 검사 시작...")
+        log.info("\n🔍 고급 인쇄 품질 검사 시작...")
+        
+        # 검사 옵션은 시작할 때 한 번만 읽음
+        options = Config.CHECK_OPTIONS
+        transparency_enabled = options.get('transparency', False)
+        overprint_enabled = options.get('overprint', True)
+        bleed_enabled = options.get('bleed', True)
+        spot_colors_enabled = options.get('spot_colors', True)
+        image_compression_enabled = options.get('image_compression', True)
+        text_size_enabled = options.get('minimum_text', True)
+        
+        # 이전 실행의 Ghostscript 결과는 파일이 바뀌었을 수 있으므로 버림
+        self._gs_sessions.clear()
+        
+        # 오버프린트는 표본 페이지만 Ghostscript로 검사 (작업 스레드를 띄우기 전에 페이지 수 확인)
+        if HAS_EXTERNAL_TOOLS and overprint_enabled:
+            self._ghostscript_session(pdf_path, _overprint_sample_pages(pdf_path, pages_info))
+        
+        # 파일 지문은 한 번만 계산해서 모든 검사의 캐시 키로 사용
+        try:
+            fingerprint = file_fingerprint(pdf_path)
+        except OSError:
+            fingerprint = None  # 지문을 못 만들면 캐시 없이 검사
         
-        # 각 검사 항목별로 결과를 수집합니다
-        # Config.CHECK_OPTIONS에서 각 검사의 활성화 여부를 확인
+        # 문서를 공유하는 검사끼리 묶어 그룹별로 작업 스레드 하나에서 실행
+        # - PyMuPDF는 스레드 안전하지 않으므로 fitz 검사들은 한 스레드에서 문서 하나를 공유
+        # - 별색(pikepdf)과 오버프린트(Ghostscript 외부 프로세스)는 fitz 검사와 동시에 진행
+        # 그룹: (문서 여는 함수, [(검사 이름, 검사 메서드 이름), ...])
+        groups = [
+            (fitz.open, [
+                (name, method) for name, method, enabled in (
+                    ('transparency', 'check_transparency', transparency_enabled),
+                    ('image_compression', 'check_image_compression', image_compression_enabled),
+                    ('text_size', 'check_minimum_text_size', text_size_enabled),
+                ) if enabled
+            ]),
+            (pikepdf.open, [('spot_colors', 'check_spot_color_usage')] if spot_colors_enabled else []),
+            (None, [('overprint', 'check_overprint')] if overprint_enabled else []),
+        ]
+        groups = [(opener, checks) for opener, checks in groups if checks]
+        
+        outputs = {}
+        if groups:
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [
+                    executor.submit(self._run_check_group, pdf_path, fingerprint, opener, checks)
+                    for opener, checks in groups
+                ]
+                
+                # 블리드 검사는 pdf_analyzer의 결과만 쓰므로 그 사이 메인 스레드에서 처리
+                if bleed_enabled:
+                    outputs['bleed'] = self._run_isolated(lambda checker: checker.process_bleed_info(pages_info))
+                
+                for future in futures:
+                    outputs.update(future.result())
+        elif bleed_enabled:
+            outputs['bleed'] = self._run_isolated(lambda checker: checker.process_bleed_info(pages_info))
+        
+        # 비활성화된 검사의 기본 결과
         results = {
-            # 투명도 검사 - 설정에서 활성화된 경우에만 실행
-            'transparency': self.check_transparency(pdf_path) if Config.CHECK_OPTIONS.get('transparency', False) else {'has_transparency': False},
-            
-            # 오버프린트 검사 - 기본적으로 활성화
-            'overprint': self.check_overprint(pdf_path) if Config.CHECK_OPTIONS.get('overprint', True) else {'has_overprint': False},
+            'transparency': {'has_transparency': False},
+            'overprint': {'has_overprint': False},
+            'bleed': {'has_proper_bleed': True},
+            'spot_colors': {'has_spot_colors': False},
+            'image_compression': {'total_images': 0},
+            'text_size': {'has_small_text': False},
+        }
+        
+        # 완료 순서와 관계없이 항상 같은 순서로 결과와 이슈/경고를 합침
+        for name in results:
+            if name in outputs:
+                result, issues, warnings = outputs[name]
+                results[name] = result
+                self.issues.extend(issues)
+                self.warnings.extend(warnings)
+        
+        # 발견된 문제들과 경고사항들
+        results['issues'] = self.issues
+        results['warnings'] = self.warnings
+        
+        return results
+    
+    def _run_isolated(self, run_check):
+        """
+        별도 issues/warnings 목록을 가진 복사본으로 검사 실행
+        
+        여러 스레드의 검사가 self.issues/self.warnings를 동시에 고치지 않도록
+        검사마다 빈 목록을 가진 얕은 복사본을 쓰고, 합치는 것은 check_all이 맡습니다.
+        
+        Args:
+            run_check: 복사본을 받아 검사를 수행하는 함수
             
-            # 블리드 검사는 pdf_analyzer의 결과를 사용
-            'bleed': self.process_bleed_info(pages_info) if Config.CHECK_OPTIONS.get('bleed', True) else {'has_proper_bleed': True},
+        Returns:
+            tuple: (검사 결과, 추가된 issues, 추가된 warnings)
+        """
+        checker = copy.copy(self)
+        checker.issues = []
+        checker.warnings = []
+        result = run_check(checker)
+        return result, checker.issues, checker.warnings
+    
+    def _run_check_group(self, pdf_path, fingerprint, opener, checks):
+        """
+        같은 문서를 쓰는 검사들을 현재 스레드에서 차례로 실행
+        
+        문서는 처음 필요한 검사에서 이 스레드 전용으로 한 번만 열고 그룹이 끝나면 닫습니다.
+        (모든 검사가 캐시에서 나오면 파일을 아예 열지 않음)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            fingerprint: file_fingerprint() 결과
+            opener: 문서를 여는 함수 (None이면 검사가 경로만 사용)
+            checks: [(검사 이름, 검사 메서드 이름), ...]
             
-            # 별색 검사 - 기본적으로 활성화
-            'spot_colors': self.check_spot_color_usage(pdf_path) if Config.CHECK_OPTIONS.get('spot_colors', True) else {'has_spot_colors': False},
+        Returns:
+            dict: {검사 이름: (검사 결과, issues, warnings)}
+        """
+        outputs = {}
+        with ExitStack() as stack:
+            opened = []
             
-            # 이미지 압축 검사 - 기본적으로 활성화
-            'image_compression': self.check_image_compression(pdf_path) if Config.CHECK_OPTIONS.get('image_compression', True) else {'total_images': 0},
+            def shared_doc():
+                """공유 문서 반환 (열기 실패 시 None → 각 검사가 직접 열어 오류 처리)"""
+                if not opened:
+                    try:
+                        opened.append(stack.enter_context(opener(pdf_path)))
+                    except Exception:
+                        opened.append(None)
+                return opened[0]
             
-            # 최소 텍스트 크기 검사 - 기본적으로 활성화
-            'text_size': self.check_minimum_text_size(pdf_path) if Config.CHECK_OPTIONS.get('minimum_text', True) else {'has_small_text': False},
+            for name, method_name in checks:
+                def run_check(checker):
+                    method = getattr(checker, method_name)
+                    if opener is None:
+                        return checker._run_cached(name, fingerprint, lambda: method(pdf_path))
+                    return checker._run_cached(name, fingerprint, lambda: method(pdf_path, shared_doc()))
+                
+                outputs[name] = self._run_isolated(run_check)
+        
+        return outputs
+    
+    def _run_cached(self, check_name, fingerprint, run_check):
+        """
+        디스크 캐시를 거쳐 개별 검사 실행
+        
+        캐시 키는 (파일 지문, 검사 이름, 검사 버전)입니다.
+        검사 결과와 함께 그 검사가 추가한 issues/warnings도 저장해 두었다가
+        캐시 적중 시 그대로 다시 추가합니다.
+        검사 중 오류가 있었거나 검사를 수행하지 못한 결과는 저장하지 않습니다.
+        
+        Args:
+            check_name: 검사 이름 (CHECK_CACHE_VERSIONS의 키)
+            fingerprint: file_fingerprint() 결과 (None이면 캐시 사용 안 함)
+            run_check: 실제 검사를 수행하는 인자 없는 함수
             
-            # 발견된 문제들과 경고사항들
-            'issues': self.issues,
-            'warnings': self.warnings
-        }
+        Returns:
+            dict: 검사 결과
+        """
+        if fingerprint is None:
+            return run_check()
         
-        return results
+        version = CHECK_CACHE_VERSIONS[check_name]
+        suffix = "_allpages" if REPORT_ALL_PAGES else ""  # 페이지 목록 형식이 다르므로 따로 저장
+        cache_file = CHECK_CACHE_DIR / f"{fingerprint}_{check_name}_v{version}{suffix}.pkl"
+        
+        # 캐시 적중 - 저장된 결과와 이슈/경고를 복원
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            self.issues.extend(cached['issues'])
+            self.warnings.extend(cached['warnings'])
+            log.info("  • %s 검사 결과를 캐시에서 불러옴", check_name)
+            return cached['result']
+        except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+            pass
+        
+        issues_before = len(self.issues)
+        warnings_before = len(self.warnings)
+        result = run_check()
+        new_issues = self.issues[issues_before:]
+        new_warnings = self.warnings[warnings_before:]
+        
+        # 오류/미수행 결과는 다음 실행에서 다시 검사하도록 저장하지 않음
+        failed = result.get('_not_checked') or any(
+            w.get('type', '').endswith('_check_error') for w in new_warnings
+        )
+        if not failed:
+            self._store_check_cache(cache_file, {
+                'result': result,
+                'issues': new_issues,
+                'warnings': new_warnings
+            })
+        
+        return result
     
-    def check_transparency(self, pdf_path):
+    def _store_check_cache(self, cache_file, entry):
+        """검사 결과를 캐시에 저장하고 오래된 항목 정리"""
+        try:
+            CHECK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체해서 동시에 읽는 쪽이 잘린 파일을 보지 않게 함
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+            
+            entries = sorted(CHECK_CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+            for old in entries[:-CHECK_CACHE_MAX_ENTRIES]:
+                old.unlink()
+        except OSError as e:
+            # 캐시는 부가 기능이므로 실패해도 검사 결과에는 영향 없음
+            log.warning("    ⚠️ 검사 결과 캐시 저장 실패: %s", e)
+    
+    def check_transparency(self, pdf_path, doc=None):
         """
         투명도 사용 검사
         
@@ -108,94 +791,108 @@ class PrintQualityChecker:
         
         Args:
             pdf_path: PDF 파일 경로
+            doc: 이미 열린 PyMuPDF 문서 (없으면 pdf_path로 직접 엶)
             
         Returns:
             dict: 투명도 검사 결과
         """
-        print("  • 투명도 검사 중...")
+        log.info("  • 투명도 검사 중...")
         
         # 투명도 검사 결과를 저장할 딕셔너리 초기화
         transparency_info = {
             'has_transparency': False,          # 투명도 사용 여부
             'transparent_objects': [],          # 투명도를 사용하는 객체들의 목록
-            'pages_with_transparency': [],      # 투명도가 있는 페이지 번호들
+            'pages_with_transparency': [],      # 투명도가 있는 페이지 번호들 (앞쪽 PAGE_SAMPLE_SIZE개)
+            'transparency_page_count': 0,       # 투명도가 있는 페이지 수
             'requires_flattening': False        # 평탄화 처리가 필요한지 여부
         }
         
         try:
-            # PyMuPDF를 사용해 PDF 파일을 엽니다
-            doc = fitz.open(pdf_path)
-            
-            # 각 페이지를 순회하면서 투명도를 검사
-            for page_num, page in enumerate(doc, 1):  # enumerate(doc, 1)은 1부터 페이지 번호를 시작
-                # 페이지 내용을 딕셔너리 형태로 추출
-                page_dict = page.get_text("dict")
+            # PyMuPDF를 사용해 PDF 파일을 엽니다 (check_all에서 연 문서가 있으면 재사용)
+            with _open_or_reuse(fitz.open, pdf_path, doc) as doc:
+                scanned_streams = {}  # 내용 스트림 xref → 발견된 투명도 연산자 (없으면 None)
                 
-                # 투명도 관련 패턴 검사
-                has_transparency = False
+                # 각 페이지를 순회하면서 투명도를 검사
+                for page_num, page in enumerate(doc, 1):  # enumerate(doc, 1)은 1부터 페이지 번호를 시작
+                    # 투명도 관련 패턴 검사
+                    # (페이지 텍스트는 보지 않으므로 추출하지 않음 - 텍스트는 텍스트 크기 검사에서 한 번만 파싱)
+                    has_transparency = False
                 
-                # 1. 이미지의 알파 채널 검사
-                for img in page.get_images():
-                    xref = img[0]  # 이미지의 참조 번호
-                    pix = fitz.Pixmap(doc, xref)  # 이미지 데이터를 픽스맵으로 변환
-                    
-                    if pix.alpha:  # 알파 채널이 있으면 투명도 사용
-                        has_transparency = True
-                        transparency_info['transparent_objects'].append({
-                            'page': page_num,
-                            'type': 'image_with_alpha',  # 알파 채널을 가진 이미지
-                            'xref': xref
-                        })
+                    # 1. 이미지의 알파 채널 검사
+                    # 이미지를 디코딩하지 않고 메타데이터만 확인
+                    # (full=True 항목: xref, smask, 너비, 높이, bpc, 색공간, 대체 색공간, 이름, 필터, ...)
+                    for img in page.get_images(full=True):
+                        xref = img[0]  # 이미지의 참조 번호
+                        
+                        if img[1]:
+                            # 소프트 마스크(SMask)가 연결된 이미지 = 알파 채널 사용
+                            has_alpha = True
+                        elif img[8] == 'JPXDecode':
+                            # JPEG 2000은 알파를 스트림 안에 담을 수 있어 메타데이터만으로 알 수 없음
+                            pix = fitz.Pixmap(doc, xref)
+                            has_alpha = bool(pix.alpha)
+                            del pix  # 픽셀 버퍼 즉시 해제
+                        else:
+                            has_alpha = False
+                        
+                        if has_alpha:  # 알파 채널이 있으면 투명도 사용
+                            has_transparency = True
+                            transparency_info['transparent_objects'].append({
+                                'page': page_num,
+                                'type': 'image_with_alpha',  # 알파 채널을 가진 이미지
+                                'xref': xref
+                            })
                 
-                # 2. PDF 명령어에서 투명도 관련 연산자 검사
-                contents = page.read_contents()  # 페이지의 원시 PDF 명령어들을 읽음
-                if contents:
-                    # 투명도 관련 PDF 연산자들의 리스트
-                    transparency_operators = [
-                        b'/CA',     # 스트로크 알파 (선 그리기의 투명도)
-                        b'/ca',     # 채우기 알파 (채우기의 투명도)
-                        b'/BM',     # 블렌드 모드 (색상 혼합 방식)
-                        b'/SMask',  # 소프트 마스크 (복잡한 투명도 효과)
-                        b'gs'       # 그래픽 상태 (투명도 설정 포함 가능)
-                    ]
-                    
-                    # 각 연산자가 페이지 내용에 있는지 확인
-                    for op in transparency_operators:
-                        if op in contents:
+                    # 2. PDF 명령어에서 투명도 관련 연산자 검사
+                    # read_contents()처럼 모든 스트림을 이어 붙인 사본을 만들지 않고
+                    # 내용 스트림을 하나씩 읽어 검사 (여러 페이지가 공유하는 스트림은 한 번만 검사)
+                    for contents_xref in page.get_contents():
+                        if contents_xref not in scanned_streams:
+                            contents = doc.xref_stream(contents_xref)  # 페이지의 원시 PDF 명령어들
+                            scanned_streams[contents_xref] = (
+                                _find_transparency_operator(memoryview(contents)) if contents else None
+                            )
+                        
+                        operator = scanned_streams[contents_xref]
+                        if operator:
+                            # 모든 투명도 연산자를 정규식 한 번의 탐색으로 확인 (처음 발견된 것만 기록)
                             has_transparency = True
                             transparency_info['transparent_objects'].append({
                                 'page': page_num,
                                 'type': 'transparency_operator',
-                                'operator': op.decode('utf-8', errors='ignore')  # 바이트를 문자열로 변환
+                                'operator': operator.decode('utf-8', errors='ignore')  # 바이트를 문자열로 변환
                             })
-                            break  # 하나라도 발견되면 루프 종료
+                            break
                 
-                # 투명도가 발견된 페이지를 기록
-                if has_transparency:
-                    transparency_info['has_transparency'] = True
-                    transparency_info['pages_with_transparency'].append(page_num)
-            
-            # 파일을 닫아 메모리를 해제
-            doc.close()
+                    # 투명도가 발견된 페이지를 기록
+                    if has_transparency:
+                        transparency_info['has_transparency'] = True
+                        transparency_info['transparency_page_count'] += 1
+                        pages = transparency_info['pages_with_transparency']
+                        if REPORT_ALL_PAGES or len(pages) < PAGE_SAMPLE_SIZE:
+                            pages.append(page_num)
             
             # 투명도가 있으면 플래튼 필요
             if transparency_info['has_transparency']:
                 transparency_info['requires_flattening'] = True
                 
                 # 경고 메시지를 warnings 리스트에 추가
+                page_count = transparency_info['transparency_page_count']
+                pages = transparency_info['pages_with_transparency']
                 self.warnings.append({
                     'type': 'transparency_detected',
                     'severity': 'warning',
-                    'message': f"투명도가 {len(transparency_info['pages_with_transparency'])}개 페이지에서 발견됨",
-                    'pages': transparency_info['pages_with_transparency'],
+                    'message': f"투명도가 {page_count}개 페이지에서 발견됨 (페이지 {_format_page_sample(pages, page_count)})",
+                    'pages': pages,
+                    'page_count': page_count,
                     'suggestion': "인쇄 전 투명도 평탄화(Flatten Transparency)를 권장합니다"
                 })
             
-            print(f"    ✓ 투명도 검사 완료: {'발견' if transparency_info['has_transparency'] else '없음'}")
+            log.info("    ✓ 투명도 검사 완료: %s", '발견' if transparency_info['has_transparency'] else '없음')
             
         except Exception as e:
             # 예외가 발생하면 에러 메시지를 출력하고 경고에 추가
-            print(f"    ⚠️ 투명도 검사 중 오류: {e}")
+            log.warning("    ⚠️ 투명도 검사 중 오류: %s", e)
             self.warnings.append({
                 'type': 'transparency_check_error',
                 'severity': 'info',
@@ -204,7 +901,7 @@ class PrintQualityChecker:
         
         return transparency_info
     
-    def check_overprint(self, pdf_path):
+    def check_overprint(self, pdf_path, pages=None):
         """
         중복인쇄(Overprint) 설정 검사 - Ghostscript만 사용하는 개선된 버전
         
@@ -218,18 +915,21 @@ class PrintQualityChecker:
         
         Args:
             pdf_path: PDF 파일 경로
+            pages: Ghostscript로 검사할 페이지 번호 목록
+                   (없으면 check_all이 정한 표본 페이지, 단독 호출 시 첫 페이지)
             
         Returns:
             dict: 오버프린트 검사 결과
         """
-        print("  • 중복인쇄 설정 검사 중...")
+        log.info("  • 중복인쇄 설정 검사 중...")
         
         # 기본 결과 구조 - 모든 가능한 키를 미리 정의
         overprint_info = {
             'has_overprint': False,                 # 오버프린트 설정이 있는지
             'has_problematic_overprint': False,     # 문제가 있는 오버프린트인지
             'overprint_objects': [],                # 오버프린트 객체들의 목록
-            'pages_with_overprint': [],             # 오버프린트가 있는 페이지들
+            'pages_with_overprint': [],             # 오버프린트가 있는 페이지들 (앞쪽 PAGE_SAMPLE_SIZE개)
+            'overprint_page_count': 0,              # 오버프린트가 있는 페이지 수
             'white_overprint_pages': [],            # 흰색 오버프린트 페이지들 (문제가 될 수 있음)
             'k_only_overprint_pages': [],           # K(검정)만 있는 오버프린트 페이지들
             'light_color_overprint_pages': [],      # 연한 색상 오버프린트 페이지들
@@ -240,12 +940,14 @@ class PrintQualityChecker:
         
         # 외부 도구 사용 시도
         if HAS_EXTERNAL_TOOLS and hasattr(self, 'external_tools_status') and self.external_tools_status.get('ghostscript'):
-            print("    📊 Ghostscript를 사용한 정확한 분석 중...")
+            log.info("    📊 Ghostscript를 사용한 정확한 분석 중...")
             
             try:
                 # 전체 페이지 검사 여부 결정 (성능 고려)
                 # check_all_pages=False로 설정하여 빠른 검사 수행
-                external_result = check_overprint_external(pdf_path, check_all_pages=False)
+                external_result = check_overprint_external(
+                    pdf_path, check_all_pages=False, session=self._ghostscript_session(pdf_path, pages)
+                )
                 
                 # === 수정된 부분: 더 엄격한 결과 검증 ===
                 # external_result가 딕셔너리인지 확인
@@ -258,6 +960,12 @@ class PrintQualityChecker:
                             if key not in ['_not_checked', '_message', 'success', 'error']:
                                 overprint_info[key] = value
                         
+                        # 페이지 목록은 개수와 앞쪽 표본만 남김
+                        pages = overprint_info['pages_with_overprint']
+                        page_count = overprint_info['overprint_page_count'] = len(pages)
+                        if not REPORT_ALL_PAGES:
+                            pages = overprint_info['pages_with_overprint'] = pages[:PAGE_SAMPLE_SIZE]
+                        
                         # 오버프린트 관련 경고/정보 추가
                         if overprint_info['has_overprint']:
                             if overprint_info['has_problematic_overprint']:
@@ -266,7 +974,8 @@ class PrintQualityChecker:
                                     'type': 'problematic_overprint_detected',
                                     'severity': 'error',
                                     'message': f"문제가 있는 오버프린트 설정 발견",
-                                    'pages': overprint_info['pages_with_overprint'],
+                                    'pages': pages,
+                                    'page_count': page_count,
                                     'suggestion': "오버프린트 설정을 확인하고 필요시 제거하세요"
                                 })
                             else:
@@ -274,33 +983,34 @@ class PrintQualityChecker:
                                 self.warnings.append({
                                     'type': 'overprint_detected',
                                     'severity': 'info',
-                                    'message': f"중복인쇄 설정이 {len(overprint_info['pages_with_overprint'])}개 페이지에서 발견됨",
-                                    'pages': overprint_info['pages_with_overprint'],
+                                    'message': f"중복인쇄 설정이 {page_count}개 페이지에서 발견됨 (페이지 {_format_page_sample(pages, page_count)})",
+                                    'pages': pages,
+                                    'page_count': page_count,
                                     'suggestion': "의도적인 설정인지 확인하세요"
                                 })
                         
-                        print(f"    ✓ 중복인쇄 검사 완료: {'발견' if overprint_info['has_overprint'] else '없음'} (Ghostscript)")
+                        log.info("    ✓ 중복인쇄 검사 완료: %s (Ghostscript)", '발견' if overprint_info['has_overprint'] else '없음')
                         return overprint_info
                     else:
                         # success가 False이거나 error가 있는 경우
                         error_msg = external_result.get('error', 'Ghostscript 실행 실패')
-                        print(f"    ❌ Ghostscript 실행 실패: {error_msg}")
+                        log.warning("    ❌ Ghostscript 실행 실패: %s", error_msg)
                         overprint_info['_not_checked'] = True
                         overprint_info['_message'] = f'Ghostscript 실행 실패: {error_msg}'
                 else:
                     # external_result가 딕셔너리가 아닌 경우
-                    print(f"    ❌ 예상치 못한 반환값 타입: {type(external_result)}")
+                    log.warning("    ❌ 예상치 못한 반환값 타입: %s", type(external_result))
                     overprint_info['_not_checked'] = True
                     overprint_info['_message'] = 'Ghostscript 검사 결과를 처리할 수 없습니다'
                     
             except Exception as e:
                 # 예외 발생 시 안전하게 처리
-                print(f"    ❌ 오버프린트 검사 중 오류: {str(e)}")
+                log.warning("    ❌ 오버프린트 검사 중 오류: %s", e)
                 overprint_info['_not_checked'] = True
                 overprint_info['_message'] = f'오버프린트 검사 중 오류 발생: {str(e)}'
         else:
             # Ghostscript가 없는 경우
-            print("    ❌ Ghostscript가 설치되지 않음 - 오버프린트 검사 불가")
+            log.warning("    ❌ Ghostscript가 설치되지 않음 - 오버프린트 검사 불가")
             overprint_info['_not_checked'] = True
             overprint_info['_message'] = 'Ghostscript가 설치되지 않아 오버프린트 검사를 수행할 수 없습니다'
         
@@ -315,6 +1025,23 @@ class PrintQualityChecker:
         
         return overprint_info
     
+    def _ghostscript_session(self, pdf_path, pages=None):
+        """
+        pdf_path에 대한 Ghostscript 세션 (같은 파일이면 재사용해서 Ghostscript를 한 번만 실행)
+        
+        세션 목록은 검사용 복사본(_run_isolated)과도 공유되므로
+        다른 스레드의 검사도 같은 세션 결과를 볼 수 있습니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 검사할 페이지 목록 (없으면 기존 세션 그대로, 세션이 없으면 첫 페이지)
+        """
+        key = str(pdf_path)
+        session = self._gs_sessions.get(key)
+        if session is None or (pages and session.pages != sorted(set(pages))):
+            session = self._gs_sessions[key] = GhostscriptSession(pdf_path, pages=pages)
+        return session
+    
     def process_bleed_info(self, pages_info):
         """
         pdf_analyzer에서 전달받은 페이지 정보를 기반으로 블리드 정보 처리
@@ -328,14 +1055,16 @@ class PrintQualityChecker:
         Returns:
             dict: 블리드 검사 결과
         """
-        print("  • 재단선 여백 정보 처리 중...")
+        log.info("  • 재단선 여백 정보 처리 중...")
+        
+        min_req = Config.STANDARD_BLEED_SIZE  # 페이지 루프 안에서 반복 조회하지 않도록 한 번만 읽음
         
         # 블리드 정보를 저장할 딕셔너리
         bleed_info = {
             'has_proper_bleed': True,               # 적절한 블리드가 있는지
             'pages_without_bleed': [],              # 블리드가 부족한 페이지들
             'bleed_sizes': {},                      # 각 페이지의 블리드 크기 정보
-            'min_required_bleed': Config.STANDARD_BLEED_SIZE  # 최소 필요 블리드 크기
+            'min_required_bleed': min_req  # 최소 필요 블리드 크기
         }
         
         # pages_info가 없으면 기본값 반환
@@ -356,12 +1085,12 @@ class PrintQualityChecker:
                     }
                     
                     # 재단 여백이 부족한 경우
-                    if min_bleed < Config.STANDARD_BLEED_SIZE:
+                    if min_bleed < min_req:
                         bleed_info['has_proper_bleed'] = False
                         bleed_info['pages_without_bleed'].append({
                             'page': page_num,
                             'current_bleed': min_bleed,
-                            'required_bleed': Config.STANDARD_BLEED_SIZE
+                            'required_bleed': min_req
                         })
                 else:
                     # 블리드 박스가 없는 경우
@@ -369,7 +1098,7 @@ class PrintQualityChecker:
                     bleed_info['pages_without_bleed'].append({
                         'page': page_num,
                         'current_bleed': 0,
-                        'required_bleed': Config.STANDARD_BLEED_SIZE
+                        'required_bleed': min_req
                     })
             
             # 재단 여백 문제를 정보로만 보고 (심각한 오류가 아니므로)
@@ -379,17 +1108,17 @@ class PrintQualityChecker:
                     'severity': 'info',
                     'message': f"{len(bleed_info['pages_without_bleed'])}개 페이지에 재단 여백 부족",
                     'pages': [p['page'] for p in bleed_info['pages_without_bleed']],
-                    'suggestion': f"모든 페이지에 최소 {Config.STANDARD_BLEED_SIZE}mm의 재단 여백이 필요합니다"
+                    'suggestion': f"모든 페이지에 최소 {min_req}mm의 재단 여백이 필요합니다"
                 })
             
-            print(f"    ✓ 재단선 정보 처리 완료: {'정상' if bleed_info['has_proper_bleed'] else '정보 제공됨'}")
+            log.info("    ✓ 재단선 정보 처리 완료: %s", '정상' if bleed_info['has_proper_bleed'] else '정보 제공됨')
             
         except Exception as e:
-            print(f"    ⚠️ 재단선 정보 처리 중 오류: {e}")
+            log.warning("    ⚠️ 재단선 정보 처리 중 오류: %s", e)
         
         return bleed_info
     
-    def check_spot_color_usage(self, pdf_path):
+    def check_spot_color_usage(self, pdf_path, pdf=None):
         """
         별색(Spot Color) 사용 상세 검사
         
@@ -398,51 +1127,65 @@ class PrintQualityChecker:
         
         Args:
             pdf_path: PDF 파일 경로
+            pdf: 이미 열린 pikepdf 문서 (없으면 pdf_path로 직접 엶)
             
         Returns:
             dict: 별색 사용 검사 결과
         """
-        print("  • 별색 사용 상세 검사 중...")
+        log.info("  • 별색 사용 상세 검사 중...")
         
         # 별색 정보를 저장할 딕셔너리
         spot_color_info = {
             'has_spot_colors': False,       # 별색 사용 여부
             'spot_colors': {},              # 사용된 별색들의 상세 정보
             'total_spot_colors': 0,         # 총 별색 개수
-            'pages_with_spots': []          # 별색이 사용된 페이지들
+            'pages_with_spots': [],         # 별색이 사용된 페이지들 (앞쪽 PAGE_SAMPLE_SIZE개)
+            'spot_page_count': 0            # 별색이 사용된 페이지 수
         }
         
         try:
-            # pikepdf를 사용해 PDF 내부 구조를 정밀하게 분석
-            with pikepdf.open(pdf_path) as pdf:
+            # pikepdf를 사용해 PDF 내부 구조를 정밀하게 분석 (check_all에서 연 문서가 있으면 재사용)
+            with _open_or_reuse(pikepdf.open, pdf_path, pdf) as pdf:
+                # 여러 페이지가 간접 참조로 공유하는 ColorSpace 사전은 한 번만 해석
+                names_by_colorspace = {}  # ColorSpace 사전 objgen → 별색 이름 목록
+                page_spots = []           # (페이지 번호, 별색 이름 목록)
+                
                 # 각 페이지를 순회
                 for page_num, page in enumerate(pdf.pages, 1):
                     # 페이지에 리소스가 있고, 그 중에 ColorSpace가 있는지 확인
                     if '/Resources' in page and '/ColorSpace' in page.Resources:
-                        # 색상 공간들을 하나씩 검사
-                        for cs_name, cs_obj in page.Resources.ColorSpace.items():
-                            # Separation 색상 공간 확인 (별색의 PDF 내부 표현)
-                            if isinstance(cs_obj, list) and len(cs_obj) > 0:
-                                if str(cs_obj[0]) == '/Separation':
-                                    spot_color_info['has_spot_colors'] = True
-                                    
-                                    # 별색 이름 추출
-                                    spot_name = str(cs_obj[1]) if len(cs_obj) > 1 else 'Unknown'
-                                    
-                                    # 새로운 별색이면 정보 추가
-                                    if spot_name not in spot_color_info['spot_colors']:
-                                        spot_color_info['spot_colors'][spot_name] = {
-                                            'name': spot_name,
-                                            'pages': [],
-                                            'is_pantone': 'PANTONE' in spot_name.upper()  # PANTONE 색상인지 확인
-                                        }
-                                    
-                                    # 이 별색이 사용된 페이지 추가
-                                    spot_color_info['spot_colors'][spot_name]['pages'].append(page_num)
-                                    
-                                    # 별색이 사용된 페이지 목록에 추가 (중복 제거)
-                                    if page_num not in spot_color_info['pages_with_spots']:
-                                        spot_color_info['pages_with_spots'].append(page_num)
+                        colorspaces = page.Resources.ColorSpace
+                        key = colorspaces.objgen  # 직접 객체는 (0, 0)이라 공유될 수 없음
+                        if key != (0, 0) and key in names_by_colorspace:
+                            spot_names = names_by_colorspace[key]
+                        else:
+                            spot_names = _spot_color_names(colorspaces)
+                            if key != (0, 0):
+                                names_by_colorspace[key] = spot_names
+                        
+                        if spot_names:
+                            page_spots.append((page_num, spot_names))
+                
+                # 페이지별 별색 사용 정보 합치기
+                for page_num, spot_names in page_spots:
+                    spot_color_info['has_spot_colors'] = True
+                    
+                    for spot_name in spot_names:
+                        # 새로운 별색이면 정보 추가
+                        if spot_name not in spot_color_info['spot_colors']:
+                            spot_color_info['spot_colors'][spot_name] = {
+                                'name': spot_name,
+                                'pages': [],
+                                'is_pantone': bool(_PANTONE_RE.search(spot_name))  # PANTONE 색상인지 확인
+                            }
+                        
+                        # 이 별색이 사용된 페이지 추가
+                        spot_color_info['spot_colors'][spot_name]['pages'].append(page_num)
+                    
+                    # 별색이 사용된 페이지 수와 앞쪽 표본 (페이지 순서대로 한 번씩)
+                    spot_color_info['spot_page_count'] += 1
+                    if REPORT_ALL_PAGES or len(spot_color_info['pages_with_spots']) < PAGE_SAMPLE_SIZE:
+                        spot_color_info['pages_with_spots'].append(page_num)
             
             # 총 별색 개수 계산
             spot_color_info['total_spot_colors'] = len(spot_color_info['spot_colors'])
@@ -454,9 +1197,12 @@ class PrintQualityChecker:
                                 if info['is_pantone']]
                 
                 # 메시지 구성
+                page_count = spot_color_info['spot_page_count']
+                pages = spot_color_info['pages_with_spots']
                 message = f"별색 {spot_color_info['total_spot_colors']}개 사용 중"
                 if pantone_colors:
                     message += f" (PANTONE {len(pantone_colors)}개 포함)"
+                message += f" - {page_count}개 페이지 (페이지 {_format_page_sample(pages, page_count)})"
                 
                 # 경고 추가 (별색은 추가 비용이 발생하므로)
                 self.warnings.append({
@@ -464,17 +1210,18 @@ class PrintQualityChecker:
                     'severity': 'info',
                     'message': message,
                     'spot_colors': list(spot_color_info['spot_colors'].keys()),
+                    'page_count': page_count,
                     'suggestion': "별색 사용 시 추가 인쇄 비용이 발생합니다. 의도적인 사용인지 확인하세요"
                 })
             
-            print(f"    ✓ 별색 검사 완료: {spot_color_info['total_spot_colors']}개 발견")
+            log.info("    ✓ 별색 검사 완료: %d개 발견", spot_color_info['total_spot_colors'])
             
         except Exception as e:
-            print(f"    ⚠️ 별색 검사 중 오류: {e}")
+            log.warning("    ⚠️ 별색 검사 중 오류: %s", e)
         
         return spot_color_info
     
-    def check_image_compression(self, pdf_path):
+    def check_image_compression(self, pdf_path, doc=None, pdf=None):
         """
         이미지 압축 품질 검사
         
@@ -483,11 +1230,13 @@ class PrintQualityChecker:
         
         Args:
             pdf_path: PDF 파일 경로
+            doc: 이미 열린 PyMuPDF 문서 (없으면 pdf_path로 직접 엶)
+            pdf: 이미 열린 pikepdf 문서 (이미지 필터 읽기용, 없으면 pdf_path로 직접 엶)
             
         Returns:
             dict: 이미지 압축 검사 결과
         """
-        print("  • 이미지 압축 품질 검사 중...")
+        log.info("  • 이미지 압축 품질 검사 중...")
         
         # 압축 정보를 저장할 딕셔너리
         compression_info = {
@@ -499,93 +1248,129 @@ class PrintQualityChecker:
         }
         
         try:
-            # PyMuPDF로 PDF 열기
-            doc = fitz.open(pdf_path)
-            
-            # 각 페이지의 이미지들을 검사
-            for page_num, page in enumerate(doc, 1):
-                for img_index, img in enumerate(page.get_images()):
-                    compression_info['total_images'] += 1
-                    xref = img[0]  # 이미지의 참조 번호
+            # PyMuPDF로 PDF 열기 (check_all에서 연 문서가 있으면 재사용)
+            # pikepdf 문서는 이미지 필터를 구조 그대로 읽는 데 사용
+            # (check_all에서는 별색 검사와 다른 스레드이므로 이 검사용으로 따로 엶)
+            with _open_or_reuse(fitz.open, pdf_path, doc) as doc, \
+                    _open_or_reuse(pikepdf.open, pdf_path, pdf) as pdf:
+                # 이미지별 사용 위치 (xref → [(페이지 번호, 페이지 내 인덱스), ...])
+                # 여러 페이지에 쓰인 이미지도 사전은 한 번만 읽고 개수는 사용 위치 수만큼 셈
+                # (full=True 항목: xref, smask, 너비, 높이, bpc, 색공간, 대체 색공간, 이름, 필터, ...)
+                usage = defaultdict(list)
+                first_filters = {}  # xref → 필터 체인의 첫 필터 이름 (없으면 빈 문자열)
+                for page_num, page in enumerate(doc, 1):
+                    for img_index, img in enumerate(page.get_images(full=True)):
+                        usage[img[0]].append((page_num, img_index))
+                        first_filters[img[0]] = img[8]
+                        compression_info['total_images'] += 1
+                
+                # JPEG 이미지 정보는 이미지마다 dict/tuple을 만들지 않고 항목별 열(column)로 모음
+                jpeg_pages, jpeg_indices, jpeg_xrefs = [], [], []
+                jpeg_sizes, jpeg_widths, jpeg_heights = [], [], []
+                compression_types = Counter()
+                
+                # 개별 이미지 처리 실패는 이미지마다 출력하지 않고 예외 종류별로 세어 한 번에 보고
+                err_counter = Counter()
+                
+                # 고유 이미지마다 한 번씩 검사 - 픽셀을 디코딩하지 않고 이미지 사전의 키만 읽음
+                for xref, locations in usage.items():
+                    uses = len(locations)
                     
                     # 이미지 정보 추출
                     try:
-                        # PDF 내부의 이미지 객체 정보 가져오기
-                        img_dict = doc.xref_object(xref)
+                        # 이미지 전용 필터면 그것이 유일한(마지막) 필터이므로 사전을 다시 읽지 않음
+                        if first_filters[xref] in _IMAGE_ONLY_FILTERS:
+                            filter_names = [first_filters[xref]]
+                        else:
+                            filter_names = _image_filters(pdf, doc, xref)
+                        if not filter_names:
+                            continue  # 압축되지 않은 이미지
+                        
+                        # 필터 체인의 마지막이 실제 이미지 압축 방식
+                        filter_name = filter_names[-1]
+                        
+                        # 압축 타입별 개수 카운트
+                        compression_types[filter_name] += uses
                         
-                        # img_dict가 문자열인 경우가 있음 - 타입 체크 추가
-                        if isinstance(img_dict, str):
-                            # 문자열인 경우 간단히 파싱 시도
-                            if 'DCTDecode' in img_dict:  # JPEG 압축 방식
-                                compression_info['jpeg_compressed'] += 1
-                                if 'DCTDecode' not in compression_info['compression_types']:
-                                    compression_info['compression_types']['DCTDecode'] = 0
-                                compression_info['compression_types']['DCTDecode'] += 1
-                            continue  # 다음 이미지로 넘어감
+                        # JPEG 압축 확인 - 압축된 크기는 디코딩 없이 원본 스트림 길이로
+                        if 'DCTDecode' in filter_names:
+                            compression_info['jpeg_compressed'] += uses
+                            width, height = _image_size(doc, xref)
+                            size = len(doc.xref_stream_raw(xref))
+                            for page_num, img_index in locations:
+                                jpeg_pages.append(page_num)
+                                jpeg_indices.append(img_index)
+                            jpeg_xrefs.extend([xref] * uses)
+                            jpeg_sizes.extend([size] * uses)
+                            jpeg_widths.extend([width] * uses)
+                            jpeg_heights.extend([height] * uses)
                         
-                        # 정상적인 딕셔너리인 경우
-                        if '/Filter' in img_dict:
-                            filter_type = img_dict['/Filter']
-                            
-                            # 필터가 리스트인 경우 첫 번째 요소 사용
-                            if isinstance(filter_type, list):
-                                filter_type = filter_type[0]
-                            
-                            # 슬래시(/) 제거하여 필터 이름 추출
-                            filter_name = str(filter_type).replace('/', '')
-                            
-                            # 압축 타입별 개수 카운트
-                            if filter_name not in compression_info['compression_types']:
-                                compression_info['compression_types'][filter_name] = 0
-                            compression_info['compression_types'][filter_name] += 1
-                            
-                            # JPEG 압축 확인
-                            if 'DCTDecode' in filter_name:
-                                compression_info['jpeg_compressed'] += 1
-                                
-                                # 더 정밀한 이미지 품질 분석 시도
-                                try:
-                                    quality_detail = self._analyze_image_quality_detailed(
-                                        xref, doc, page_num, img_index
-                                    )
-                                    compression_info['quality_details'].append(quality_detail)
-                                    
-                                    # 기존 로직과 호환성 유지
-                                    if quality_detail['print_suitability'] == '인쇄 부적합':
-                                        compression_info['low_quality_images'].append({
-                                            'page': page_num,
-                                            'image_index': img_index,
-                                            'compression_ratio': quality_detail['compression_ratio'],
-                                            'size': quality_detail['size'],
-                                            'quality_level': quality_detail['estimated_jpeg_quality']
-                                        })
-                                except:
-                                    # 상세 분석 실패 시 기존 방식 사용
-                                    pix = fitz.Pixmap(doc, xref)
-                                    pixel_count = pix.width * pix.height
-                                    stream = doc.xref_stream(xref)
-                                    compressed_size = len(stream)
-                                    
-                                    # 압축률 계산 (압축된 크기 / 픽셀 수)
-                                    compression_ratio = compressed_size / pixel_count if pixel_count > 0 else 1
-                                    
-                                    # 압축률이 너무 높으면 (0.5 미만) 품질 문제로 판단
-                                    if compression_ratio < 0.5:
-                                        compression_info['low_quality_images'].append({
-                                            'page': page_num,
-                                            'image_index': img_index,
-                                            'compression_ratio': compression_ratio,
-                                            'size': f"{pix.width}x{pix.height}"
-                                        })
-                                    pix = None  # 메모리 해제
-                                    
                     except Exception as e:
                         # 개별 이미지 처리 실패는 무시하고 계속 진행
-                        print(f"      이미지 {xref} 처리 중 오류: {str(e)[:50]}")
+                        err_counter[type(e).__name__] += 1
                         continue
-            
-            # 파일 닫기
-            doc.close()
+                
+                if err_counter:
+                    log.warning("      이미지 %d개 처리 중 오류: %s", sum(err_counter.values()),
+                                ", ".join(f"{name} {count}개" for name, count in err_counter.most_common()))
+                
+                compression_info['compression_types'] = dict(compression_types)
+                
+                xrefs = np.asarray(jpeg_xrefs, dtype=np.int64)
+                sizes = np.asarray(jpeg_sizes, dtype=np.int64)
+                widths = np.asarray(jpeg_widths, dtype=np.int64)
+                heights = np.asarray(jpeg_heights, dtype=np.int64)
+                
+                # 압축된 크기 / 픽셀 수를 모든 JPEG 이미지에 대해 한 번에 계산
+                pixel_counts = widths * heights
+                compression_ratios = np.divide(
+                    sizes, pixel_counts, out=np.ones(len(sizes)), where=pixel_counts > 0
+                )
+                
+                # 원본 스트림을 읽는 상세 분석은 압축된 크기가 큰 JPEG 이미지 일부에만 수행
+                # (같은 이미지가 여러 번 쓰였으면 하나로 보고, 크기가 같으면 xref가 큰 순)
+                unique_xrefs, first = np.unique(xrefs, return_index=True)
+                largest = np.lexsort((unique_xrefs, sizes[first]))[::-1][:DEEP_ANALYSIS_MAX_IMAGES]
+                deep = np.flatnonzero(np.isin(xrefs, unique_xrefs[largest]))
+                
+                # 결과는 이미지별이 아니라 페이지 순서로 보고
+                pages = np.asarray(jpeg_pages, dtype=np.int64)
+                indices = np.asarray(jpeg_indices, dtype=np.int64)
+                deep = deep[np.lexsort((indices[deep], pages[deep]))]
+                
+                # 여러 페이지에 쓰인 이미지는 한 번만 분석 (xref → _analyze_image 결과, 이 검사 안에서만)
+                analyses = {}
+                for i in deep.tolist():
+                    page_num, img_index, xref = jpeg_pages[i], jpeg_indices[i], jpeg_xrefs[i]
+                    
+                    # 더 정밀한 이미지 품질 분석 시도
+                    try:
+                        quality_detail = self._analyze_image_quality_detailed(
+                            xref, doc, page_num, img_index, analyses
+                        )
+                        compression_info['quality_details'].append(quality_detail)
+                        
+                        # 기존 로직과 호환성 유지
+                        if quality_detail['print_suitability'] == '인쇄 부적합':
+                            compression_info['low_quality_images'].append({
+                                'page': page_num,
+                                'image_index': img_index,
+                                'compression_ratio': quality_detail['compression_ratio'],
+                                'size': quality_detail['size'],
+                                'quality_level': quality_detail['estimated_jpeg_quality']
+                            })
+                    except Exception:
+                        # 상세 분석 실패 시 기존 방식 사용 (미리 계산한 압축률 = 압축된 크기 / 픽셀 수)
+                        compression_ratio = float(compression_ratios[i])
+                        
+                        # 압축률이 너무 높으면 (0.5 미만) 품질 문제로 판단
+                        if compression_ratio < 0.5:
+                            compression_info['low_quality_images'].append({
+                                'page': page_num,
+                                'image_index': img_index,
+                                'compression_ratio': compression_ratio,
+                                'size': f"{jpeg_widths[i]}x{jpeg_heights[i]}"
+                            })
             
             # 압축 품질 문제 보고
             if compression_info['low_quality_images']:
@@ -597,10 +1382,11 @@ class PrintQualityChecker:
                     'suggestion': "인쇄 품질을 위해 이미지 압축률을 낮추는 것을 권장합니다"
                 })
             
-            print(f"    ✓ 이미지 압축 검사 완료: {compression_info['total_images']}개 이미지 중 {compression_info['jpeg_compressed']}개 JPEG 압축")
+            log.info("    ✓ 이미지 압축 검사 완료: %d개 이미지 중 %d개 JPEG 압축",
+                     compression_info['total_images'], compression_info['jpeg_compressed'])
             
         except Exception as e:
-            print(f"    ⚠️ 이미지 압축 검사 중 오류: {e}")
+            log.warning("    ⚠️ 이미지 압축 검사 중 오류: %s", e)
             self.warnings.append({
                 'type': 'image_compression_check_error',
                 'severity': 'info',
@@ -609,17 +1395,20 @@ class PrintQualityChecker:
         
         return compression_info
     
-    def _analyze_image_quality_detailed(self, xref, doc, page_num, img_index):
+    def _analyze_image_quality_detailed(self, xref, doc, page_num, img_index, analyses=None):
         """
         더 정밀한 이미지 품질 분석
         
         이 함수는 이미지의 압축률, JPEG 품질, 인쇄 적합성을 종합적으로 분석합니다.
+        analyses dict를 넘기면 분석 결과를 xref별로 보관하므로 여러 페이지에서 쓰인 이미지는
+        한 번만 분석하고, 페이지 번호/이미지 인덱스만 호출마다 새로 채웁니다.
         
         Args:
             xref: 이미지 참조 번호
             doc: PDF 문서 객체
             page_num: 페이지 번호
             img_index: 페이지 내 이미지 인덱스
+            analyses: 같은 문서의 분석 결과 보관용 dict (xref → 결과, 없으면 매번 분석)
             
         Returns:
             dict: 상세한 품질 분석 결과
@@ -636,57 +1425,25 @@ class PrintQualityChecker:
         }
         
         try:
-            # 이미지 데이터 추출
-            pix = fitz.Pixmap(doc, xref)
-            pixel_count = pix.width * pix.height * pix.n  # 색상 채널 고려
-            stream = doc.xref_stream(xref)  # 압축된 이미지 데이터
-            compressed_size = len(stream)
-            
-            # 기본 정보 설정
-            quality_info['size'] = f"{pix.width}x{pix.height}"
-            quality_info['compression_ratio'] = compressed_size / pixel_count if pixel_count > 0 else 1
-            
-            # JPEG 품질 추정
-            if b'\xff\xdb' in stream[:500]:  # 양자화 테이블 마커가 있으면
-                # 간단한 품질 추정 (양자화 테이블 분석은 복잡하므로 간략화)
-                bytes_per_pixel = compressed_size / (pix.width * pix.height)
-                
-                # 픽셀당 바이트 수로 품질 추정
-                if bytes_per_pixel < 0.3:
-                    quality_info['estimated_jpeg_quality'] = '매우 낮음 (50 이하)'
-                elif bytes_per_pixel < 0.5:
-                    quality_info['estimated_jpeg_quality'] = '낮음 (50-70)'
-                elif bytes_per_pixel < 0.8:
-                    quality_info['estimated_jpeg_quality'] = '보통 (70-85)'
-                else:
-                    quality_info['estimated_jpeg_quality'] = '높음 (85 이상)'
-            
-            # 이미지 용도별 적합성 판단
-            if pix.width < 300 or pix.height < 300:
-                # 작은 이미지는 품질이 덜 중요
-                quality_info['visual_impact'] = '작은 아이콘/로고'
-                quality_info['print_suitability'] = '품질 무관'
-            else:
-                # 큰 이미지는 품질이 중요
-                bytes_per_pixel = compressed_size / (pix.width * pix.height)
-                if bytes_per_pixel < 0.3:
-                    quality_info['visual_impact'] = '눈에 띄는 품질 저하'
-                    quality_info['print_suitability'] = '인쇄 부적합'
-                elif bytes_per_pixel < 0.5:
-                    quality_info['visual_impact'] = '약간의 품질 저하'
-                    quality_info['print_suitability'] = '일반 문서 가능'
-                else:
-                    quality_info['visual_impact'] = '양호'
-                    quality_info['print_suitability'] = '고품질 인쇄 가능'
-            
-            pix = None  # 메모리 해제
-            
+            analysis = None if analyses is None else analyses.get(xref)
+            if analysis is None:
+                # 분석 중 예외가 나면 보관하지 않음 (다음 사용 위치에서 다시 시도)
+                analysis = _analyze_image(doc, xref)
+                if analyses is not None:
+                    analyses[xref] = analysis
         except Exception as e:
-            print(f"      상세 품질 분석 오류: {str(e)[:50]}")
+            log.warning("      상세 품질 분석 오류: %.50s", e)
+            return quality_info
+        
+        (quality_info['size'], quality_info['compression_ratio'],
+         quality_info['estimated_jpeg_quality'], jpeg_quality,
+         quality_info['visual_impact'], quality_info['print_suitability']) = analysis
+        if jpeg_quality is not None:
+            quality_info['jpeg_quality'] = jpeg_quality
         
         return quality_info
     
-    def check_minimum_text_size(self, pdf_path):
+    def check_minimum_text_size(self, pdf_path, doc=None):
         """
         최소 텍스트 크기 검사
         
@@ -695,11 +1452,12 @@ class PrintQualityChecker:
         
         Args:
             pdf_path: PDF 파일 경로
+            doc: 이미 열린 PyMuPDF 문서 (없으면 pdf_path로 직접 엶)
             
         Returns:
             dict: 텍스트 크기 검사 결과
         """
-        print("  • 최소 텍스트 크기 검사 중...")
+        log.info("  • 최소 텍스트 크기 검사 중...")
         
         # 텍스트 크기 정보를 저장할 딕셔너리
         text_size_info = {
@@ -709,54 +1467,28 @@ class PrintQualityChecker:
             'has_small_text': False         # 작은 텍스트 존재 여부
         }
         
-        MIN_TEXT_SIZE = 4.0  # 최소 권장 크기 (포인트)
-        
         try:
-            # PyMuPDF로 PDF 열기
-            doc = fitz.open(pdf_path)
-            
-            # 각 페이지의 텍스트를 검사
-            for page_num, page in enumerate(doc, 1):
-                # 텍스트 블록을 딕셔너리 형태로 추출
-                blocks = page.get_text("dict")
-                page_min_size = 999  # 페이지별 최소 크기 초기화
-                
-                # 각 블록을 순회
-                for block in blocks.get("blocks", []):
-                    if block.get("type") == 0:  # 텍스트 블록인 경우 (type 0)
-                        # 라인들을 순회
-                        for line in block.get("lines", []):
-                            # 스팬(같은 스타일의 텍스트 구간)들을 순회
-                            for span in line.get("spans", []):
-                                font_size = span.get("size", 0)  # 폰트 크기 추출
-                                
-                                if font_size > 0:
-                                    # 페이지별 최소 크기 업데이트
-                                    if font_size < page_min_size:
-                                        page_min_size = font_size
-                                    
-                                    # 전체 최소 크기 업데이트
-                                    if font_size < text_size_info['min_size_found']:
-                                        text_size_info['min_size_found'] = font_size
-                                    
-                                    # 너무 작은 텍스트 확인
-                                    if font_size < MIN_TEXT_SIZE:
-                                        text_size_info['has_small_text'] = True
-                                        
-                                        # 중복 방지: 이미 추가된 페이지인지 확인
-                                        existing_pages = [p['page'] for p in text_size_info['small_text_pages']]
-                                        if page_num not in existing_pages:
-                                            text_size_info['small_text_pages'].append({
-                                                'page': page_num,
-                                                'min_size': font_size
-                                            })
-                
-                # 페이지에서 텍스트를 찾았으면 기록
-                if page_min_size < 999:
-                    text_size_info['text_sizes'][page_num] = page_min_size
+            # PyMuPDF로 PDF 열기 (check_all에서 연 문서가 있으면 재사용)
+            with _open_or_reuse(fitz.open, pdf_path, doc) as doc:
+                # 페이지가 많으면 페이지 범위별로 워커 프로세스에서 검사, 아니면 이 문서로 직접 검사
+                page_count = len(doc)
+                partials = _scan_text_sizes_parallel(pdf_path, page_count)
+                if partials is None:
+                    partials = [_text_sizes_in_pages(doc, range(page_count))]
+            
+            # 범위별 결과를 페이지 순서대로 합침
+            text_sizes = text_size_info['text_sizes']
+            for partial in partials:
+                text_sizes.update(partial)
             
-            # 파일 닫기
-            doc.close()
+            # 전체 최소 크기와 작은 텍스트 페이지는 페이지별 최소 크기에서 한 번에 계산
+            text_size_info['min_size_found'] = min(text_sizes.values(), default=999)
+            text_size_info['small_text_pages'] = [
+                SmallTextPage(page_num, page_min_size)
+                for page_num, page_min_size in text_sizes.items()
+                if page_min_size < MIN_TEXT_SIZE
+            ]
+            text_size_info['has_small_text'] = bool(text_size_info['small_text_pages'])
             
             # 작은 텍스트 경고
             if text_size_info['has_small_text']:
@@ -764,14 +1496,14 @@ class PrintQualityChecker:
                     'type': 'small_text_detected',
                     'severity': 'warning',
                     'message': f"{len(text_size_info['small_text_pages'])}개 페이지에 {MIN_TEXT_SIZE}pt 미만의 작은 텍스트 발견",
-                    'pages': [p['page'] for p in text_size_info['small_text_pages']],
+                    'pages': [p.page for p in text_size_info['small_text_pages']],
                     'min_found': f"{text_size_info['min_size_found']:.1f}pt",
                     'suggestion': f"인쇄 가독성을 위해 최소 {MIN_TEXT_SIZE}pt 이상의 텍스트 크기를 권장합니다"
                 })
             
-            print(f"    ✓ 텍스트 크기 검사 완료: 최소 {text_size_info['min_size_found']:.1f}pt")
+            log.info("    ✓ 텍스트 크기 검사 완료: 최소 %.1fpt", text_size_info['min_size_found'])
             
         except Exception as e:
-            print(f"    ⚠️ 텍스트 크기 검사 중 오류: {e}")
+            log.warning("    ⚠️ 텍스트 크기 검사 중 오류: %s", e)
         
         return text_size_info
\ No newline at end of file
@@ -0,0 +1,105 @@
+# quality_utils.py - 이미지 품질 분석용 수치 계산 함수
+# JPEG 양자화 테이블을 읽어 실제 품질 계수(Quality Factor)를 추정합니다
+
+"""
+quality_utils.py - 이미지 품질 분석 도우미
+numba가 설치되어 있으면 바이트 단위 스캔 루프를 JIT 컴파일해서 실행합니다.
+"""
+
+import numpy as np
+
+# numba가 있으면 JPEG 마커 스캔을 JIT 컴파일된 함수로 수행 (없으면 같은 코드를 파이썬으로 실행)
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# IJG(libjpeg) 표준 휘도 양자화 테이블의 합계 (품질 50일 때의 기준 테이블)
+_IJG_LUMINANCE_TABLE_SUM = 3688
+
+
+def _estimate_jpeg_quality_python(buf):
+    """
+    JPEG 바이트 배열에서 품질 계수 추정 (numba/파이썬 공용 구현)
+
+    SOI부터 세그먼트를 차례로 건너뛰며 DQT(0xFFDB) 세그먼트의
+    0번(휘도) 양자화 테이블을 찾고, 테이블 합계를 IJG 기준 테이블과 비교해
+    IJG 품질 공식(scale = 5000/Q 또는 200 - 2Q)을 거꾸로 풉니다.
+
+    Args:
+        buf: JPEG 파일 내용 (uint8 1차원 배열)
+
+    Returns:
+        int: 추정 품질 (1~100), 양자화 테이블을 찾지 못하면 -1
+    """
+    n = buf.shape[0]
+    if n < 4 or buf[0] != 0xFF or buf[1] != 0xD8:
+        return -1
+
+    pos = 2
+    while pos + 4 <= n:
+        if buf[pos] != 0xFF:
+            return -1  # 세그먼트 구조가 깨짐
+        marker = np.int64(buf[pos + 1])
+        if marker == 0xFF:
+            pos += 1  # 채움 바이트
+            continue
+        if marker == 0x01 or (0xD0 <= marker <= 0xD8):
+            pos += 2  # 길이 없는 마커 (TEM, RSTn, SOI)
+            continue
+        if marker == 0xDA or marker == 0xD9:
+            break  # 스캔 데이터(SOS) 또는 EOI 이후에는 테이블 없음
+
+        seg_end = pos + 2 + ((np.int64(buf[pos + 2]) << 8) | np.int64(buf[pos + 3]))
+        if marker == 0xDB:
+            p = pos + 4
+            while p < seg_end and p < n:
+                precision = np.int64(buf[p]) >> 4   # 0: 8비트, 1: 16비트 값
+                table_id = np.int64(buf[p]) & 0x0F
+                p += 1
+                size = 128 if precision else 64
+                if p + size > n:
+                    return -1
+                if table_id == 0:
+                    total = 0
+                    for i in range(64):
+                        if precision:
+                            total += (np.int64(buf[p + 2 * i]) << 8) | np.int64(buf[p + 2 * i + 1])
+                        else:
+                            total += np.int64(buf[p + i])
+
+                    scale = total * 100.0 / _IJG_LUMINANCE_TABLE_SUM
+                    if scale <= 100.0:
+                        quality = (200.0 - scale) / 2.0
+                    else:
+                        quality = 5000.0 / scale
+                    quality = int(quality + 0.5)
+                    return min(max(quality, 1), 100)
+                p += size
+        pos = seg_end
+
+    return -1
+
+
+if HAS_NUMBA:
+    _estimate_jpeg_quality = numba.njit(cache=True)(_estimate_jpeg_quality_python)
+else:
+    _estimate_jpeg_quality = _estimate_jpeg_quality_python
+
+
+def estimate_jpeg_quality(buf):
+    """
+    JPEG 데이터의 품질 계수(IJG 기준 1~100) 추정
+
+    Args:
+        buf: JPEG 스트림 (bytes 또는 uint8 배열, 압축된 원본 그대로)
+
+    Returns:
+        int 또는 None: 추정 품질 (양자화 테이블이 없거나 JPEG가 아니면 None)
+    """
+    if not isinstance(buf, np.ndarray):
+        buf = np.frombuffer(buf, dtype=np.uint8)
+    quality = _estimate_jpeg_quality(buf)
+    return quality if quality > 0 else None
@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, FrozenSet, Optional, TextIO
 from pathlib import Path
 
 from config import Config
@@ -14,6 +14,12 @@ from config import Config
 class BaseReportBuilder(ABC):
     """보고서 빌더 기본 클래스"""
     
+    # 인스턴스 속성을 슬롯으로 고정 (하위 클래스도 자기 속성을 __slots__로 선언)
+    __slots__ = ('config',)
+    
+    # validate_data가 확인하는 필수 키 (더 필요한 빌더는 재정의)
+    _REQUIRED_KEYS: ClassVar[FrozenSet[str]] = frozenset({'filename', 'basic_info'})
+    
     def __init__(self, config: Config):
         """
         빌더 초기화
@@ -37,6 +43,20 @@ class BaseReportBuilder(ABC):
         """
         pass
     
+    def build_to(self, analysis_result: Dict[str, Any], prepared_data: Dict[str, Any], fp: TextIO):
+        """
+        보고서를 열린 파일에 바로 기록
+        
+        기본 구현은 build() 결과를 한 번에 씁니다.
+        섹션 단위로 만들 수 있는 빌더는 재정의해서 조각마다 기록합니다.
+        
+        Args:
+            analysis_result: PDF 분석 결과
+            prepared_data: 준비된 추가 데이터
+            fp: 쓰기 모드로 연 텍스트 파일
+        """
+        fp.write(self.build(analysis_result, prepared_data))
+    
     def get_file_extension(self) -> str:
         """
         파일 확장자 반환
@@ -56,13 +76,8 @@ class BaseReportBuilder(ABC):
         Returns:
             bool: 유효성 여부
         """
-        # 필수 키 확인
-        required_keys = ['filename', 'basic_info']
-        for key in required_keys:
-            if key not in analysis_result:
-                return False
-        
-        return True
+        # 필수 키 확인 (집합 포함 검사)
+        return self._REQUIRED_KEYS.issubset(analysis_result)
     
     def format_file_info(self, analysis_result: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -8,7 +8,7 @@ from typing import Dict, Any, List
 from pathlib import Path
 
 from config import Config
-from utils import format_datetime
+from utils import format_datetime, real_fonts
 from .base_builder import BaseReportBuilder
 from ..core.issue_analyzer import IssueAnalyzer
 
@@ -16,6 +16,8 @@ from ..core.issue_analyzer import IssueAnalyzer
 class HTMLReportBuilder(BaseReportBuilder):
     """HTML 보고서 빌더"""
     
+    __slots__ = ('issue_analyzer',)
+    
     def __init__(self, config: Config):
         """HTML 빌더 초기화"""
         super().__init__(config)
@@ -1167,7 +1169,7 @@ class HTMLReportBuilder(BaseReportBuilder):
         page_consistency = (len(most_common_size[1]) / len(pages) * 100) if pages and most_common_size else 100
         
         # 폰트 임베딩 - 중복 제거 (요구사항 8번)
-        fonts = analysis_result.get('fonts', {})
+        fonts = real_fonts(analysis_result.get('fonts', {}))
         # 폰트명 기준으로 유니크하게 처리
         unique_fonts = {}
         for font_key, font_info in fonts.items():
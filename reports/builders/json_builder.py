@@ -4,13 +4,12 @@ JSON 형식 보고서 생성 모듈
 API 연동 및 데이터 교환을 위한 구조화된 JSON 생성
 """
 
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO
 from datetime import datetime
 from pathlib import Path
 
 from config import Config
-from utils import format_datetime
+from utils import format_datetime, dumps_json, dump_json, real_fonts
 from .base_builder import BaseReportBuilder
 from ..core.issue_analyzer import IssueAnalyzer
 
@@ -18,6 +17,8 @@ from ..core.issue_analyzer import IssueAnalyzer
 class JSONReportBuilder(BaseReportBuilder):
     """JSON 보고서 빌더"""
     
+    __slots__ = ('issue_analyzer',)
+    
     def __init__(self, config: Config):
         """JSON 빌더 초기화"""
         super().__init__(config)
@@ -44,7 +45,19 @@ class JSONReportBuilder(BaseReportBuilder):
         report_data = self._structure_report_data(analysis_result)
         
         # JSON 문자열로 변환
-        return json.dumps(report_data, ensure_ascii=False, indent=2)
+        return dumps_json(report_data, indent=True)
+    
+    def build_to(self, analysis_result: Dict[str, Any], prepared_data: Dict[str, Any], fp: TextIO):
+        """
+        JSON 보고서를 파일에 바로 직렬화 (build()와 같은 내용)
+        
+        Args:
+            analysis_result: PDF 분석 결과
+            prepared_data: 준비된 추가 데이터 (JSON에서는 사용하지 않음)
+            fp: 쓰기 모드로 연 텍스트 파일
+        """
+        report_data = self._structure_report_data(analysis_result)
+        dump_json(report_data, fp, indent=True)
     
     def _structure_report_data(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -208,6 +221,7 @@ class JSONReportBuilder(BaseReportBuilder):
     
     def _structure_fonts_info(self, fonts: Dict[str, Any]) -> Dict[str, Any]:
         """폰트 정보 구조화"""
+        fonts = real_fonts(fonts)  # _not_checked 등 메타데이터 제외
         total_fonts = len(fonts)
         embedded_fonts = sum(1 for f in fonts.values() if f.get('embedded', False))
         
@@ -4,11 +4,11 @@
 가독성 높은 텍스트 보고서 생성
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, TextIO
 from pathlib import Path
 
 from config import Config
-from utils import format_datetime
+from utils import format_datetime, real_fonts
 from .base_builder import BaseReportBuilder
 from ..core.issue_analyzer import IssueAnalyzer
 
@@ -16,6 +16,8 @@ from ..core.issue_analyzer import IssueAnalyzer
 class TextReportBuilder(BaseReportBuilder):
     """텍스트 보고서 빌더"""
     
+    __slots__ = ('issue_analyzer',)
+    
     def __init__(self, config: Config):
         """텍스트 빌더 초기화"""
         super().__init__(config)
@@ -32,54 +34,84 @@ class TextReportBuilder(BaseReportBuilder):
         Returns:
             str: 텍스트 보고서 내용
         """
+        return "\n".join(
+            line
+            for section in self._iter_sections(analysis_result, prepared_data)
+            for line in section
+        )
+    
+    def build_to(self, analysis_result: Dict[str, Any], prepared_data: Dict[str, Any], fp: TextIO):
+        """
+        텍스트 보고서를 섹션마다 파일에 바로 기록 (build()와 같은 내용)
+        
+        Args:
+            analysis_result: PDF 분석 결과
+            prepared_data: 준비된 추가 데이터
+            fp: 쓰기 모드로 연 텍스트 파일
+        """
+        separator = ""
+        for section in self._iter_sections(analysis_result, prepared_data):
+            if section:
+                fp.write(separator)
+                fp.write("\n".join(section))
+                separator = "\n"
+    
+    def _iter_sections(self, analysis_result: Dict[str, Any], prepared_data: Dict[str, Any]) -> Iterator[List[str]]:
+        """
+        보고서 섹션을 순서대로 생성 (섹션마다 줄 목록)
+        
+        Args:
+            analysis_result: PDF 분석 결과
+            prepared_data: 준비된 추가 데이터
+            
+        Returns:
+            iterator: 섹션마다 줄 목록
+        """
         # 오류가 있는 경우
         if 'error' in analysis_result:
-            return f"분석 실패: {analysis_result['error']}"
-        
-        report = []
+            yield [f"분석 실패: {analysis_result['error']}"]
+            return
         
         # 헤더
-        report.extend(self._create_header(analysis_result, prepared_data))
+        yield self._create_header(analysis_result, prepared_data)
         
         # 자동 수정 정보
         if 'auto_fix_applied' in analysis_result:
-            report.extend(self._create_auto_fix_section(analysis_result))
+            yield self._create_auto_fix_section(analysis_result)
         
         # 주요 오류 요약
         if prepared_data.get('error_summary'):
-            report.extend(self._create_error_summary_section(prepared_data['error_summary']))
+            yield self._create_error_summary_section(prepared_data['error_summary'])
         
         # 프리플라이트 결과
         if analysis_result.get('preflight_result'):
-            report.extend(self._create_preflight_section(analysis_result['preflight_result']))
+            yield self._create_preflight_section(analysis_result['preflight_result'])
         
         # 기본 정보
-        report.extend(self._create_basic_info_section(analysis_result['basic_info']))
+        yield self._create_basic_info_section(analysis_result['basic_info'])
         
         # 수정 전후 비교
         if prepared_data.get('fix_comparison'):
-            report.extend(self._create_comparison_section(prepared_data['fix_comparison']))
+            yield self._create_comparison_section(prepared_data['fix_comparison'])
         
         # 문제점 상세
         if prepared_data.get('issue_groups'):
-            report.extend(self._create_issues_section(prepared_data['issue_groups']))
+            yield self._create_issues_section(prepared_data['issue_groups'])
         else:
-            report.extend([
+            yield [
                 "\n✅ 발견된 문제점이 없습니다!",
                 ""
-            ])
+            ]
         
         # 통계 정보
-        report.extend(self._create_statistics_section(analysis_result))
+        yield self._create_statistics_section(analysis_result)
         
         # 푸터
-        report.extend([
+        yield [
             "",
             "=" * 70,
             "보고서 끝"
-        ])
-        
-        return "\n".join(report)
+        ]
     
     def _create_header(self, analysis_result: Dict[str, Any], prepared_data: Dict[str, Any]) -> List[str]:
         """헤더 섹션 생성"""
@@ -310,7 +342,7 @@ class TextReportBuilder(BaseReportBuilder):
             section.append(f"    - {size_key}: {len(page_nums)}페이지")
         
         # 폰트 통계
-        fonts = analysis_result.get('fonts', {})
+        fonts = real_fonts(analysis_result.get('fonts', {}))
         not_embedded = sum(1 for f in fonts.values() if not f.get('embedded', False))
         section.append(f"\n  • 폰트: 총 {len(fonts)}개 (미임베딩 {not_embedded}개)")
         
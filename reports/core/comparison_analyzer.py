@@ -6,6 +6,8 @@ PDF 수정 전후 비교 분석 모듈
 
 from typing import Dict, List, Any, Optional
 
+from utils import real_fonts
+
 
 class ComparisonAnalyzer:
     """PDF 수정 전후 비교 분석 클래스"""
@@ -73,8 +75,8 @@ class ComparisonAnalyzer:
         Returns:
             dict: 변경사항 정보
         """
-        before_not_embedded = sum(1 for f in before_fonts.values() if not f.get('embedded', False))
-        after_not_embedded = sum(1 for f in after_fonts.values() if not f.get('embedded', False))
+        before_not_embedded = sum(1 for f in real_fonts(before_fonts).values() if not f.get('embedded', False))
+        after_not_embedded = sum(1 for f in real_fonts(after_fonts).values() if not f.get('embedded', False))
         
         if before_not_embedded > 0 and after_not_embedded == 0:
             return {
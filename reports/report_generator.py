@@ -192,7 +192,22 @@ class ReportGenerator:
         Returns:
             str: HTML 보고서 내용
         """
-        # 필요한 데이터 준비
+        # 필요한 데이터 준비 (썸네일 포함)
+        prepared_data = self._prepare_html_report_data(analysis_result)
+        
+        # HTML 빌더에 위임
+        return self.html_builder.build(analysis_result, prepared_data)
+    
+    def _prepare_html_report_data(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        HTML 보고서용 데이터 준비 (공통 데이터 + 썸네일)
+        
+        Args:
+            analysis_result: 분석 결과
+            
+        Returns:
+            dict: 준비된 데이터
+        """
         prepared_data = self._prepare_report_data(analysis_result)
         
         # 썸네일 생성
@@ -202,8 +217,7 @@ class ReportGenerator:
         else:
             prepared_data['thumbnail'] = {'data_url': '', 'page_shown': 0, 'total_pages': 0}
         
-        # HTML 빌더에 위임
-        return self.html_builder.build(analysis_result, prepared_data)
+        return prepared_data
     
     def save_text_report(self, analysis_result: Dict[str, Any], output_path: Optional[Path] = None) -> Path:
         """
@@ -216,8 +230,8 @@ class ReportGenerator:
         Returns:
             Path: 저장된 파일 경로
         """
-        # 보고서 내용 생성
-        report_content = self.generate_text_report(analysis_result)
+        # 필요한 데이터 준비
+        prepared_data = self._prepare_report_data(analysis_result)
         
         # 저장 경로 결정
         if output_path is None:
@@ -229,7 +243,7 @@ class ReportGenerator:
         # 파일로 저장
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report_content, encoding='utf-8')
+        self._write_report(self.text_builder, analysis_result, prepared_data, output_path)
         
         print(f"  ✓ 텍스트 보고서 저장: {output_path.name}")
         return output_path
@@ -245,8 +259,8 @@ class ReportGenerator:
         Returns:
             Path: 저장된 파일 경로
         """
-        # 보고서 내용 생성
-        report_content = self.generate_html_report(analysis_result)
+        # 필요한 데이터 준비 (썸네일 포함)
+        prepared_data = self._prepare_html_report_data(analysis_result)
         
         # 저장 경로 결정
         if output_path is None:
@@ -258,7 +272,7 @@ class ReportGenerator:
         # 파일로 저장
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report_content, encoding='utf-8')
+        self._write_report(self.html_builder, analysis_result, prepared_data, output_path)
         
         print(f"  ✓ HTML 보고서 저장: {output_path.name}")
         return output_path
@@ -283,12 +297,35 @@ class ReportGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # JSON 빌더 사용
-        json_content = self.json_builder.build(analysis_result)
-        output_path.write_text(json_content, encoding='utf-8')
+        # JSON 빌더로 파일에 바로 기록
+        self._write_report(self.json_builder, analysis_result, None, output_path)
         
         return output_path
     
+    def _write_report(self, builder, analysis_result: Dict[str, Any],
+                      prepared_data: Optional[Dict[str, Any]], output_path: Path):
+        """
+        빌더 출력을 임시 파일에 기록한 뒤 대상 경로로 교체
+        
+        빌더는 섹션마다 파일에 바로 쓰므로, 중간에 예외가 나면
+        잘리거나 빈 보고서가 남지 않도록 성공했을 때만 교체합니다.
+        
+        Args:
+            builder: build_to를 가진 보고서 빌더
+            analysis_result: 분석 결과
+            prepared_data: 준비된 추가 데이터
+            output_path: 최종 저장 경로
+        """
+        # 같은 이름의 .txt/.html이 동시에 저장돼도 겹치지 않게 확장자 뒤에 붙임
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fp:
+                builder.build_to(analysis_result, prepared_data, fp)
+            tmp_path.replace(output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _prepare_report_data(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         보고서 생성을 위한 데이터 준비
@@ -104,5 +104,9 @@ if __name__ == "__main__":
     # 현재 디렉토리를 작업 디렉토리로 설정
     os.chdir(Path(__file__).parent)
     
+    # 검사 모듈의 진행 메시지를 콘솔에 표시 (utils는 작업 디렉토리 설정 후 임포트)
+    from utils import setup_console_logging
+    setup_console_logging()
+    
     # 메인 실행
     main()
\ No newline at end of file
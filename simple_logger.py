@@ -41,6 +41,9 @@ class SimpleLogger:
         "CLEANUP": "Resource cleanup and finalization"
     }
     
+    # Level ordering for the emission guard (PDF_QC_LOG_LEVEL env var, default DEBUG = log everything)
+    LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+    
     def __init__(self):
         """Initialize AI-optimized logger"""
         # Session identifiers
@@ -48,6 +51,11 @@ class SimpleLogger:
         self.process_id = os.getpid()
         self.start_time = datetime.now(timezone.utc)
         
+        # Minimum level to emit - entries below it are dropped before formatting
+        self.min_level = self.LEVELS.get(
+            os.environ.get("PDF_QC_LOG_LEVEL", "DEBUG").upper(), self.LEVELS["DEBUG"]
+        )
+        
         # Log storage
         self.log_dir = Path("logs")
         self.log_dir.mkdir(exist_ok=True)
@@ -215,12 +223,25 @@ class SimpleLogger:
     
     # Public API - Maintained for compatibility
     
-    def log(self, message, file_path=None):
-        """General log (same as info) - for GUI compatibility"""
-        self.info(message, file_path)
+    def is_enabled(self, level: str) -> bool:
+        """Whether entries of the given level are emitted"""
+        return self.LEVELS[level] >= self.min_level
     
-    def info(self, message, file_path=None):
-        """Information log"""
+    def log(self, message, *args, file_path=None):
+        """General log (same as info) - for GUI compatibility"""
+        self.info(message, *args, file_path=file_path)
+    
+    def info(self, message, *args, file_path=None):
+        """
+        Information log
+        
+        %-style args are formatted only when the entry is emitted:
+        logger.info("자동 수정 시작: %s", pdf_path.name)
+        """
+        if self.LEVELS["INFO"] < self.min_level:
+            return
+        if args:
+            message = message % args
         self._log_entry({
             "level": "INFO",
             "category": self._infer_category(message),
@@ -285,8 +306,12 @@ class SimpleLogger:
             "context": self._extract_context(message, file_path)
         })
     
-    def debug(self, message, file_path=None):
-        """Debug log with detailed context"""
+    def debug(self, message, *args, file_path=None):
+        """Debug log with detailed context (%-style args formatted lazily)"""
+        if self.LEVELS["DEBUG"] < self.min_level:
+            return
+        if args:
+            message = message % args
         self._log_entry({
             "level": "DEBUG",
             "category": self._infer_category(message),
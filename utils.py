@@ -8,6 +8,38 @@ utils.py - 유틸리티 함수 모음
 import numpy as np
 from datetime import datetime
 from pathlib import Path
+import dataclasses
+import json
+import logging
+import sys
+import time
+
+# orjson이 있으면 C 구현 직렬화를 사용 (없으면 표준 json으로 폴백)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# setup_console_logging이 붙인 핸들러 (여러 진입점에서 호출해도 한 번만 붙임)
+_console_handler = None
+
+def setup_console_logging():
+    """
+    logging을 쓰는 검사 모듈의 진행 메시지를 콘솔에 출력
+    
+    main.py, GUI 실행기, 배치 처리기 등 프로그램 진입점에서 호출합니다.
+    호출하지 않아도 WARNING 이상은 logging 기본 처리로 stderr에 나옵니다.
+    """
+    global _console_handler
+    if _console_handler is not None or sys.stdout is None:
+        return  # 이미 설정됨 / 콘솔 없는 실행 (pythonw)
+    
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger = logging.getLogger('print_quality_checker')
+    logger.addHandler(_console_handler)
+    logger.setLevel(logging.INFO)
 
 def points_to_mm(points):
     """
@@ -147,6 +179,37 @@ def is_font_embedded(font_obj):
     
     return False
 
+def real_fonts(fonts):
+    """
+    분석 결과의 폰트 dict에서 실제 폰트 항목만 추려서 반환
+    
+    폰트 검사를 못 한 경우 '_not_checked': True, '_message': '...' 같은
+    메타데이터가 같은 dict에 들어 있으므로 '_'로 시작하는 키는 제외합니다.
+    
+    Args:
+        fonts: analysis_result['fonts']
+        
+    Returns:
+        dict: {폰트 키: 폰트 정보}
+    """
+    return {k: v for k, v in fonts.items() if k[:1] != '_'}
+
+def count_unembedded_fonts(analysis_result):
+    """
+    분석 결과의 미임베딩 폰트 수
+    
+    PDFFixer와 프리플라이트 규칙이 같은 방식으로 세도록 한 곳에 둡니다.
+    폰트 수만큼 한 번 훑는 계산이라 캐시하지 않고 매번 셉니다.
+    
+    Args:
+        analysis_result: PDFAnalyzer 분석 결과
+        
+    Returns:
+        int: 미임베딩 폰트 수
+    """
+    entries = real_fonts(analysis_result.get('fonts') or {}).values()
+    return len(entries) - sum(bool(f.get('embedded', False)) for f in entries)
+
 def format_file_size(size_bytes):
     """
     파일 크기를 읽기 쉬운 형식으로 변환
@@ -275,4 +338,90 @@ def calculate_ink_coverage_stats(coverage_map):
         'over_280': float(np.sum(coverage_map > 280) / coverage_map.size * 100),
         'over_300': float(np.sum(coverage_map > 300) / coverage_map.size * 100),
         'over_320': float(np.sum(coverage_map > 320) / coverage_map.size * 100)
-    }
\ No newline at end of file
+    }
+
+def _json_default(obj):
+    """
+    기본 JSON 인코더가 처리하지 못하는 객체 변환
+    (set → list, dataclass 레코드 → dict, numpy 값/배열 → 파이썬 기본 타입)
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(obj).__name__}")
+
+def dumps_json(obj, indent=False):
+    """
+    분석 결과/이슈 목록을 JSON 문자열로 직렬화
+    
+    orjson이 설치되어 있으면 C 구현 직렬화를 사용하고,
+    없으면 표준 json 모듈로 같은 내용을 만듭니다.
+    
+    Args:
+        obj: 직렬화할 객체
+        indent: True면 2칸 들여쓰기
+        
+    Returns:
+        str: JSON 문자열 (한글 등 UTF-8 문자 그대로 유지)
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option).decode('utf-8')
+    
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None,
+                      default=_json_default)
+
+
+def dump_json(obj, fp, indent=False):
+    """
+    JSON을 열린 텍스트 파일에 바로 기록 (dumps_json과 같은 내용)
+    
+    표준 json 모듈로 폴백할 때는 조각 단위로 기록하므로
+    전체 JSON 문자열을 메모리에 따로 만들지 않습니다.
+    
+    Args:
+        obj: 직렬화할 객체
+        fp: 쓰기 모드로 연 텍스트 파일 (UTF-8)
+        indent: True면 2칸 들여쓰기
+    """
+    if HAS_ORJSON:
+        fp.write(dumps_json(obj, indent))
+        return
+    
+    json.dump(obj, fp, ensure_ascii=False, indent=2 if indent else None,
+              default=_json_default)
+
+
+def loads_json(data):
+    """
+    JSON 문자열/바이트 파싱 (orjson이 있으면 사용)
+    
+    Args:
+        data: JSON 문자열 또는 UTF-8 바이트
+        
+    Returns:
+        파싱된 객체
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def unique_timestamp():
+    """
+    파일명용 타임스탬프 (YYYYmmdd_HHMMSS_나노초)
+    
+    초 단위 문자열 뒤에 나노초를 붙여 같은 초에 여러 파일을 만들어도
+    이름이 겹치지 않습니다.
+    
+    Returns:
+        str: 예) "20250620_142530_123456789"
+    """
+    t = time.time_ns()
+    seconds, nanos = divmod(t, 1_000_000_000)
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds)) + f"_{nanos:09d}"